@@ -1,5 +1,6 @@
 import os
 import pandas as pd
+from src.data.columnar_store import ColumnarStore
 
 
 def get_imdb_ids_from_emotions_folder(folder_path):
@@ -8,22 +9,27 @@ def get_imdb_ids_from_emotions_folder(folder_path):
     DataFrame.
 
     Parameters:
-        folder_path (str): Path to the folder containing emotion
-        analysis files.
+        folder_path (str | ColumnarStore): Path to the folder containing
+        emotion analysis files, or an emotion ColumnarStore.
 
     Returns:
         pd.DataFrame: A DataFrame with IMDb IDs.
     """
     try:
-        # List all CSV files in the folder
-        files = [
-            f for f in os.listdir(folder_path)
-            if f.startswith("emotions_tt") and f.endswith(".csv")
-        ]
-
-        # Extract IMDb IDs from filenames
-        # (e.g., 'emotions_tt0003419.csv' -> 'tt0003419')
-        imdb_ids = [os.path.splitext(file)[0].split("_")[1] for file in files]
+        if isinstance(folder_path, ColumnarStore):
+            imdb_ids = folder_path.imdb_ids()
+        else:
+            # List all CSV files in the folder
+            files = [
+                f for f in os.listdir(folder_path)
+                if f.startswith("emotions_tt") and f.endswith(".csv")
+            ]
+
+            # Extract IMDb IDs from filenames
+            # (e.g., 'emotions_tt0003419.csv' -> 'tt0003419')
+            imdb_ids = [
+                os.path.splitext(file)[0].split("_")[1] for file in files
+            ]
 
         # Create a DataFrame
         df = pd.DataFrame(imdb_ids, columns=["IMDb_ID"])
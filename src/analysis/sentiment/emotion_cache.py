@@ -0,0 +1,185 @@
+"""
+This module defines the EmotionCache class, an on-disk SQLite cache of
+emotion predictions keyed by model, max_length and review text hash.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import numpy as np
+
+# SQLite limits the number of parameters in a single statement
+_QUERY_CHUNK = 500
+
+
+class EmotionCache:
+    """A size-capped, least-recently-used cache of emotion predictions."""
+
+    def __init__(self, cache_path, max_entries=1_000_000):
+        """
+        Open (or create) the cache database.
+
+        Parameters:
+            cache_path (str): Path of the SQLite database file.
+            max_entries (int): Maximum number of cached predictions. The
+                               least recently used entries are evicted
+                               once the cap is exceeded.
+        """
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # WAL lets several worker processes read while one writes
+        self.connection = sqlite3.connect(cache_path, timeout=60)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS emotions ("
+            " model TEXT NOT NULL,"
+            " max_length INTEGER NOT NULL,"
+            " text_hash TEXT NOT NULL,"
+            " label TEXT NOT NULL,"
+            " score REAL NOT NULL,"
+            " last_used INTEGER NOT NULL,"
+            " probs BLOB,"
+            " PRIMARY KEY (model, max_length, text_hash))"
+        )
+        columns = {
+            row[1] for row in
+            self.connection.execute("PRAGMA table_info(emotions)")
+        }
+        if "probs" not in columns:
+            # Caches created before full distributions were stored
+            self.connection.execute(
+                "ALTER TABLE emotions ADD COLUMN probs BLOB"
+            )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS emotions_last_used "
+            "ON emotions (last_used)"
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def hash_text(review):
+        """Return the SHA-1 hex digest of a review's text."""
+        return hashlib.sha1(str(review).encode("utf-8")).hexdigest()
+
+    def get_many(self, model, max_length, reviews, with_probs=False):
+        """
+        Look up cached predictions for a list of reviews.
+
+        Parameters:
+            model (str): Emotion model name.
+            max_length (int): Token limit used for the predictions.
+            reviews (list[str]): Reviews to look up.
+            with_probs (bool): Also return the full probability vector.
+                               Entries cached without one count as misses.
+
+        Returns:
+            list[dict]: A {'label', 'score'} dict per review (plus 'probs'
+            if requested), or None for reviews that are not cached.
+        """
+        hashes = [self.hash_text(review) for review in reviews]
+        found = {}
+        for start in range(0, len(hashes), _QUERY_CHUNK):
+            chunk = list(set(hashes[start:start + _QUERY_CHUNK]))
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.connection.execute(
+                "SELECT text_hash, label, score, probs FROM emotions "
+                "WHERE model = ? AND max_length = ? "
+                f"AND text_hash IN ({placeholders})",
+                [model, max_length, *chunk]
+            )
+            for text_hash, label, score, probs in rows:
+                if not with_probs:
+                    found[text_hash] = {"label": label, "score": score}
+                elif probs is not None:
+                    found[text_hash] = {
+                        "label": label,
+                        "score": score,
+                        "probs": np.frombuffer(probs, dtype=np.float32)
+                    }
+
+        if found:
+            now = time.time_ns()
+            self.connection.executemany(
+                "UPDATE emotions SET last_used = ? "
+                "WHERE model = ? AND max_length = ? AND text_hash = ?",
+                [(now, model, max_length, text_hash) for text_hash in found]
+            )
+            self.connection.commit()
+
+        results = [found.get(text_hash) for text_hash in hashes]
+        hits = sum(result is not None for result in results)
+        self.hits += hits
+        self.misses += len(results) - hits
+        return results
+
+    def put_many(self, model, max_length, reviews, predictions):
+        """
+        Store predictions for a list of reviews and evict old entries if
+        the cache is over its size cap.
+
+        Parameters:
+            model (str): Emotion model name.
+            max_length (int): Token limit used for the predictions.
+            reviews (list[str]): Reviews that were classified.
+            predictions (list[dict]): {'label', 'score'} dict per review,
+                                      optionally with a 'probs' vector.
+        """
+        now = time.time_ns()
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO emotions "
+            "(model, max_length, text_hash, label, score, last_used, probs) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (model, max_length, self.hash_text(review),
+                 prediction["label"], float(prediction["score"]), now,
+                 np.asarray(prediction["probs"], dtype=np.float32).tobytes()
+                 if prediction.get("probs") is not None else None)
+                for review, prediction in zip(reviews, predictions)
+            ]
+        )
+        self.connection.commit()
+        self._evict()
+
+    def _evict(self):
+        """Delete the least recently used entries above max_entries."""
+        (count,) = self.connection.execute(
+            "SELECT COUNT(*) FROM emotions"
+        ).fetchone()
+        if count <= self.max_entries:
+            return
+        # Evict down to 90% of the cap so eviction is not run on every put
+        excess = count - int(self.max_entries * 0.9)
+        self.connection.execute(
+            "DELETE FROM emotions WHERE rowid IN ("
+            " SELECT rowid FROM emotions ORDER BY last_used LIMIT ?)",
+            (excess,)
+        )
+        self.connection.commit()
+        logging.info(f"Evicted {excess} entries from the emotion cache.")
+
+    def stats(self):
+        """
+        Return the hit/miss statistics of this cache instance.
+
+        Returns:
+            dict: hits, misses and hit_rate.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
@@ -1,5 +1,6 @@
 import os
 import logging
+import numpy as np
 import pandas as pd
 import torch
 from transformers import (
@@ -7,6 +8,8 @@ from transformers import (
     AutoModelForSequenceClassification,
     pipeline
 )
+from src.analysis.sentiment.emotion_cache import EmotionCache
+from src.data.columnar_store import ColumnarStore
 
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
@@ -14,27 +17,62 @@ os.environ["TOKENIZERS_PARALLELISM"] = "false"
 class SentimentAnalyzer:
     def __init__(self,
                  emotion_model="j-hartmann/emotion-english-distilroberta-base",
-                 device=0):
+                 device=0,
+                 batch_size=None,
+                 max_length=512,
+                 cache_path=None,
+                 cache_max_entries=1_000_000,
+                 full_distribution=False):
         """
         Initializes the sentiment analyzer with a specified emotion model.
+
+        Parameters:
+            emotion_model (str): Hugging Face model used for classification.
+            device (int): CUDA device index; falls back to CPU if CUDA is
+                          not available.
+            batch_size (int): Default number of reviews per forward pass.
+                              None classifies one review at a time.
+            max_length (int): Maximum number of tokens per review.
+            cache_path (str): Optional SQLite file caching predictions by
+                              model, max_length and review text hash.
+            cache_max_entries (int): Size cap of the prediction cache.
+            full_distribution (bool): Also save the probability of every
+                                      emotion for each review to an
+                                      emotion_probs_<imdb_id>.npz file.
         """
         logging.info("Loading emotion detection model...")
+        self.emotion_model = emotion_model
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.full_distribution = full_distribution
+        self.cache = (
+            EmotionCache(cache_path, max_entries=cache_max_entries)
+            if cache_path else None
+        )
         tokenizer = AutoTokenizer.from_pretrained(emotion_model)
+        self.tokenizer = tokenizer
         model = AutoModelForSequenceClassification.from_pretrained(
             emotion_model
         )
+        # Emotion labels in the order of the model's output logits
+        self.labels = [
+            label for _, label in sorted(model.config.id2label.items())
+        ]
+        self._label_index = {
+            label: index for index, label in enumerate(self.labels)
+        }
         self.emotion_classifier = pipeline(
             "text-classification",
             model=model,
             tokenizer=tokenizer,
             padding=True,
             truncation=True,
-            max_length=512,
+            max_length=max_length,
             device=device if torch.cuda.is_available() else -1
         )
         logging.info("Emotion detection model loaded successfully.")
 
-    def analyze_file(self, file_path, output_folder):
+    def analyze_file(self, file_path, output_folder, batch_size=None):
         """
         Analyze sentiments for a single file of reviews.
 
@@ -42,7 +80,11 @@ class SentimentAnalyzer:
             file_path (str): Path to the file containing reviews.
             output_folder (str): Path to the folder where results will be
                                   saved.
-                                  
+            batch_size (int): Number of reviews per forward pass. Reviews
+                              are grouped by token length to reduce padding
+                              and written back in their original order.
+                              Defaults to the analyzer's batch_size.
+
         Raises:
             FileNotFoundError: If the input file doesn't exist.
             Exception: For other errors during processing.
@@ -56,28 +98,30 @@ class SentimentAnalyzer:
             logging.info(f"Processing file: {file_path} (IMDb ID: {imdb_id})")
 
             # Perform sentiment analysis
-            results = []
-            for review in df['Review']:
-                try:
-                    emotion = self.emotion_classifier(review)
-                    predicted_emotion = emotion[0]['label']
-                    score = emotion[0]['score']
-                    results.append({
-                        "Review": review,
-                        "Emotion": predicted_emotion,
-                        "Score": score
-                    })
-                except Exception as e:
-                    logging.warning(
-                        f"Error analyzing review: {review[:50]}... Error: {e}"
-                    )
-                    raise
+            reviews = df['Review'].tolist()
+            predictions = self._predict(reviews, batch_size or self.batch_size)
+
+            results = [
+                {
+                    "Review": review,
+                    "Emotion": prediction['label'],
+                    "Score": prediction['score']
+                }
+                for review, prediction in zip(reviews, predictions)
+            ]
 
             # Save results
-            output_file = f"emotions_{imdb_id}.csv"
-            output_path = os.path.join(output_folder, output_file)
+            output_path = self.output_path_for(file_path, output_folder)
             os.makedirs(output_folder, exist_ok=True)
-            pd.DataFrame(results).to_csv(output_path, index=False)
+            # Write to a temporary file first so concurrent readers never
+            # see a partially written CSV
+            tmp_path = f"{output_path}.{os.getpid()}.tmp"
+            pd.DataFrame(results).to_csv(tmp_path, index=False)
+            os.replace(tmp_path, output_path)
+            if self.full_distribution:
+                self._save_distribution(
+                    predictions, self.distribution_path_for(output_path)
+                )
             logging.info(f"Sentiment analysis results saved to {output_path}")
             return output_path
         except FileNotFoundError as e:
@@ -87,43 +131,420 @@ class SentimentAnalyzer:
             logging.error(f"Error processing file {file_path}: {e}")
             raise
 
-    def aggregate_results(self, input_folder):
+    def analyze_store(self, review_store, emotion_store, batch_size=None,
+                      skip_existing=True, movies_per_read=256):
+        """
+        Analyze the reviews of a review ColumnarStore into an emotion store.
+
+        Movies are read from the store a group at a time, every row of a
+        movie in the same read, so memory stays bounded regardless of the
+        number of movies and each movie is scored and appended whole. A
+        movie is therefore only in emotion_store once all its rows are.
+
+        Parameters:
+            review_store (ColumnarStore): Store with imdb_id and Review.
+            emotion_store (ColumnarStore): Store receiving imdb_id, Review,
+                                           Emotion and Score rows.
+            batch_size (int): Reviews per forward pass.
+            skip_existing (bool): Skip movies already in emotion_store.
+            movies_per_read (int): Movies loaded from review_store at once.
+
+        Returns:
+            int: Number of movies analyzed.
+        """
+        done = set(emotion_store.imdb_ids()) if skip_existing else set()
+        pending = [
+            imdb_id for imdb_id in review_store.imdb_ids()
+            if imdb_id not in done
+        ]
+        analyzed = 0
+        for start in range(0, len(pending), movies_per_read):
+            group = pending[start:start + movies_per_read]
+            reviews_df = review_store.read(
+                columns=["imdb_id", "Review"], imdb_ids=group
+            )
+            for imdb_id, movie_reviews in reviews_df.groupby(
+                "imdb_id", sort=False
+            ):
+                reviews = movie_reviews["Review"].tolist()
+                predictions = self._predict(
+                    reviews, batch_size or self.batch_size
+                )
+                emotion_store.append(imdb_id, pd.DataFrame({
+                    "Review": reviews,
+                    "Emotion": [p["label"] for p in predictions],
+                    "Score": [p["score"] for p in predictions]
+                }))
+                analyzed += 1
+        emotion_store.flush()
+        logging.info(
+            f"Analyzed {analyzed} movies from {review_store.root} into "
+            f"{emotion_store.root}"
+        )
+        return analyzed
+
+    @staticmethod
+    def output_path_for(file_path, output_folder):
+        """
+        Return the emotion file path produced for a review file, e.g.
+        reviews_tt0000001.csv -> <output_folder>/emotions_tt0000001.csv.
+        """
+        imdb_id = os.path.basename(file_path).split("_")[1].split(".")[0]
+        return os.path.join(output_folder, f"emotions_{imdb_id}.csv")
+
+    @staticmethod
+    def distribution_path_for(output_path):
+        """
+        Return the probability file stored next to an emotion file, e.g.
+        emotions_tt0000001.csv -> emotion_probs_tt0000001.npz.
+        """
+        folder, file_name = os.path.split(output_path)
+        imdb_id = file_name.split("_")[1].split(".")[0]
+        return os.path.join(folder, f"emotion_probs_{imdb_id}.npz")
+
+    def _save_distribution(self, predictions, path):
+        """
+        Save the per-review probabilities as a float32 (reviews x emotions)
+        array together with the label order.
+        """
+        probs = np.array(
+            [prediction["probs"] for prediction in predictions],
+            dtype=np.float32
+        ).reshape(len(predictions), len(self.labels))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            np.savez(file, probs=probs, labels=np.array(self.labels))
+        os.replace(tmp_path, path)
+        logging.info(f"Emotion distribution saved to {path}")
+
+    def _to_prediction(self, scores):
+        """
+        Convert the all-labels pipeline output for one review into its top
+        prediction plus the probability vector in label order.
+        """
+        probs = np.zeros(len(self.labels), dtype=np.float32)
+        for item in scores:
+            probs[self._label_index[item["label"]]] = item["score"]
+        top = max(scores, key=lambda item: item["score"])
+        return {"label": top["label"], "score": top["score"], "probs": probs}
+
+    def _predict(self, reviews, batch_size):
+        """
+        Return the top prediction for each review, consulting the cache
+        first when one is configured.
+        """
+        if self.cache is None:
+            return self._run_model(reviews, batch_size)
+
+        predictions = self.cache.get_many(
+            self.emotion_model, self.max_length, reviews,
+            with_probs=self.full_distribution
+        )
+        # Classify each distinct uncached text only once
+        missing = list(dict.fromkeys(
+            review for review, prediction in zip(reviews, predictions)
+            if prediction is None
+        ))
+        logging.info(
+            f"Emotion cache: {len(reviews) - predictions.count(None)} hits, "
+            f"{predictions.count(None)} misses."
+        )
+        if missing:
+            computed = self._run_model(missing, batch_size)
+            self.cache.put_many(
+                self.emotion_model, self.max_length, missing, computed
+            )
+            by_review = dict(zip(missing, computed))
+            predictions = [
+                prediction if prediction is not None else by_review[review]
+                for review, prediction in zip(reviews, predictions)
+            ]
+        return predictions
+
+    def _run_model(self, reviews, batch_size):
+        """Run the emotion model on reviews, batched if batch_size is set."""
+        if batch_size:
+            return self._classify_batched(reviews, batch_size)
+        return [self._classify(review) for review in reviews]
+
+    def _classify(self, review):
+        """
+        Classify a single review and return its top emotion prediction.
+        """
+        try:
+            if self.full_distribution:
+                return self._to_prediction(
+                    self.emotion_classifier(review, top_k=None)
+                )
+            return self.emotion_classifier(review)[0]
+        except Exception as e:
+            logging.warning(
+                f"Error analyzing review: {review[:50]}... Error: {e}"
+            )
+            raise
+
+    def _classify_batched(self, reviews, batch_size):
+        """
+        Classify reviews in batches of similar token length.
+
+        Reviews are sorted by tokenized length so each batch is padded to
+        a similar size, then predictions are put back in input order.
+
+        Parameters:
+            reviews (list[str]): Reviews to classify.
+            batch_size (int): Number of reviews per forward pass.
+
+        Returns:
+            list[dict]: Top prediction for each review, in input order.
+        """
+        lengths = [
+            len(ids) for ids in self.tokenizer(
+                reviews, truncation=True, max_length=self.max_length
+            )["input_ids"]
+        ]
+        order = np.argsort(lengths, kind="stable")
+        predictions = [None] * len(reviews)
+        # top_k=None returns the score of every label
+        extra_args = {"top_k": None} if self.full_distribution else {}
+
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            try:
+                outputs = self.emotion_classifier(
+                    [reviews[i] for i in batch], batch_size=len(batch),
+                    **extra_args
+                )
+            except Exception as e:
+                logging.warning(
+                    f"Error analyzing batch of {len(batch)} reviews "
+                    f"starting with: {reviews[batch[0]][:50]}... Error: {e}"
+                )
+                raise
+            for index, output in zip(batch, outputs):
+                predictions[index] = (
+                    self._to_prediction(output) if self.full_distribution
+                    else output
+                )
+
+        logging.info(
+            f"Classified {len(reviews)} reviews in batches of {batch_size}."
+        )
+        return predictions
+
+    @staticmethod
+    def aggregate_results(input_folder, cache_file=None, columns=None,
+                          imdb_ids=None):
         """
         Combine all emotion analysis files into a single DataFrame.
 
         Parameters:
-            input_folder (str): Path to the folder containing emotion
-                                analysis files.
+            input_folder (str | ColumnarStore): Path to the folder
+                                containing emotion analysis files, or an
+                                emotion ColumnarStore.
+            cache_file (str): Optional pickle holding the previous combined
+                              DataFrame. When given, only emotion files
+                              that are new or changed since the last call
+                              are read again, and rows of removed files
+                              are dropped. A cache built for other
+                              columns is rebuilt.
+            columns (list[str]): Emotion columns to load, e.g.
+                                 ["Emotion", "Score"] for ranking.
+                                 Defaults to all columns.
+            imdb_ids (list[str]): Only load these movies (ColumnarStore
+                                  only; the filter is pushed down to the
+                                  Parquet files).
 
         Returns:
             pd.DataFrame: Combined DataFrame of all movies.
                          Returns empty DataFrame if no files found.
         """
+        if isinstance(input_folder, ColumnarStore):
+            combined_df = input_folder.read(
+                columns=["imdb_id", *columns] if columns else None,
+                imdb_ids=imdb_ids
+            ).rename(columns={"imdb_id": "imbd_id"})
+            logging.info(
+                f"Aggregated data contains {len(combined_df)} reviews."
+            )
+            return combined_df
+
+        cache_key = list(columns) if columns else None
+        cached_data, file_stats, to_read, stale_ids = (
+            SentimentAnalyzer._scan_emotion_files(
+                input_folder, cache_file, cache_key
+            )
+        )
+
         aggregated_data = []
-        for file_name in os.listdir(input_folder):
-            if file_name.endswith(".csv"):
-                file_path = os.path.join(input_folder, file_name)
-                logging.info(f"Aggregating data from: {file_path}")
-                movie_data = pd.read_csv(file_path)
-                imdb_id = file_name.split("_")[1].split(".")[0]
-                movie_data["imbd_id"] = imdb_id
-                aggregated_data.append(movie_data)
-
-        if not aggregated_data:
+        if cached_data is not None:
+            aggregated_data.append(
+                cached_data[~cached_data["imbd_id"].isin(stale_ids)]
+            )
+            logging.info(
+                f"Reusing cached rows; re-reading {len(to_read)} of "
+                f"{len(file_stats)} emotion files."
+            )
+
+        for file_name in to_read:
+            file_path = os.path.join(input_folder, file_name)
+            logging.info(f"Aggregating data from: {file_path}")
+            movie_data = pd.read_csv(file_path, usecols=columns)
+            imdb_id = file_name.split("_")[1].split(".")[0]
+            movie_data["imbd_id"] = imdb_id
+            aggregated_data.append(movie_data)
+
+        if not file_stats:
             logging.warning(f"No CSV files found in {input_folder}")
             return pd.DataFrame()
 
         combined_df = pd.concat(aggregated_data, ignore_index=True)
+        if cache_file:
+            pd.to_pickle(
+                {"data": combined_df, "files": file_stats,
+                 "key": cache_key},
+                cache_file
+            )
         logging.info(f"Aggregated data contains {len(combined_df)} reviews.")
         return combined_df
 
-    def rank_movies(self, combined_df, emotion_label="fear"):
+    @staticmethod
+    def _scan_emotion_files(input_folder, cache_file, cache_key=None):
+        """
+        Compare the emotion CSVs in a folder with an aggregation cache. A
+        cache saved with a different cache_key (e.g., other columns) is
+        ignored, so every file is read again.
+
+        Returns:
+            tuple: The cached data (or None), the (size, mtime) of every
+            current file, the files that must be read again and the IMDb
+            IDs whose cached rows are stale.
+        """
+        file_stats = {}
+        for file_name in os.listdir(input_folder):
+            if file_name.endswith(".csv"):
+                stat = os.stat(os.path.join(input_folder, file_name))
+                file_stats[file_name] = (stat.st_size, stat.st_mtime_ns)
+
+        cached_data = None
+        cached_stats = {}
+        if cache_file and os.path.exists(cache_file):
+            cache = pd.read_pickle(cache_file)
+            if cache.get("key") == cache_key:
+                cached_data, cached_stats = cache["data"], cache["files"]
+            else:
+                logging.info(
+                    f"Aggregation cache {cache_file} was built for other "
+                    f"settings; rebuilding it."
+                )
+
+        to_read = [
+            file_name for file_name, stat in file_stats.items()
+            if cached_stats.get(file_name) != stat
+        ]
+        unchanged = set(file_stats) - set(to_read)
+        stale_ids = {
+            file_name.split("_")[1].split(".")[0]
+            for file_name in set(cached_stats) - unchanged
+        }
+        return cached_data, file_stats, to_read, stale_ids
+
+    @staticmethod
+    def _emotion_statistics(data, keys):
+        """Count, sum and sum of squares of Score per group of keys."""
+        return (
+            data.assign(SumSq=data["Score"] ** 2)
+            .groupby(keys, sort=False)
+            .agg(
+                Count=("Score", "count"),
+                Sum=("Score", "sum"),
+                SumSq=("SumSq", "sum")
+            )
+            .reset_index()
+        )
+
+    @staticmethod
+    def aggregate_statistics(input_folder, cache_file=None):
+        """
+        Fold every emotion file into per-movie running statistics.
+
+        Each file is read, reduced to count, sum and sum of squares of the
+        Score per emotion and discarded, so memory grows with the number
+        of movies rather than the number of reviews. rank_movies accepts
+        the result directly and produces the same ranking as it does for
+        aggregate_results.
+
+        Parameters:
+            input_folder (str | ColumnarStore): Path to the folder
+                                containing emotion analysis files, or an
+                                emotion ColumnarStore.
+            cache_file (str): Optional pickle of the previous statistics.
+                              Only new or changed files are read again.
+
+        Returns:
+            pd.DataFrame: imbd_id, Emotion, Count, Sum and SumSq columns.
+                         Returns empty DataFrame if no files found.
+        """
+        keys = ["imbd_id", "Emotion"]
+        if isinstance(input_folder, ColumnarStore):
+            partial_stats = [
+                SentimentAnalyzer._emotion_statistics(
+                    batch.rename(columns={"imdb_id": "imbd_id"}), keys
+                )
+                for batch in input_folder.iter_batches(
+                    columns=["imdb_id", "Emotion", "Score"]
+                )
+            ]
+            if not partial_stats:
+                return pd.DataFrame()
+            # Movies split across batches are summed back together
+            return (
+                pd.concat(partial_stats, ignore_index=True)
+                .groupby(keys, sort=False)[["Count", "Sum", "SumSq"]]
+                .sum()
+                .reset_index()
+            )
+
+        cached_stats, file_stats, to_read, stale_ids = (
+            SentimentAnalyzer._scan_emotion_files(input_folder, cache_file)
+        )
+        if not file_stats:
+            logging.warning(f"No CSV files found in {input_folder}")
+            return pd.DataFrame()
+
+        movie_stats = []
+        if cached_stats is not None:
+            movie_stats.append(
+                cached_stats[~cached_stats["imbd_id"].isin(stale_ids)]
+            )
+        for file_name in to_read:
+            file_path = os.path.join(input_folder, file_name)
+            logging.info(f"Aggregating statistics from: {file_path}")
+            movie_data = pd.read_csv(file_path, usecols=["Emotion", "Score"])
+            movie_data.insert(
+                0, "imbd_id", file_name.split("_")[1].split(".")[0]
+            )
+            movie_stats.append(
+                SentimentAnalyzer._emotion_statistics(movie_data, keys)
+            )
+
+        stats_df = pd.concat(movie_stats, ignore_index=True)
+        if cache_file:
+            pd.to_pickle({"data": stats_df, "files": file_stats}, cache_file)
+        logging.info(
+            f"Aggregated statistics of {stats_df['imbd_id'].nunique()} "
+            f"movies from {len(file_stats)} files."
+        )
+        return stats_df
+
+    @staticmethod
+    def rank_movies(combined_df, emotion_label="fear"):
         """
         Rank movies by the average score of a specific emotion.
 
         Parameters:
             combined_df (pd.DataFrame): DataFrame containing all reviews
-                                         and emotions.
+                                         and emotions, or the per-movie
+                                         output of aggregate_statistics.
             emotion_label (str): The emotion label to use for ranking
                                   (e.g., "fear").
 
@@ -132,6 +553,17 @@ class SentimentAnalyzer:
         """
         logging.info(f"Ranking movies by emotion: {emotion_label}")
         filtered_df = combined_df[combined_df["Emotion"] == emotion_label]
+        if "Count" in combined_df.columns:
+            scores = filtered_df.groupby("imbd_id")[["Count", "Sum"]].sum()
+            scores = (
+                (scores["Sum"] / scores["Count"])
+                .sort_values(ascending=False)
+                .rename("Average_Score")
+                .reset_index()
+            )
+            logging.info("Ranking complete.")
+            return scores
+
         scores = (
             filtered_df.groupby("imbd_id")["Score"]
             .mean()
@@ -142,6 +574,90 @@ class SentimentAnalyzer:
         logging.info("Ranking complete.")
         return scores
 
+    @staticmethod
+    def load_distribution(file_path):
+        """
+        Load a probability file written with full_distribution enabled.
+
+        Returns:
+            tuple[np.ndarray, list[str]]: The float32 (reviews x emotions)
+            array and the emotion label of each column.
+        """
+        with np.load(file_path) as data:
+            return data["probs"], [str(label) for label in data["labels"]]
+
+    @staticmethod
+    def aggregate_distributions(input_folder):
+        """
+        Average the full emotion distribution of every movie.
+
+        Parameters:
+            input_folder (str): Folder containing emotion_probs_*.npz files.
+
+        Returns:
+            pd.DataFrame: One row per movie with imbd_id, Review_Count and
+                          the mean probability of each emotion.
+                          Returns empty DataFrame if no files found.
+        """
+        imdb_ids, counts, means = [], [], []
+        labels = None
+        for file_name in sorted(os.listdir(input_folder)):
+            if not (file_name.startswith("emotion_probs_")
+                    and file_name.endswith(".npz")):
+                continue
+            probs, file_labels = SentimentAnalyzer.load_distribution(
+                os.path.join(input_folder, file_name)
+            )
+            if labels is None:
+                labels = file_labels
+            elif file_labels != labels:
+                raise ValueError(
+                    f"Emotion labels in {file_name} do not match {labels}"
+                )
+            if len(probs) == 0:
+                continue
+            imdb_ids.append(file_name.split("_")[2].split(".")[0])
+            counts.append(len(probs))
+            means.append(probs.mean(axis=0, dtype=np.float64))
+
+        if not means:
+            logging.warning(f"No distribution files found in {input_folder}")
+            return pd.DataFrame()
+
+        distribution_df = pd.DataFrame(np.vstack(means), columns=labels)
+        distribution_df.insert(0, "imbd_id", imdb_ids)
+        distribution_df.insert(1, "Review_Count", counts)
+        logging.info(
+            f"Aggregated emotion distributions of {len(imdb_ids)} movies."
+        )
+        return distribution_df
+
+    @staticmethod
+    def rank_movies_by_distribution(distribution_df, emotion_label="fear"):
+        """
+        Rank movies by the mean probability of an emotion over all their
+        reviews, not only the reviews where it was the top emotion.
+
+        Parameters:
+            distribution_df (pd.DataFrame): Output of
+                                            aggregate_distributions.
+            emotion_label (str): The emotion to rank by (e.g., "fear").
+
+        Returns:
+            pd.DataFrame: DataFrame with IMDb IDs and their average scores.
+        """
+        logging.info(
+            f"Ranking movies by emotion distribution: {emotion_label}"
+        )
+        if distribution_df.empty:
+            return pd.DataFrame(columns=["imbd_id", "Average_Score"])
+        return (
+            distribution_df[["imbd_id", emotion_label]]
+            .rename(columns={emotion_label: "Average_Score"})
+            .sort_values("Average_Score", ascending=False)
+            .reset_index(drop=True)
+        )
+
 
 # Main Execution
 if __name__ == "__main__":
@@ -157,21 +673,18 @@ if __name__ == "__main__":
     movie_reviews_folder = "movie_reviews"
     output_folder = "movie_emotions"
 
-    # Initialize sentiment analyzer
-    analyzer = SentimentAnalyzer()
-
-    # Process each movie review file
-    for file_name in os.listdir(movie_reviews_folder):
-        if file_name.endswith(".csv"):
-            file_path = os.path.join(movie_reviews_folder, file_name)
-            analyzer.analyze_file(file_path, output_folder)
+    # Process the review files across all available cores
+    from src.analysis.sentiment.sentiment_pool import analyze_folder
+    analyze_folder(movie_reviews_folder, output_folder)
 
-    # Aggregate all emotion analysis results
-    combined_results = analyzer.aggregate_results(output_folder)
+    # Fold all emotion analysis results into per-movie statistics
+    movie_stats = SentimentAnalyzer.aggregate_statistics(output_folder)
 
     # Rank movies by "fear" scores
-    scary_scores = analyzer.rank_movies(combined_results, emotion_label="fear")
+    scary_scores = SentimentAnalyzer.rank_movies(
+        movie_stats, emotion_label="fear"
+    )
 
     # Save rankings
     scary_scores.to_csv("scary_movie_rankings.csv", index=False)
-    logging.info("Scary movie rankings saved to 'scary_movie_rankings.csv'") 
\ No newline at end of file
+    logging.info("Scary movie rankings saved to 'scary_movie_rankings.csv'")
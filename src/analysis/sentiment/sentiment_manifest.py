@@ -0,0 +1,116 @@
+"""
+This module defines the SentimentManifest class, which records the review
+files that have already been scored so unchanged files can be skipped on
+later runs.
+"""
+
+import os
+import json
+import hashlib
+import logging
+
+
+class SentimentManifest:
+    """Track the fingerprint of every review file that has been scored."""
+
+    def __init__(self, manifest_path):
+        """
+        Initialize the manifest, loading any previous entries.
+
+        Parameters:
+            manifest_path (str): JSON file where the manifest is stored.
+        """
+        self.manifest_path = manifest_path
+        self.entries = self._load()
+
+    def _load(self):
+        """Load the manifest entries, or start empty if none are saved."""
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            logging.warning(
+                f"Ignoring unreadable manifest {self.manifest_path}: {e}"
+            )
+            return {}
+
+    @staticmethod
+    def _hash_file(file_path):
+        """Return the SHA-1 of a file's content."""
+        sha1 = hashlib.sha1()
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                sha1.update(block)
+        return sha1.hexdigest()
+
+    def fingerprint(self, file_path, output_path, config=None,
+                    extra_outputs=()):
+        """
+        Fingerprint a review file and check it against the manifest.
+
+        The size and mtime are compared first; the content is only hashed
+        when they differ, so unchanged files cost a single stat call. The
+        output is only current if it was produced with the same analyzer
+        config and every expected output file exists.
+
+        Parameters:
+            file_path (str): Review file to fingerprint.
+            output_path (str): Emotion file produced from the review file.
+            config (dict): Analyzer settings that affect the output, e.g.
+                           the model and max_length.
+            extra_outputs (iterable[str]): Other files the analysis must
+                                           have written, e.g. the
+                                           distribution file.
+
+        Returns:
+            tuple[dict, bool]: The fingerprint and whether the existing
+            output is still current for it.
+        """
+        stat = os.stat(file_path)
+        entry = self.entries.get(os.path.basename(output_path))
+        if entry and entry.get('config') != config:
+            # Scored with other settings; the output must be recomputed
+            entry = None
+        output_exists = all(
+            os.path.exists(path) for path in (output_path, *extra_outputs)
+        )
+
+        if (entry and output_exists and entry['size'] == stat.st_size
+                and entry['mtime_ns'] == stat.st_mtime_ns):
+            return entry, True
+
+        fingerprint = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha1': self._hash_file(file_path),
+            'config': config
+        }
+        is_current = bool(
+            entry and output_exists and entry['sha1'] == fingerprint['sha1']
+        )
+        if is_current:
+            # Same content with a new mtime: remember it to skip the hash
+            self.entries[os.path.basename(output_path)] = fingerprint
+        return fingerprint, is_current
+
+    def record(self, output_path, fingerprint):
+        """
+        Record that output_path was produced from a file with fingerprint.
+        """
+        self.entries[os.path.basename(output_path)] = fingerprint
+
+    def save(self):
+        """Write the manifest atomically."""
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.entries, file)
+        os.replace(tmp_path, self.manifest_path)
+        logging.info(
+            f"Saved sentiment manifest with {len(self.entries)} entries "
+            f"to {self.manifest_path}"
+        )
@@ -0,0 +1,201 @@
+"""
+This module runs SentimentAnalyzer over a folder of review files using a
+pool of worker processes. Each worker loads the emotion model once and
+analyzes the files it is handed.
+"""
+
+import os
+import inspect
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import torch
+
+from src.analysis.sentiment.sentiment_analyzer import SentimentAnalyzer
+from src.analysis.sentiment.sentiment_manifest import SentimentManifest
+
+# Manifest of scored review files, stored in the output folder
+MANIFEST_FILENAME = ".sentiment_manifest.json"
+
+# Analyzer owned by the current worker process
+_worker_analyzer = None
+
+
+def list_review_files(review_folder):
+    """
+    List the review CSV files in a folder, sorted by name.
+
+    Parameters:
+        review_folder (str): Folder containing reviews_<imdb_id>.csv files.
+
+    Returns:
+        list[str]: Paths of the review files.
+    """
+    return sorted(
+        os.path.join(review_folder, file_name)
+        for file_name in os.listdir(review_folder)
+        if file_name.endswith(".csv")
+    )
+
+
+def analyzer_config(analyzer_kwargs):
+    """
+    Return the SentimentAnalyzer settings that change its output, filling
+    in the defaults of the ones not given.
+    """
+    defaults = inspect.signature(SentimentAnalyzer).parameters
+    return {
+        name: analyzer_kwargs.get(name, defaults[name].default)
+        for name in ("emotion_model", "max_length", "full_distribution")
+    }
+
+
+def _init_worker(analyzer_kwargs, num_threads):
+    """Load the emotion model once per worker process."""
+    global _worker_analyzer
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(processName)s - %(levelname)s - %(message)s"
+    )
+    # Split the CPU threads between workers to avoid oversubscription
+    torch.set_num_threads(num_threads)
+    _worker_analyzer = SentimentAnalyzer(**analyzer_kwargs)
+
+
+def _analyze_in_worker(file_path, output_folder, batch_size):
+    """Analyze one review file with the worker's analyzer."""
+    return _worker_analyzer.analyze_file(
+        file_path, output_folder, batch_size=batch_size
+    )
+
+
+def analyze_folder(review_folder, output_folder, num_workers=None,
+                   batch_size=None, file_paths=None, incremental=True,
+                   **analyzer_kwargs):
+    """
+    Analyze every review file in a folder across several processes.
+
+    Files are handed to the workers one at a time, so fast and slow files
+    even out across the pool. Each output file is written atomically by
+    SentimentAnalyzer.analyze_file. A file that fails is logged and
+    skipped so the rest of the folder is still processed.
+
+    In incremental mode a manifest in the output folder records the
+    fingerprint of every scored review file and the analyzer settings
+    used, and files whose content has not changed since their emotion file
+    was written with the same settings are skipped. With full_distribution
+    the distribution file must exist too.
+
+    Parameters:
+        review_folder (str): Folder containing reviews_<imdb_id>.csv files.
+        output_folder (str): Folder where emotions_<imdb_id>.csv files are
+                             saved.
+        num_workers (int): Number of worker processes. Defaults to the
+                           number of CPUs. 1 runs in the current process.
+        batch_size (int): Reviews per forward pass, see
+                          SentimentAnalyzer.analyze_file.
+        file_paths (list[str]): Explicit files to analyze. Defaults to all
+                                review files in review_folder.
+        incremental (bool): Skip review files that are unchanged since
+                            their last analysis. Defaults to True.
+        **analyzer_kwargs: Arguments passed to SentimentAnalyzer.
+
+    Returns:
+        list[str]: Paths of the emotion files written.
+    """
+    if file_paths is None:
+        file_paths = list_review_files(review_folder)
+
+    manifest = None
+    fingerprints = {}
+    if incremental:
+        manifest = SentimentManifest(
+            os.path.join(output_folder, MANIFEST_FILENAME)
+        )
+        config = analyzer_config(analyzer_kwargs)
+        pending = []
+        for file_path in file_paths:
+            output_path = SentimentAnalyzer.output_path_for(
+                file_path, output_folder
+            )
+            extra_outputs = (
+                [SentimentAnalyzer.distribution_path_for(output_path)]
+                if config["full_distribution"] else []
+            )
+            fingerprint, is_current = manifest.fingerprint(
+                file_path, output_path, config, extra_outputs
+            )
+            if not is_current:
+                fingerprints[file_path] = fingerprint
+                pending.append(file_path)
+        logging.info(
+            f"{len(file_paths) - len(pending)} review files unchanged "
+            f"since their last analysis; {len(pending)} to analyze."
+        )
+        file_paths = pending
+
+    if not file_paths:
+        logging.info(f"No review files to analyze in {review_folder}")
+        if manifest:
+            manifest.save()
+        return []
+
+    num_workers = min(num_workers or os.cpu_count() or 1, len(file_paths))
+    logging.info(
+        f"Analyzing {len(file_paths)} review files with "
+        f"{num_workers} worker(s)."
+    )
+
+    output_paths = []
+
+    def on_done(file_path, output_path):
+        output_paths.append(output_path)
+        if manifest:
+            manifest.record(output_path, fingerprints[file_path])
+
+    try:
+        if num_workers <= 1:
+            analyzer = SentimentAnalyzer(**analyzer_kwargs)
+            for file_path in file_paths:
+                try:
+                    on_done(file_path, analyzer.analyze_file(
+                        file_path, output_folder, batch_size=batch_size
+                    ))
+                except Exception as e:
+                    logging.error(f"Skipping {file_path}: {e}")
+            if analyzer.cache:
+                logging.info(f"Emotion cache stats: {analyzer.cache.stats()}")
+        else:
+            num_threads = max(1, (os.cpu_count() or 1) // num_workers)
+            # Spawn fresh interpreters so CUDA and tokenizer state are not
+            # forked
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(analyzer_kwargs, num_threads)
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _analyze_in_worker, file_path, output_folder,
+                        batch_size
+                    ): file_path
+                    for file_path in file_paths
+                }
+                for future in as_completed(futures):
+                    try:
+                        on_done(futures[future], future.result())
+                    except Exception as e:
+                        logging.error(f"Skipping {futures[future]}: {e}")
+    finally:
+        # Keep the files finished so far even if the run is interrupted
+        if manifest:
+            manifest.save()
+
+    logging.info(
+        f"Sentiment analysis finished: {len(output_paths)}/"
+        f"{len(file_paths)} files written to {output_folder}."
+    )
+    return output_paths
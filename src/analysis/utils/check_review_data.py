@@ -1,5 +1,6 @@
 import os
 import pandas as pd
+from src.data.columnar_store import ColumnarStore
 
 
 def get_imdb_ids_from_folder(folder_path):
@@ -8,18 +9,24 @@ def get_imdb_ids_from_folder(folder_path):
     DataFrame.
 
     Parameters:
-        folder_path (str): Path to the folder containing review files.
+        folder_path (str | ColumnarStore): Path to the folder containing
+        review files, or a review ColumnarStore.
 
     Returns:
         pd.DataFrame: A DataFrame with IMDb IDs.
     """
     try:
-        # List all CSV files in the folder
-        files = [f for f in os.listdir(folder_path) if f.endswith(".csv")]
-
-        # Extract IMDb IDs from filenames (assuming format like
-        # 'reviews_tt1234567.csv')
-        imdb_ids = [os.path.splitext(file)[0].split("_")[1] for file in files]
+        if isinstance(folder_path, ColumnarStore):
+            imdb_ids = folder_path.imdb_ids()
+        else:
+            # List all CSV files in the folder
+            files = [f for f in os.listdir(folder_path) if f.endswith(".csv")]
+
+            # Extract IMDb IDs from filenames (assuming format like
+            # 'reviews_tt1234567.csv')
+            imdb_ids = [
+                os.path.splitext(file)[0].split("_")[1] for file in files
+            ]
 
         # Create a DataFrame
         df = pd.DataFrame(imdb_ids, columns=["IMDb_ID"])
@@ -1,5 +1,6 @@
 import os
 import pandas as pd
+from src.data.columnar_store import ColumnarStore
 
 
 def count_reviews_in_folder(folder_path):
@@ -7,12 +8,19 @@ def count_reviews_in_folder(folder_path):
     Count the number of reviews for each movie in the specified folder.
 
     Parameters:
-        folder_path (str): Path to the folder containing review files.
+        folder_path (str | ColumnarStore): Path to the folder containing
+        review files, or a review ColumnarStore (only the imdb_id column
+        is read).
 
     Returns:
         pd.DataFrame: A DataFrame with IMDb_ID and Review_Count.
     """
     try:
+        if isinstance(folder_path, ColumnarStore):
+            return folder_path.count_by_id().rename(
+                columns={"imdb_id": "IMDb_ID", "count": "Review_Count"}
+            )
+
         # List all review files in the folder
         files = [f for f in os.listdir(folder_path) if f.endswith(".csv")]
 
@@ -0,0 +1,203 @@
+"""
+This module defines the ColumnarStore class, an optional Parquet storage
+backend for per-movie rows (reviews, emotions). Rows are buffered and
+appended as Parquet files in a dataset partitioned by a hash bucket of the
+IMDb ID, so readers can prune columns and push IMDb ID filters down to the
+files instead of opening one small CSV per movie.
+"""
+
+import os
+import json
+import uuid
+import zlib
+import logging
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+# Marker file describing the store; underscore files are ignored by pyarrow
+STORE_MARKER = "_store.json"
+
+
+def _bucket_of(imdb_id, num_buckets):
+    """Return the partition bucket of a single IMDb ID."""
+    digits = str(imdb_id)[2:]
+    if digits.isdigit():
+        return int(digits) % num_buckets
+    return zlib.crc32(str(imdb_id).encode("utf-8")) % num_buckets
+
+
+class ColumnarStore:
+    """An append-only Parquet dataset keyed by imdb_id."""
+
+    def __init__(self, root, num_buckets=64, flush_rows=100_000):
+        """
+        Open (or create) a store.
+
+        Parameters:
+            root (str): Directory holding the Parquet dataset.
+            num_buckets (int): Number of imdb_id hash partitions. Ignored
+                               when opening an existing store.
+            flush_rows (int): Buffered rows that trigger a write.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if pa is None:
+            raise ImportError(
+                "ColumnarStore requires pyarrow. Install it with "
+                "'pip install pyarrow'."
+            )
+        self.root = str(root)
+        self.flush_rows = flush_rows
+        self._buffer = []
+        self._buffered_rows = 0
+
+        marker = os.path.join(self.root, STORE_MARKER)
+        if os.path.exists(marker):
+            with open(marker, 'r', encoding='utf-8') as file:
+                num_buckets = json.load(file)["num_buckets"]
+        else:
+            os.makedirs(self.root, exist_ok=True)
+            with open(marker, 'w', encoding='utf-8') as file:
+                json.dump({"num_buckets": num_buckets}, file)
+        self.num_buckets = num_buckets
+
+    @staticmethod
+    def is_store(path):
+        """Return True if path is the root of a ColumnarStore."""
+        return os.path.exists(os.path.join(str(path), STORE_MARKER))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+    @property
+    def buffered_rows(self):
+        """Number of appended rows not yet written to disk."""
+        return self._buffered_rows
+
+    def append(self, imdb_id, dataframe):
+        """
+        Buffer the rows of one movie, writing them once flush_rows is
+        reached.
+
+        Parameters:
+            imdb_id (str): IMDb ID of the movie.
+            dataframe (pd.DataFrame): Rows to store for the movie.
+        """
+        if dataframe.empty:
+            return
+        rows = dataframe.copy()
+        rows.insert(0, "imdb_id", imdb_id)
+        self._buffer.append(rows)
+        self._buffered_rows += len(rows)
+        if self._buffered_rows >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows as one Parquet file per bucket."""
+        if not self._buffer:
+            return
+        data = pd.concat(self._buffer, ignore_index=True)
+        self._buffer = []
+        self._buffered_rows = 0
+
+        buckets = data["imdb_id"].map(
+            lambda imdb_id: _bucket_of(imdb_id, self.num_buckets)
+        )
+        for bucket, rows in data.groupby(buckets, sort=False):
+            folder = os.path.join(self.root, f"bucket={bucket}")
+            os.makedirs(folder, exist_ok=True)
+            # Sorted files keep row-group statistics selective on imdb_id
+            table = pa.Table.from_pandas(
+                rows.sort_values("imdb_id", kind="stable"),
+                preserve_index=False
+            )
+            file_name = f"part-{uuid.uuid4().hex}.parquet"
+            # Dot files are skipped by readers until the rename completes
+            tmp_path = os.path.join(folder, f".{file_name}")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, os.path.join(folder, file_name))
+        logging.info(f"Flushed {len(data)} rows to {self.root}")
+
+    def _dataset(self):
+        return ds.dataset(self.root, format="parquet", partitioning="hive")
+
+    def _filter(self, imdb_ids):
+        """Build a filter that prunes buckets and row groups by imdb_id."""
+        if imdb_ids is None:
+            return None
+        imdb_ids = list(imdb_ids)
+        buckets = sorted({
+            _bucket_of(imdb_id, self.num_buckets) for imdb_id in imdb_ids
+        })
+        return (
+            ds.field("bucket").isin(buckets)
+            & ds.field("imdb_id").isin(imdb_ids)
+        )
+
+    def read(self, columns=None, imdb_ids=None):
+        """
+        Read rows from the store.
+
+        Parameters:
+            columns (list[str]): Columns to load. Defaults to all stored
+                                 columns.
+            imdb_ids (list[str]): Only load rows of these movies.
+
+        Returns:
+            pd.DataFrame: The matching rows.
+        """
+        self.flush()
+        dataset = self._dataset()
+        if columns is None:
+            columns = [
+                name for name in dataset.schema.names if name != "bucket"
+            ]
+        if not dataset.files:
+            return pd.DataFrame(columns=columns)
+        table = dataset.to_table(
+            columns=columns, filter=self._filter(imdb_ids)
+        )
+        return table.to_pandas()
+
+    def iter_batches(self, columns=None, batch_size=100_000):
+        """
+        Yield the stored rows as DataFrames of at most batch_size rows,
+        keeping memory bounded for large stores.
+        """
+        self.flush()
+        dataset = self._dataset()
+        if not dataset.files:
+            return
+        for batch in dataset.to_batches(
+            columns=columns, batch_size=batch_size
+        ):
+            yield batch.to_pandas()
+
+    def count_by_id(self):
+        """
+        Count the stored rows of every movie reading only imdb_id.
+
+        Returns:
+            pd.DataFrame: imdb_id and count columns.
+        """
+        self.flush()
+        dataset = self._dataset()
+        if not dataset.files:
+            return pd.DataFrame(columns=["imdb_id", "count"])
+        table = dataset.to_table(columns=["imdb_id"])
+        counts = table.group_by("imdb_id").aggregate([("imdb_id", "count")])
+        return counts.to_pandas().rename(columns={"imdb_id_count": "count"})
+
+    def imdb_ids(self):
+        """Return the sorted IMDb IDs present in the store."""
+        return sorted(self.count_by_id()["imdb_id"])
@@ -1,6 +1,79 @@
+import os
+import csv
+import json
+import time
+import hashlib
 import logging
+import numpy as np
 import pandas as pd
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+# IMDb marks missing values with \N
+IMDB_NA_VALUE = "\\N"
+
+# Bytes hashed from each end of the TSV to key a snapshot
+SNAPSHOT_SAMPLE_BYTES = 1 << 20
+
+# Compact dtypes of the title.basics.tsv columns used in typed mode
+TITLE_BASICS_DTYPES = {
+    "tconst": "string",
+    "titleType": "category",
+    "primaryTitle": "string",
+    "originalTitle": "string",
+    "isAdult": "boolean",
+    "startYear": "Int16",
+    "endYear": "Int16",
+    "runtimeMinutes": "Int32",
+    "genres": "category",
+}
+
+# Typed columns read as text and converted afterwards, so a malformed cell
+# becomes NA instead of failing the whole load
+COERCED_DTYPES = ("boolean", "Int16", "Int32")
+TITLE_BASICS_READ_DTYPES = {
+    column: "string" if dtype in COERCED_DTYPES else dtype
+    for column, dtype in TITLE_BASICS_DTYPES.items()
+}
+
+
+def _coerce_typed_columns(data):
+    """
+    Convert the numeric and boolean title.basics columns of data, read as
+    text, to their compact dtypes. Cells that are not valid values for the
+    column (non-numeric years, isAdult other than 0/1) become NA.
+    """
+    for column in data.columns:
+        dtype = TITLE_BASICS_DTYPES.get(column)
+        if dtype not in COERCED_DTYPES:
+            continue
+        numbers = pd.to_numeric(data[column], errors="coerce")
+        if dtype == "boolean":
+            data[column] = numbers.map({0: False, 1: True}).astype("boolean")
+            continue
+        limits = np.iinfo(dtype.lower())
+        valid = (numbers % 1 == 0) & numbers.between(limits.min, limits.max)
+        data[column] = numbers.where(valid).astype(dtype)
+    return data
+
+
+def _peak_rss_mb():
+    """Return the peak resident memory of the process in MB, if known."""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
 
 class IMDbDataset:
     """ A class to handle loading and filtering IMDb datasets. """
@@ -8,24 +81,186 @@ class IMDbDataset:
     def __init__(self, input_file):
         self.input_file = input_file
         self.data = None
+        self.load_stats = None
+        # Lookup structures for filter_movies, built for self.data
+        self._filter_index = None
 
-    def load_data(self):
+    def load_data(self, typed=False, columns=None, engine="c",
+                  snapshot=False):
         """
         Load IMDb dataset from a TSV file and rename columns for better
         readability.
 
+        Parameters:
+            typed (bool): Read the title.basics columns with compact dtypes
+                          (categorical titleType/genres, Int16 years,
+                          boolean isAdult), \\N as NA and quotes kept as
+                          part of the titles. Defaults to False, which keeps
+                          pandas' inferred dtypes.
+            columns (list[str]): Only load these columns.
+            engine (str): "c" for pandas' parser, or "pyarrow" for the
+                          multithreaded pyarrow CSV reader.
+            snapshot (bool): Keep a parsed Feather snapshot next to the
+                             TSV and memory-map it on later loads, as long
+                             as the TSV's size, mtime and sampled hash
+                             still match. Requires pyarrow.
+
         Returns:
             pd.DataFrame: The loaded dataset or None if loading fails.
         """
         try:
             logging.info(f"Loading data from {self.input_file}...")
-            self.data = pd.read_csv(self.input_file, sep='\t')
-            logging.info("Data loaded successfully.")
+            start = time.perf_counter()
+            source = "tsv"
+            if snapshot:
+                self.data = self._read_snapshot(typed, columns)
+                if self.data is not None:
+                    source = "snapshot"
+                else:
+                    # Parse every column once so any projection can be
+                    # served from the snapshot later
+                    self.data = self._parse(typed, None, engine)
+                    self._write_snapshot(typed)
+                    if columns is not None:
+                        self.data = self.data[list(columns)]
+            else:
+                self.data = self._parse(typed, columns, engine)
+            self.load_stats = {
+                "source": source,
+                "rows": len(self.data),
+                "seconds": time.perf_counter() - start,
+                "memory_mb": float(
+                    self.data.memory_usage(deep=True).sum() / 1024 ** 2
+                ),
+                "peak_rss_mb": _peak_rss_mb()
+            }
+            logging.info(f"Data loaded successfully: {self.load_stats}")
             return self.data
         except Exception as e:
             logging.error(f"An error occurred while loading data: {e}")
             self.data = None
             return None
+        finally:
+            self._filter_index = None
+
+    def _parse(self, typed, columns, engine):
+        """Parse the TSV with the requested engine and dtypes."""
+        if engine == "pyarrow":
+            return self._read_with_pyarrow(typed, columns)
+        if typed:
+            return _coerce_typed_columns(pd.read_csv(
+                self.input_file,
+                sep='\t',
+                usecols=columns,
+                dtype=TITLE_BASICS_READ_DTYPES,
+                na_values=[IMDB_NA_VALUE],
+                keep_default_na=False,
+                quoting=csv.QUOTE_NONE
+            ))
+        return pd.read_csv(self.input_file, sep='\t', usecols=columns)
+
+    def snapshot_path(self, typed=False):
+        """Return the Feather snapshot path of the TSV for a load mode."""
+        mode = "typed" if typed else "raw"
+        return f"{self.input_file}.{mode}.feather"
+
+    def _source_key(self):
+        """
+        Key the TSV by size, mtime and a SHA-1 of its first and last
+        SNAPSHOT_SAMPLE_BYTES, so checking it costs a stat and two reads.
+        """
+        stat = os.stat(self.input_file)
+        sha1 = hashlib.sha1()
+        with open(self.input_file, 'rb') as file:
+            sha1.update(file.read(SNAPSHOT_SAMPLE_BYTES))
+            file.seek(max(0, stat.st_size - SNAPSHOT_SAMPLE_BYTES))
+            sha1.update(file.read(SNAPSHOT_SAMPLE_BYTES))
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha1": sha1.hexdigest()
+        }
+
+    def _read_snapshot(self, typed, columns):
+        """Memory-map the snapshot if it matches the TSV, else None."""
+        if pa is None:
+            logging.warning("Snapshots require pyarrow; parsing the TSV.")
+            return None
+        path = self.snapshot_path(typed)
+        try:
+            with open(f"{path}.json", 'r', encoding='utf-8') as file:
+                saved_key = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if saved_key != self._source_key():
+            logging.info(f"Snapshot {path} is stale; parsing the TSV.")
+            return None
+        try:
+            data = feather.read_table(
+                path, columns=columns, memory_map=True
+            ).to_pandas()
+        except Exception as e:
+            logging.warning(f"Could not read snapshot {path}: {e}")
+            return None
+        logging.info(f"Loaded snapshot {path}.")
+        return data
+
+    def _write_snapshot(self, typed):
+        """Write self.data as an uncompressed, memory-mappable snapshot."""
+        if pa is None:
+            return
+        path = self.snapshot_path(typed)
+        tmp_path = f"{path}.tmp"
+        try:
+            key = self._source_key()
+            if os.path.exists(f"{path}.json"):
+                os.remove(f"{path}.json")
+            feather.write_feather(
+                self.data, tmp_path, compression="uncompressed"
+            )
+            os.replace(tmp_path, path)
+            # The key is written last, so a partial snapshot is never used
+            with open(f"{path}.json", 'w', encoding='utf-8') as file:
+                json.dump(key, file)
+            logging.info(f"Saved snapshot {path}.")
+        except Exception as e:
+            logging.warning(f"Could not save snapshot {path}: {e}")
+
+    def _read_with_pyarrow(self, typed, columns):
+        """Read the TSV with pyarrow's CSV reader."""
+        if pa is None:
+            raise ImportError(
+                "The pyarrow engine requires pyarrow. Install it with "
+                "'pip install pyarrow'."
+            )
+        convert_options = pa_csv.ConvertOptions(include_columns=columns)
+        parse_options = pa_csv.ParseOptions(delimiter='\t')
+        types_mapper = None
+        if typed:
+            arrow_types = {
+                "string": pa.string(),
+                "category": pa.dictionary(pa.int32(), pa.string()),
+            }
+            convert_options = pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={
+                    column: arrow_types[dtype]
+                    for column, dtype in TITLE_BASICS_READ_DTYPES.items()
+                },
+                null_values=[IMDB_NA_VALUE],
+                strings_can_be_null=True
+            )
+            parse_options = pa_csv.ParseOptions(
+                delimiter='\t', quote_char=False
+            )
+            types_mapper = {pa.string(): pd.StringDtype()}.get
+        table = pa_csv.read_csv(
+            self.input_file,
+            parse_options=parse_options,
+            convert_options=convert_options
+        )
+        data = table.to_pandas(types_mapper=types_mapper)
+        return _coerce_typed_columns(data) if typed else data
 
     def filter_data(self, column_name, filter_value):
         """
@@ -41,6 +276,183 @@ class IMDbDataset:
             logging.warning("Data is not loaded. Please load the data first.")
             return None
 
+    @staticmethod
+    def _build_filter_index(data):
+        """
+        Precompute the lookups used by filter_movies for a frame: a genre
+        bitmask per row, factorized title types and the row positions
+        sorted by start year.
+        """
+        index = {"data": data, "rows": len(data)}
+
+        if "genres" in data.columns:
+            # Split each distinct genre combination once, not every row
+            codes, combinations = pd.factorize(data["genres"])
+            genre_bits = {}
+            combination_masks = np.zeros(len(combinations) + 1, np.uint64)
+            for position, combination in enumerate(combinations):
+                mask = 0
+                for genre in str(combination).split(","):
+                    genre = genre.strip().lower()
+                    if genre and genre != IMDB_NA_VALUE.lower():
+                        if genre not in genre_bits:
+                            if len(genre_bits) == 64:
+                                raise ValueError(
+                                    "More than 64 distinct genres."
+                                )
+                            genre_bits[genre] = len(genre_bits)
+                        mask |= 1 << genre_bits[genre]
+                combination_masks[position] = mask
+            # Code -1 (missing genres) maps to the trailing empty mask
+            index["genre_masks"] = combination_masks[codes]
+            index["genre_bits"] = genre_bits
+
+        if "titleType" in data.columns:
+            codes, title_types = pd.factorize(data["titleType"])
+            index["title_type_codes"] = codes
+            index["title_types"] = {
+                str(title_type): code
+                for code, title_type in enumerate(title_types)
+            }
+
+        if "startYear" in data.columns:
+            years = pd.to_numeric(
+                data["startYear"], errors="coerce"
+            ).to_numpy(dtype=float, na_value=np.nan)
+            order = np.argsort(years, kind="stable")
+            # NaN years sort last; keep only the rows with a year
+            order = order[:np.count_nonzero(~np.isnan(years))]
+            index["year_order"] = order
+            index["sorted_years"] = years[order]
+
+        if "isAdult" in data.columns:
+            is_adult = pd.to_numeric(data["isAdult"], errors="coerce")
+            index["is_adult"] = is_adult.to_numpy(
+                dtype=float, na_value=np.nan
+            )
+
+        return index
+
+    @staticmethod
+    def _filter_mask(index, genre, title_type, start_year, end_year,
+                     is_adult):
+        """Combine the predicates of filter_movies into one row mask."""
+        mask = np.ones(index["rows"], dtype=bool)
+
+        if genre and "genre_bits" in index:
+            bit = index["genre_bits"].get(genre.strip().lower())
+            if bit is None:
+                mask[:] = False
+            else:
+                mask &= (
+                    (index["genre_masks"] >> np.uint64(bit)) & np.uint64(1)
+                ) == 1
+
+        if title_type and "title_types" in index:
+            code = index["title_types"].get(title_type, -2)
+            mask &= index["title_type_codes"] == code
+
+        if (start_year is not None or end_year is not None) \
+                and "year_order" in index:
+            sorted_years = index["sorted_years"]
+            low = 0 if start_year is None else np.searchsorted(
+                sorted_years, start_year, side="left"
+            )
+            high = len(sorted_years) if end_year is None else \
+                np.searchsorted(sorted_years, end_year, side="right")
+            in_range = np.zeros(index["rows"], dtype=bool)
+            in_range[index["year_order"][low:high]] = True
+            mask &= in_range
+
+        if is_adult is not None and "is_adult" in index:
+            mask &= index["is_adult"] == float(is_adult)
+
+        return mask
+
+    def filter_movies(self, genre=None, title_type="movie", start_year=None,
+                      end_year=None, is_adult=False):
+        """
+        Filter the dataset by genre, title type, start year range and adult
+        flag. The lookups are built once per loaded dataset, so every
+        filter is a handful of NumPy mask operations.
+
+        Parameters:
+            genre (str): Genre that must be among a title's genres
+                         (case-insensitive).
+            title_type (str): Title type, e.g. "movie" or "short".
+            start_year (int): Earliest start year, inclusive.
+            end_year (int): Latest start year, inclusive.
+            is_adult (bool): Keep only adult (True) or non-adult (False)
+                             titles.
+
+        A None or empty value disables that filter, as does a filter on a
+        column the dataset does not have.
+
+        Returns:
+            pd.DataFrame: The matching rows, or None if no data is loaded.
+        """
+        if self.data is None:
+            logging.warning("Data is not loaded. Please load the data first.")
+            return None
+
+        index = self._filter_index
+        if index is None or index["data"] is not self.data \
+                or index["rows"] != len(self.data):
+            index = self._filter_index = self._build_filter_index(self.data)
+
+        if genre and "genre_bits" in index \
+                and genre.strip().lower() not in index["genre_bits"]:
+            logging.warning(f"Genre '{genre}' not found in the dataset.")
+        mask = self._filter_mask(
+            index, genre, title_type, start_year, end_year, is_adult
+        )
+        filtered = self.data[mask]
+        logging.info(
+            f"Filtered {len(filtered)} titles (genre={genre}, "
+            f"title_type={title_type}, start_year={start_year}, "
+            f"end_year={end_year}, is_adult={is_adult})."
+        )
+        return filtered
+
+    def stream_filter(self, genre=None, title_type="movie", start_year=None,
+                      end_year=None, is_adult=False, chunksize=100_000,
+                      typed=True):
+        """
+        Filter the TSV chunk by chunk without loading it, so memory stays
+        bounded by chunksize on hosts that cannot hold the whole dataset.
+        The filters behave as in filter_movies.
+
+        Parameters:
+            chunksize (int): Rows parsed per chunk.
+            typed (bool): Parse the chunks with the typed-mode dtypes.
+
+        Yields:
+            pd.DataFrame: The matching rows of each chunk that has any.
+        """
+        read_options = {"sep": '\t', "chunksize": chunksize}
+        if typed:
+            read_options.update(
+                dtype=TITLE_BASICS_DTYPES,
+                na_values=[IMDB_NA_VALUE],
+                keep_default_na=False,
+                quoting=csv.QUOTE_NONE
+            )
+        logging.info(
+            f"Streaming {self.input_file} in chunks of {chunksize} rows..."
+        )
+        rows = matches = 0
+        with pd.read_csv(self.input_file, **read_options) as reader:
+            for chunk in reader:
+                mask = self._filter_mask(
+                    self._build_filter_index(chunk), genre, title_type,
+                    start_year, end_year, is_adult
+                )
+                rows += len(chunk)
+                matches += int(mask.sum())
+                if mask.any():
+                    yield chunk[mask]
+        logging.info(f"Streamed {rows} titles; {matches} matched.")
+
 
 # Example usage
 if __name__ == "__main__":
@@ -21,6 +21,55 @@ class MovieExporter:
             logging.warning("The DataFrame is empty. No file will be saved.")
             return
 
+        file_path = self._file_path(genre, start_year, end_year)
+
+        # Save the DataFrame to a CSV file
+        try:
+            dataframe.to_csv(file_path, index=False)
+            logging.info(f"DataFrame saved to {file_path}")
+        except Exception as e:
+            logging.error(
+                f"An error occurred while saving the DataFrame to CSV: {e}"
+            )
+
+    def save_chunks(self, chunks, genre=None, start_year=None,
+                    end_year=None):
+        """
+        Stream DataFrame chunks into one CSV file, named as in save_to_csv,
+        without holding them all in memory. The file is written under a
+        temporary name and only appears once every chunk is written.
+
+        Parameters:
+            chunks (iterable[pd.DataFrame]): Chunks with the same columns.
+
+        Returns:
+            str: The saved file path, or None if there were no rows.
+        """
+        file_path = self._file_path(genre, start_year, end_year)
+        tmp_path = f"{file_path}.tmp"
+        rows = 0
+        try:
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as file:
+                for chunk in chunks:
+                    if chunk.empty:
+                        continue
+                    chunk.to_csv(file, index=False, header=rows == 0)
+                    rows += len(chunk)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if rows == 0:
+            os.remove(tmp_path)
+            logging.warning("No rows to export. No file will be saved.")
+            return None
+        os.replace(tmp_path, file_path)
+        logging.info(f"Streamed {rows} rows to {file_path}")
+        return file_path
+
+    def _file_path(self, genre=None, start_year=None, end_year=None):
+        """Build the output path from the filter parameters."""
         # Construct the filename based on filter parameters
         filename_parts = ["movies"]
         if genre:
@@ -32,16 +81,7 @@ class MovieExporter:
         if end_year:
             filename_parts.append(f"end_{end_year}")
         filename = "_".join(filename_parts) + ".csv"
-        file_path = os.path.join(self.output_folder, filename)
-
-        # Save the DataFrame to a CSV file
-        try:
-            dataframe.to_csv(file_path, index=False)
-            logging.info(f"DataFrame saved to {file_path}")
-        except Exception as e:
-            logging.error(
-                f"An error occurred while saving the DataFrame to CSV: {e}"
-            )
+        return os.path.join(self.output_folder, filename)
 
 
 # Example usage
@@ -0,0 +1,112 @@
+"""
+This module defines the AsyncScraperPipeline class, an asyncio-based mode
+of MovieScraperPipeline that keeps several review fetches in flight while
+saving progress in the original movie order so resuming still works.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from src.scrapers.movie_scraper_pipeline import (
+    MovieScraperPipeline,
+    CompletionTracker
+)
+
+
+class AsyncScraperPipeline(MovieScraperPipeline):
+    """Scrape the reviews of a movie list with bounded concurrency."""
+
+    def __init__(self, fetcher, concurrency: int = 8):
+        """
+        Parameters:
+            fetcher: Thread-safe fetch engine exposing
+                     scrape_reviews(imdb_id) -> list[str] | None, such as
+                     HttpReviewFetcher. Rate limiting is applied by the
+                     fetcher so it covers every request it makes.
+            concurrency (int): Maximum number of movies fetched at once.
+        """
+        super().__init__(None, fetcher=fetcher)
+        self.concurrency = max(1, concurrency)
+
+    def _scrape_movies(
+        self,
+        movie_list: pd.DataFrame,
+        output_folder: str,
+        tracker: CompletionTracker,
+        review_store,
+    ) -> None:
+        """Scrape and save the reviews of every movie in the list."""
+        asyncio.run(self._scrape_movies_async(
+            movie_list, output_folder, tracker, review_store
+        ))
+
+    async def _scrape_movies_async(
+        self,
+        movie_list: pd.DataFrame,
+        output_folder: str,
+        tracker: CompletionTracker,
+        review_store,
+    ) -> None:
+        """
+        Keep up to `concurrency` fetches running and save each movie's
+        reviews as soon as they arrive.
+
+        Fetches finish out of order, so progress is only advanced to the
+        last movie of the contiguous finished prefix. Resuming from the
+        saved ID never skips a movie; at most `concurrency` movies are
+        fetched again. A ledger, if any, records each movie as it ends.
+        """
+        loop = asyncio.get_running_loop()
+        movies = iter(enumerate(zip(
+            movie_list['imdb_id'], movie_list['primaryTitle']
+        )))
+        imdb_ids = []
+        finished = set()
+        next_to_commit = 0
+        pending = set()
+
+        async def fetch(position, imdb_id, title):
+            logging.info("Processing movie: %s (%s)", title, imdb_id)
+            reviews = await loop.run_in_executor(
+                executor, self.scrape_reviews, imdb_id
+            )
+            return position, imdb_id, title, reviews
+
+        def fill_window():
+            # Bound the in-flight tasks instead of creating one per movie
+            for position, (imdb_id, title) in movies:
+                imdb_ids.append(imdb_id)
+                pending.add(asyncio.ensure_future(
+                    fetch(position, imdb_id, title)
+                ))
+                if len(pending) >= self.concurrency:
+                    break
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            try:
+                fill_window()
+                while pending:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    pending.difference_update(done)
+                    for task in done:
+                        position, imdb_id, title, reviews = task.result()
+                        self._record_result(
+                            imdb_id, title, reviews, output_folder,
+                            tracker, review_store
+                        )
+                        finished.add(position)
+
+                    committed = next_to_commit
+                    while next_to_commit in finished:
+                        finished.remove(next_to_commit)
+                        next_to_commit += 1
+                    if next_to_commit > committed:
+                        # Save progress whether reviews are found or not
+                        tracker.advance(imdb_ids[next_to_commit - 1])
+                    fill_window()
+            finally:
+                for task in pending:
+                    task.cancel()
@@ -0,0 +1,297 @@
+"""
+This module defines the HttpReviewFetcher class, a review fetch engine
+that downloads IMDb review pages with a pooled HTTP session instead of
+driving a browser. It follows the same scrape_reviews(imdb_id) contract as
+MovieScraperPipeline.
+"""
+
+import json
+import time
+import logging
+from typing import List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+from src.scrapers.utils.rate_limiter import backoff_delay
+
+# Browser-like headers; review counts are parsed from the English page
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Status codes worth retrying: rate limiting and server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# The review page shows the first batch of reviews; the "25 more" and "All"
+# buttons load the rest from this GraphQL query, page by page, starting
+# from the cursor embedded in the page's __NEXT_DATA__ payload
+REVIEWS_PER_REQUEST = 25
+REVIEWS_QUERY = """
+query TitleReviews($const: ID!, $first: Int!, $after: ID) {
+  title(id: $const) {
+    reviews(first: $first, after: $after) {
+      total
+      pageInfo { hasNextPage endCursor }
+      edges { node { text { originalText { plaidHtml } } } }
+    }
+  }
+}
+"""
+
+
+class HttpReviewFetcher:
+    """Fetch the reviews of a movie over plain HTTP."""
+
+    def __init__(
+        self,
+        session: requests.Session = None,
+        base_url: str = "https://www.imdb.com",
+        graphql_url: str = "https://graphql.imdb.com/",
+        max_retries: int = 3,
+        timeout: float = 10,
+        retry_delay: float = 2,
+        pool_size: int = 10,
+        rate_limiter=None,
+    ):
+        """
+        Initialize the fetcher.
+
+        Parameters:
+            session (requests.Session): Session to reuse. A pooled session
+                                        with browser-like headers is
+                                        created by default.
+            base_url (str): Site root, overridable for testing.
+            graphql_url (str): Endpoint of the review pagination query,
+                               overridable for testing.
+            max_retries (int): Attempts per page before giving up.
+            timeout (float): Seconds to wait for each response.
+            retry_delay (float): Base of the jittered exponential backoff
+                                 between attempts, in seconds.
+            pool_size (int): Connections kept alive per host.
+            rate_limiter (HostRateLimiter): Optional limiter shared by all
+                                            the threads using this fetcher;
+                                            every request waits for a
+                                            token of its host.
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.graphql_url = graphql_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+        self.rate_limiter = rate_limiter
+
+    def _get(self, url: str, params: dict = None, payload: dict = None) -> str:
+        """
+        GET a page, or POST payload as JSON when given, retrying connection
+        errors and retryable statuses.
+
+        Returns:
+            str: The response body, or None if every attempt failed.
+        """
+        for attempt in range(1, self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            try:
+                if payload is None:
+                    response = self.session.get(
+                        url, params=params, timeout=self.timeout
+                    )
+                else:
+                    response = self.session.post(
+                        url, json=payload, timeout=self.timeout
+                    )
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.text
+                logging.warning(
+                    "HTTP %d for %s (Attempt %d/%d). Retrying...",
+                    response.status_code, url, attempt, self.max_retries
+                )
+            except requests.HTTPError as e:
+                # Client errors such as 404 will not succeed on retry
+                logging.error("HTTP error for %s: %s", url, e)
+                return None
+            except requests.RequestException as e:
+                logging.warning(
+                    "Request error for %s (Attempt %d/%d): %s. Retrying...",
+                    url, attempt, self.max_retries, e
+                )
+            if attempt < self.max_retries:
+                time.sleep(backoff_delay(attempt, self.retry_delay))
+        return None
+
+    @staticmethod
+    def parse_total_reviews(soup: BeautifulSoup) -> int:
+        """
+        Read the total review count (e.g., "14 reviews") from a page.
+
+        Returns:
+            int: The count, or None if the page does not show one.
+        """
+        element = soup.find("div", {"data-testid": "tturv-total-reviews"})
+        if element is None:
+            return None
+        text = element.get_text(strip=True)
+        try:
+            return int(text.split()[0].replace(',', ''))
+        except (IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def parse_reviews(soup: BeautifulSoup) -> List[str]:
+        """Extract the review texts shown on a review page."""
+        return [
+            review.text.strip()
+            for review in soup.find_all(
+                "div", class_="ipc-html-content-inner-div"
+            )
+        ]
+
+    @staticmethod
+    def parse_page_info(soup: BeautifulSoup) -> dict:
+        """
+        Read the pagination state of the reviews shown on a page from its
+        __NEXT_DATA__ payload.
+
+        Returns:
+            dict: The reviews pageInfo (hasNextPage, endCursor), or None if
+                  the page does not carry one.
+        """
+        script = soup.find("script", id="__NEXT_DATA__")
+        if script is None or not script.string:
+            return None
+        try:
+            pending = [json.loads(script.string)]
+        except ValueError:
+            return None
+        # The reviews connection is the object holding both pageInfo and
+        # edges; search for it rather than hard-coding the nesting
+        while pending:
+            node = pending.pop()
+            if isinstance(node, dict):
+                page_info = node.get("pageInfo")
+                if isinstance(page_info, dict) and "edges" in node:
+                    return page_info
+                pending.extend(node.values())
+            elif isinstance(node, list):
+                pending.extend(node)
+        return None
+
+    def _fetch_review_page(self, imdb_id: str, cursor: str) -> dict:
+        """
+        Fetch the next batch of reviews after cursor with the pagination
+        query.
+
+        Returns:
+            dict: The reviews connection (total, pageInfo, edges), or None
+                  if the request or its response failed.
+        """
+        body = self._get(self.graphql_url, payload={
+            "query": REVIEWS_QUERY,
+            "variables": {
+                "const": imdb_id,
+                "first": REVIEWS_PER_REQUEST,
+                "after": cursor,
+            },
+        })
+        if body is None:
+            return None
+        try:
+            return json.loads(body)["data"]["title"]["reviews"]
+        except (ValueError, KeyError, TypeError):
+            logging.error(
+                "Unexpected review pagination response for IMDb ID %s.",
+                imdb_id
+            )
+            return None
+
+    def scrape_reviews(self, imdb_id: str) -> Optional[List[str]]:
+        """
+        Fetch every review of a movie: the reviews shown on its review
+        page, then the following batches from the pagination query until
+        no next page is left.
+
+        Parameters:
+            imdb_id (str): IMDb ID of the movie.
+
+        Returns:
+            list[str]: The review texts, empty if the movie has none, or
+                       None if a page could not be fetched or the reviews
+                       could not be paged through.
+        """
+        url = f"{self.base_url}/title/{imdb_id}/reviews"
+        logging.info("Fetching reviews for IMDb ID %s over HTTP.", imdb_id)
+
+        html = self._get(url)
+        if html is None:
+            logging.error(
+                "Failed to fetch reviews for IMDb ID %s after %d retries.",
+                imdb_id, self.max_retries
+            )
+            return None
+
+        soup = BeautifulSoup(html, "html.parser")
+        total = self.parse_total_reviews(soup)
+        if total == 0:
+            logging.info("Movie %s has 0 reviews. Skipping...", imdb_id)
+            return []
+
+        reviews = self.parse_reviews(soup)
+        page_info = self.parse_page_info(soup)
+        if page_info is None and (total is None or len(reviews) < total):
+            logging.error(
+                "No pagination data on the review page of IMDb ID %s; "
+                "cannot fetch more than %d reviews.", imdb_id, len(reviews)
+            )
+            return None
+
+        seen_cursors = set()
+        while page_info and page_info.get("hasNextPage"):
+            cursor = page_info.get("endCursor")
+            if not cursor or cursor in seen_cursors:
+                break
+            seen_cursors.add(cursor)
+            connection = self._fetch_review_page(imdb_id, cursor)
+            if connection is None:
+                logging.error(
+                    "Failed to page reviews for IMDb ID %s after %d "
+                    "reviews.", imdb_id, len(reviews)
+                )
+                return None
+            for edge in connection.get("edges") or []:
+                text = (((edge.get("node") or {}).get("text") or {})
+                        .get("originalText") or {}).get("plaidHtml") or ""
+                reviews.append(
+                    BeautifulSoup(text, "html.parser").get_text().strip()
+                )
+            if total is None:
+                total = connection.get("total")
+            page_info = connection.get("pageInfo")
+
+        if total is not None and len(reviews) < total:
+            logging.warning(
+                "Fetched %d of %d reviews for IMDb ID %s.",
+                len(reviews), total, imdb_id
+            )
+        logging.info(
+            "Successfully fetched %d reviews for IMDb ID %s.",
+            len(reviews), imdb_id
+        )
+        return reviews
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
@@ -5,6 +5,7 @@ import argparse
 import pandas as pd
 from pathlib import Path
 from config.paths import (
+    RAW_DATA_DIR,
     MOVIE_DATA_DIR,
     REVIEWS_DIR,
     PROCESSED_DATA_DIR,
@@ -13,9 +14,15 @@ from config.paths import (
 from src import IMDbDataset
 from src import MovieExporter
 from src.scrapers.movie_scraper_pipeline import MovieScraperPipeline
+from src.scrapers.http_review_fetcher import HttpReviewFetcher
+from src.scrapers.async_pipeline import AsyncScraperPipeline
+from src.scrapers.utils.rate_limiter import HostRateLimiter
 from src import WebDriverManager
-from src.utils.progress_manager import ProgressManager
+from src.utils.progress_manager import ProgressManager, ProgressLedger
+from src.utils.scrape_cost import load_review_counts, ORDERS
 from src.analysis.sentiment.sentiment_analyzer import SentimentAnalyzer
+from src.analysis.sentiment.sentiment_pool import analyze_folder
+from src.data.columnar_store import ColumnarStore
 
 
 def get_filter_parameters(args):
@@ -123,8 +130,81 @@ def list_review_folders(review_base_folder=REVIEWS_DIR):
         return None
 
 
+def run_sentiment_analysis(review_folder, output_folder, args):
+    """
+    Analyze a review folder or store and rank movies by fear.
+
+    Raises:
+        ValueError: If options the Parquet store path does not support
+                    (--workers, --full_distribution) are given for a store.
+    """
+    if ColumnarStore.is_store(review_folder):
+        unsupported = [
+            flag for flag, value in (
+                ("--workers", args.workers),
+                ("--full_distribution", args.full_distribution)
+            ) if value
+        ]
+        if unsupported:
+            raise ValueError(
+                f"{' and '.join(unsupported)} cannot be used with a "
+                f"Parquet review store ({review_folder}); analyze a folder "
+                f"of review CSV files instead."
+            )
+        # Parquet reviews are analyzed into an emotion store
+        analyzer = SentimentAnalyzer(
+            batch_size=args.batch_size, cache_path=args.emotion_cache
+        )
+        emotion_store = ColumnarStore(f"{output_folder}_parquet")
+        analyzer.analyze_store(
+            ColumnarStore(review_folder),
+            emotion_store,
+            skip_existing=not args.rescore_all
+        )
+        movie_stats = SentimentAnalyzer.aggregate_statistics(emotion_store)
+        return SentimentAnalyzer.rank_movies(
+            movie_stats, emotion_label="fear"
+        )
+
+    # Process the review files across the worker pool
+    analyze_folder(
+        review_folder,
+        output_folder,
+        num_workers=args.workers,
+        batch_size=args.batch_size,
+        incremental=not args.rescore_all,
+        cache_path=args.emotion_cache,
+        full_distribution=args.full_distribution
+    )
+
+    if args.full_distribution:
+        distribution = SentimentAnalyzer.aggregate_distributions(
+            output_folder
+        )
+        return SentimentAnalyzer.rank_movies_by_distribution(
+            distribution, emotion_label="fear"
+        )
+
+    # Fold the emotion files into per-movie statistics to bound memory
+    movie_stats = SentimentAnalyzer.aggregate_statistics(
+        output_folder,
+        cache_file=os.path.join(output_folder, ".statistics_cache.pkl")
+    )
+    return SentimentAnalyzer.rank_movies(movie_stats, emotion_label="fear")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="IMDb Movie Scraper")
+    parser.add_argument(
+        "--tsv_file", type=str,
+        default=str(RAW_DATA_DIR / "title.basics.tsv"),
+        help="IMDb title.basics.tsv file to filter (option 2)"
+    )
+    parser.add_argument(
+        "--chunksize", type=int,
+        help="Filter the TSV in chunks of this many rows (option 2, "
+             "low memory)"
+    )
     parser.add_argument("--genre", type=str, help="Genre to filter")
     parser.add_argument(
         "--title_type", type=str, default="movie",
@@ -138,6 +218,60 @@ if __name__ == "__main__":
         choices=["yes", "no"],
         help="Include adult titles (yes/no)"
     )
+    parser.add_argument(
+        "--workers", type=int,
+        help="Worker processes for sentiment analysis (default: all CPUs)"
+    )
+    parser.add_argument(
+        "--batch_size", type=int,
+        help="Reviews per forward pass during sentiment analysis"
+    )
+    parser.add_argument(
+        "--rescore_all", action="store_true",
+        help="Re-run sentiment analysis on unchanged review files too"
+    )
+    parser.add_argument(
+        "--emotion_cache", type=str,
+        help="SQLite file caching emotion predictions across runs"
+    )
+    parser.add_argument(
+        "--full_distribution", action="store_true",
+        help="Store every emotion probability and rank by the full "
+             "distribution"
+    )
+    parser.add_argument(
+        "--storage", type=str, choices=["csv", "parquet"], default="csv",
+        help="Save scraped reviews as per-movie CSVs or a Parquet dataset"
+    )
+    parser.add_argument(
+        "--engine", type=str, choices=["selenium", "http"],
+        default="selenium",
+        help="Fetch review pages with a browser or with plain HTTP requests"
+    )
+    parser.add_argument(
+        "--async_workers", type=int,
+        help="Scrape with the asyncio engine keeping N movies in flight "
+             "(uses HTTP requests)"
+    )
+    parser.add_argument(
+        "--rate_limit", type=float, default=2.0,
+        help="Maximum HTTP requests per second per host (default: 2)"
+    )
+    parser.add_argument(
+        "--ledger", type=str, default="scrape_progress.db",
+        help="SQLite ledger of completed IMDb IDs used to skip finished "
+             "movies (default: scrape_progress.db)"
+    )
+    parser.add_argument(
+        "--review_counts", type=str,
+        help="Review count table (e.g., data/unique_review_counts.csv) "
+             "used to skip titles without reviews before scraping"
+    )
+    parser.add_argument(
+        "--cost_order", type=str, choices=ORDERS, default="cheapest",
+        help="Queue order by expected page cost when --review_counts is "
+             "given (default: cheapest)"
+    )
 
     args = parser.parse_args()
 
@@ -210,32 +344,65 @@ if __name__ == "__main__":
                     continue
 
         elif choice == '2':
-            imdb_dataset = IMDbDataset(
-                args.tsv_file)  # Ensure this path is correct
-            imdb_dataset.load_data()
-
+            imdb_dataset = IMDbDataset(args.tsv_file)
             genre, title_type, start_year, end_year, is_adult = \
                 get_filter_parameters(args)
+            exporter = MovieExporter()
 
-            filtered_movies = imdb_dataset.filter_movies(
-                genre=genre,
-                title_type=title_type,
-                start_year=start_year,
-                end_year=end_year,
-                is_adult=is_adult
-            )
+            if args.chunksize:
+                # Low-memory mode: never hold the whole TSV in memory
+                chunks = imdb_dataset.stream_filter(
+                    genre=genre,
+                    title_type=title_type,
+                    start_year=start_year,
+                    end_year=end_year,
+                    is_adult=is_adult,
+                    chunksize=args.chunksize
+                )
+                saved_file = exporter.save_chunks(
+                    (chunk.rename(columns={'tconst': 'imdb_id'})
+                     for chunk in chunks),
+                    genre=genre,
+                    start_year=start_year,
+                    end_year=end_year
+                )
+                if saved_file is None:
+                    logging.error(
+                        "Filtered results: 0 movies. Exiting program."
+                    )
+                    sys.exit(1)  # Exit the program
+                filtered_movies = pd.read_csv(saved_file)
+            else:
+                # Reuse the parsed snapshot when the TSV has not changed
+                if imdb_dataset.load_data(typed=True, snapshot=True) is None:
+                    logging.error(f"Could not load {args.tsv_file}.")
+                    continue
 
-            if len(filtered_movies) == 0:
-                logging.error("Filtered results: 0 movies. Exiting program.")
-                sys.exit(1)  # Exit the program
+                filtered_movies = imdb_dataset.filter_movies(
+                    genre=genre,
+                    title_type=title_type,
+                    start_year=start_year,
+                    end_year=end_year,
+                    is_adult=is_adult
+                )
 
-            exporter = MovieExporter()
-            exporter.save_to_csv(
-                filtered_movies,
-                genre=genre,
-                start_year=start_year,
-                end_year=end_year
-            )
+                if len(filtered_movies) == 0:
+                    logging.error(
+                        "Filtered results: 0 movies. Exiting program."
+                    )
+                    sys.exit(1)  # Exit the program
+
+                # The scraping pipeline and saved files use imdb_id
+                filtered_movies = filtered_movies.rename(
+                    columns={'tconst': 'imdb_id'}
+                )
+
+                exporter.save_to_csv(
+                    filtered_movies,
+                    genre=genre,
+                    start_year=start_year,
+                    end_year=end_year
+                )
             # Save current dataset name for future reference
             dataset_name = (
                 f"{genre}_{start_year}_{end_year}" if genre else "all_movies"
@@ -277,23 +444,16 @@ if __name__ == "__main__":
             # List and select the review folder
             review_folder = list_review_folders()
             if review_folder:
-                # Initialize SentimentAnalyzer and process reviews
-                analyzer = SentimentAnalyzer()
                 # Define where the results will be saved
                 output_folder = "movie_emotions"
 
-                # Process each review file in the selected folder
-                for file_name in os.listdir(review_folder):
-                    if file_name.endswith(".csv"):
-                        file_path = os.path.join(review_folder, file_name)
-                        # Process individual file
-                        analyzer.analyze_file(file_path, output_folder)
-
-                # Optionally, aggregate the results and rank movies by emotion
-                combined_results = analyzer.aggregate_results(output_folder)
-                scary_scores = analyzer.rank_movies(
-                    combined_results, emotion_label="fear"
-                )
+                try:
+                    scary_scores = run_sentiment_analysis(
+                        review_folder, output_folder, args
+                    )
+                except ValueError as e:
+                    logging.error(e)
+                    continue
 
                 # Save rankings
                 scary_scores.to_csv("scary_movie_rankings.csv", index=False)
@@ -305,7 +465,7 @@ if __name__ == "__main__":
                 # complete
                 if scary_scores.shape[0] > 0:
                     # Get the first IMDb ID from the rankings
-                    last_sentiment_id = scary_scores.iloc[0]["imdb_id"]
+                    last_sentiment_id = scary_scores.iloc[0]["imbd_id"]
                     logging.info(
                         f"Saving last sentiment ID: {last_sentiment_id}"
                     )
@@ -329,13 +489,44 @@ if __name__ == "__main__":
     # Initialize and start the scraping pipeline
     web_driver_manager = WebDriverManager()
     try:
-        driver = web_driver_manager.setup_driver(headless=False)
-        scraper_pipeline = MovieScraperPipeline(driver)
-        scraper_pipeline.run_pipeline(
-            filtered_movies,
-            dataset_name=dataset_name,
-            start_from_id=imdb_id_to_start
+        if args.async_workers:
+            # The browser cannot be shared across tasks; fetch over HTTP
+            scraper_pipeline = AsyncScraperPipeline(
+                HttpReviewFetcher(
+                    pool_size=args.async_workers,
+                    rate_limiter=HostRateLimiter(args.rate_limit)
+                ),
+                concurrency=args.async_workers
+            )
+        elif args.engine == "http":
+            scraper_pipeline = MovieScraperPipeline(
+                None,
+                fetcher=HttpReviewFetcher(
+                    rate_limiter=HostRateLimiter(args.rate_limit)
+                )
+            )
+        else:
+            driver = web_driver_manager.setup_driver(headless=False)
+            scraper_pipeline = MovieScraperPipeline(driver)
+        review_store = (
+            ColumnarStore(os.path.join("reviews", f"{dataset_name}_parquet"))
+            if args.storage == "parquet" else None
+        )
+        review_counts = (
+            load_review_counts(args.review_counts)
+            if args.review_counts else None
         )
+        with ProgressLedger(args.ledger) as ledger:
+            scraper_pipeline.run_pipeline(
+                filtered_movies,
+                dataset_name=dataset_name,
+                start_from_id=imdb_id_to_start,
+                review_store=review_store,
+                progress_manager=progress_manager,
+                ledger=ledger,
+                review_counts=review_counts,
+                cost_order=args.cost_order
+            )
     except Exception as e:
         logging.error(f"An error occurred during scraping: {e}")
     finally:
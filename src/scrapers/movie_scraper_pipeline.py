@@ -7,6 +7,8 @@ and managing progress for multiple movies in a dataset.
 import os
 import time
 import logging
+from typing import List, Optional
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
 from selenium.webdriver.support import expected_conditions as EC
@@ -22,19 +24,107 @@ from config.paths import (
 )
 from src.data.imdb_dataset import IMDbDataset
 from src.data.movie_exporter import MovieExporter
-from src.utils.progress_manager import ProgressManager
+from src.utils.progress_manager import ProgressManager, ProgressLedger
+from src.utils.scrape_cost import plan_scrape
 from src.scrapers.utils.web_driver_manager import WebDriverManager
+from src.scrapers.utils.rate_limiter import backoff_delay
+
+
+class CompletionTracker:
+    """
+    Record finished movies in the progress files and, when given, the
+    completion ledger.
+    """
+
+    def __init__(
+        self,
+        dataset_name: str,
+        progress_manager: ProgressManager,
+        ledger: ProgressLedger = None,
+        review_store=None,
+    ):
+        self.dataset_name = dataset_name
+        self.progress_manager = progress_manager
+        self.ledger = ledger
+        self.review_store = review_store
+        self.last_id = None
+        # Movies whose reviews are still buffered in review_store
+        self._unflushed_ids = []
+
+    def done(self, imdb_id: str, stored: bool) -> None:
+        """
+        Mark a movie as completed in the ledger once its reviews are on
+        disk. stored is True if its reviews went to review_store.
+        """
+        if self.ledger is None:
+            return
+        if self.review_store is not None \
+                and self.review_store.buffered_rows == 0:
+            # The store has flushed; its buffered movies are durable
+            self._mark_unflushed()
+        if stored and self.review_store is not None \
+                and self.review_store.buffered_rows:
+            self._unflushed_ids.append(imdb_id)
+        else:
+            self.ledger.mark_done(self.dataset_name, imdb_id)
+
+    def advance(self, imdb_id: str) -> None:
+        """
+        Record the position reached in the movie list. Without a ledger
+        it is saved right away; with one it is saved once, at close.
+        """
+        self.last_id = imdb_id
+        if self.ledger is None:
+            self.progress_manager.save_progress(imdb_id, self.dataset_name)
+
+    def _mark_unflushed(self) -> None:
+        for imdb_id in self._unflushed_ids:
+            self.ledger.mark_done(self.dataset_name, imdb_id)
+        self._unflushed_ids = []
+
+    def close(self) -> None:
+        """Flush the store, then commit the ledger and the last ID."""
+        if self.review_store is not None:
+            self.review_store.flush()
+        if self.ledger is None:
+            return
+        self._mark_unflushed()
+        self.ledger.commit()
+        if self.last_id is not None:
+            self.progress_manager.save_progress(
+                self.last_id, self.dataset_name
+            )
 
 
 class MovieScraperPipeline:
     """A class to manage the scraping of reviews for a list of IMDb IDs."""
 
-    def __init__(self, driver, max_retries: int = 3):
+    def __init__(self, driver, max_retries: int = 3, fetcher=None):
+        """
+        Parameters:
+            driver: Selenium WebDriver used to load the review pages. May
+                    be None when a fetcher is given.
+            max_retries (int): Attempts per movie before giving up.
+            fetcher: Optional fetch engine exposing
+                     scrape_reviews(imdb_id) -> list[str] | None (e.g.,
+                     HttpReviewFetcher) used instead of the browser.
+        """
         self.driver = driver
         self.max_retries = max_retries
+        self.fetcher = fetcher
+
+    def scrape_reviews(self, imdb_id: str) -> Optional[List[str]]:
+        """
+        Scrape reviews for a given IMDb ID.
+
+        Returns:
+            list[str]: The review texts, empty if the movie has no
+                       reviews, or None if every attempt failed so the
+                       movie must not be recorded as completed.
+        """
+        if self.fetcher is not None:
+            return self.fetcher.scrape_reviews(imdb_id)
 
-    def scrape_reviews(self, imdb_id: str) -> list[str]:
-        """Scrape reviews for a given IMDb ID."""
         url = f"https://www.imdb.com/title/{imdb_id}/reviews"
         retries = 0
 
@@ -107,14 +197,15 @@ class MovieScraperPipeline:
                 )
 
             retries += 1
-            time.sleep(2)
+            if retries < self.max_retries:
+                time.sleep(backoff_delay(retries, base=2))
 
         logging.error(
             "Failed to scrape reviews for IMDb ID %s after %d retries.",
             imdb_id,
             self.max_retries
         )
-        return []
+        return None
 
     def _click_all_button(self, imdb_id: str) -> None:
         """Click the 'All' button to load all reviews."""
@@ -139,9 +230,25 @@ class MovieScraperPipeline:
         output_folder: str = "reviews",
         dataset_name: str = None,
         start_from_id: str = None,
+        review_store=None,
+        progress_manager: ProgressManager = None,
+        ledger: ProgressLedger = None,
+        review_counts: pd.Series = None,
+        cost_order: str = "cheapest",
     ) -> None:
         """
         Run the pipeline to scrape and save reviews for movies in the list.
+
+        Reviews are written to one reviews_<imdb_id>.csv per movie, or
+        appended to review_store (a ColumnarStore) when one is given.
+        Progress is saved with progress_manager, a default ProgressManager
+        if none is given. With a ProgressLedger, movies it already lists
+        for the dataset are skipped, every finished movie is recorded in
+        it, and the last-ID file is only written at the end of the run.
+
+        With review_counts (see scrape_cost.load_review_counts), titles
+        known to have no reviews are skipped before any page is loaded and
+        the rest are queued by expected page cost, following cost_order.
         """
         if not dataset_name:
             raise ValueError(
@@ -153,9 +260,36 @@ class MovieScraperPipeline:
         os.makedirs(output_folder, exist_ok=True)
         logging.info("Output folder: %s", output_folder)
 
+        if review_counts is not None:
+            # Plan before resuming: the saved ID refers to the planned order
+            movie_list = plan_scrape(movie_list, review_counts, cost_order)
         movie_list = self._resume_from_id(movie_list, start_from_id)
-        progress_manager = ProgressManager()
+        if ledger is not None:
+            movie_list = self._skip_completed(
+                movie_list, ledger, dataset_name
+            )
+        tracker = CompletionTracker(
+            dataset_name,
+            progress_manager or ProgressManager(),
+            ledger,
+            review_store
+        )
 
+        try:
+            self._scrape_movies(
+                movie_list, output_folder, tracker, review_store
+            )
+        finally:
+            tracker.close()
+
+    def _scrape_movies(
+        self,
+        movie_list: pd.DataFrame,
+        output_folder: str,
+        tracker: CompletionTracker,
+        review_store,
+    ) -> None:
+        """Scrape and save the reviews of every movie in the list."""
         for _, movie in movie_list.iterrows():
             imdb_id = movie['imdb_id']
             title = movie['primaryTitle']
@@ -164,35 +298,101 @@ class MovieScraperPipeline:
             reviews = self.scrape_reviews(imdb_id)
 
             # Save progress whether reviews are found or not
-            progress_manager.save_progress(imdb_id, dataset_name)
+            tracker.advance(imdb_id)
+            self._record_result(
+                imdb_id, title, reviews, output_folder, tracker,
+                review_store
+            )
 
-            if reviews:
-                output_file = os.path.join(
-                    output_folder, f"reviews_{imdb_id}.csv"
-                )
-                pd.DataFrame(reviews, columns=["Review"]).to_csv(
-                    output_file, index=False
-                )
-                logging.info(
-                    "Saved reviews for '%s' to %s.", title, output_file
-                )
-            else:
-                logging.warning(
-                    "No reviews found for movie: %s (%s). Skipping.",
-                    title, imdb_id
-                )
+    def _record_result(
+        self,
+        imdb_id: str,
+        title: str,
+        reviews: Optional[List[str]],
+        output_folder: str,
+        tracker: CompletionTracker,
+        review_store,
+    ) -> None:
+        """
+        Save a movie's reviews and mark it completed, unless the scrape
+        failed (reviews is None): failed movies stay out of the ledger so
+        later runs try them again.
+        """
+        if reviews is None:
+            logging.warning(
+                "Scraping failed for movie: %s (%s); it will be retried "
+                "on a later run.", title, imdb_id
+            )
+            return
+        self._save_reviews(
+            imdb_id, title, reviews, output_folder, review_store
+        )
+        tracker.done(imdb_id, stored=bool(reviews))
+
+    def _save_reviews(
+        self,
+        imdb_id: str,
+        title: str,
+        reviews: list[str],
+        output_folder: str,
+        review_store,
+    ) -> None:
+        """Save the reviews of one movie to its CSV file or the store."""
+        if reviews and review_store is not None:
+            review_store.append(
+                imdb_id, pd.DataFrame(reviews, columns=["Review"])
+            )
+            logging.info(
+                "Stored %d reviews for '%s' in %s.",
+                len(reviews), title, review_store.root
+            )
+        elif reviews:
+            output_file = os.path.join(
+                output_folder, f"reviews_{imdb_id}.csv"
+            )
+            pd.DataFrame(reviews, columns=["Review"]).to_csv(
+                output_file, index=False
+            )
+            logging.info(
+                "Saved reviews for '%s' to %s.", title, output_file
+            )
+        else:
+            logging.warning(
+                "No reviews found for movie: %s (%s). Skipping.",
+                title, imdb_id
+            )
+
+    @staticmethod
+    def _skip_completed(
+        movie_list: pd.DataFrame, ledger: ProgressLedger, dataset_name: str
+    ) -> pd.DataFrame:
+        """Drop the movies the ledger lists as completed for the dataset."""
+        completed = ledger.completed_ids(dataset_name)
+        if not completed:
+            return movie_list
+        remaining = movie_list[~movie_list['imdb_id'].isin(completed)]
+        logging.info(
+            "Skipping %d movies already completed in the ledger.",
+            len(movie_list) - len(remaining)
+        )
+        return remaining
 
     def _resume_from_id(
         self, movie_list: pd.DataFrame, start_from_id: str
     ) -> pd.DataFrame:
-        """Resume scraping from a specific IMDb ID."""
+        """
+        Resume scraping from a specific IMDb ID.
+
+        The ID is located by position in a single vectorized pass, so
+        filtered lists with non-contiguous indexes resume at the right row.
+        """
         if start_from_id:
-            if start_from_id in movie_list['imdb_id'].values:
-                start_index = movie_list[
-                    movie_list['imdb_id'] == start_from_id
-                ].index[0]
+            positions = np.flatnonzero(
+                movie_list['imdb_id'].to_numpy() == start_from_id
+            )
+            if len(positions):
                 logging.info("Resuming from movie ID: %s.", start_from_id)
-                return movie_list.iloc[start_index:]
+                return movie_list.iloc[positions[0]:]
             logging.warning(
                 "Starting ID '%s' not found in the movie list.", start_from_id
             )
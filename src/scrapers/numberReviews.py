@@ -3,9 +3,8 @@ import boto3
 import pandas as pd
 import os
 import csv
-import time
-import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -13,6 +12,10 @@ from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from datetime import datetime, timedelta  # Import datetime and timedelta
+from src.scrapers.utils.driver_pool import DriverPool
+from src.scrapers.utils.rate_limiter import TokenBucket
+from src.scrapers.utils.result_writer import BufferedCsvWriter
+from src.scrapers.utils.s3_checkpointer import S3Checkpointer
 
 # Configure logging
 logging.basicConfig(
@@ -27,9 +30,22 @@ logging.basicConfig(
 # Initialize UserAgent for rotation
 ua = UserAgent()
 
-def get_reviews_count(imdb_id):
-    """Get the number of reviews for a specific IMDb ID."""
-    url = f"https://www.imdb.com/title/{imdb_id}/reviews"
+# Pages served by a pooled browser before its session is rotated
+DRIVER_MAX_PAGES = 200
+
+# Default request rate of each worker; the shared limit scales with max_workers
+REQUESTS_PER_SECOND_PER_WORKER = 0.5
+
+# Set the Chrome binary location (specific to AWS EC2)
+CHROME_BINARY_PATH = "/usr/bin/google-chrome"
+
+@lru_cache(maxsize=1)
+def get_chromedriver_path():
+    """Install ChromeDriver once per process and return its path."""
+    return ChromeDriverManager().install()
+
+def create_driver():
+    """Start a headless Chrome WebDriver with a random user-agent."""
     chrome_options = Options()
     chrome_options.add_argument("--headless")  # Run in headless mode
     chrome_options.add_argument("--disable-gpu")
@@ -37,46 +53,72 @@ def get_reviews_count(imdb_id):
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--window-size=1920x1080")
     chrome_options.add_argument(f"--user-agent={ua.random}")  # Rotate user-agent
+    if not os.path.exists(CHROME_BINARY_PATH):
+        raise FileNotFoundError("Google Chrome binary not found. Ensure Chrome is installed.")
+    chrome_options.binary_location = CHROME_BINARY_PATH
+
+    service = Service(get_chromedriver_path())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+def parse_reviews_count(driver, imdb_id):
+    """
+    Load the reviews page of an IMDb ID in driver and read its review count.
 
-    # Set the Chrome binary location (specific to AWS EC2)
-    chrome_binary_path = "/usr/bin/google-chrome"
-    if os.path.exists(chrome_binary_path):
-        chrome_options.binary_location = chrome_binary_path
+    Returns None if the page does not show a count, so it is not mistaken for a title without
+    reviews.
+    """
+    url = f"https://www.imdb.com/title/{imdb_id}/reviews"
+    driver.get(url)
+
+    # Wait for reviews to load
+    driver.implicitly_wait(10)
+
+    # Get page source and parse with BeautifulSoup
+    soup = BeautifulSoup(driver.page_source, "html.parser")
+
+    # Extract reviews count
+    total_reviews_element = soup.find("div", {"data-testid": "tturv-total-reviews"})
+    if total_reviews_element:
+        total_reviews_text = total_reviews_element.get_text(strip=True)
+        total_reviews = int(total_reviews_text.split()[0].replace(',', ''))  # Extract numeric part
+        return total_reviews
     else:
-        logging.error("Google Chrome binary not found. Ensure Chrome is installed.")
-        return 0
+        logging.warning(f"Total reviews element not found for IMDb ID {imdb_id}.")
+        return None
 
-    # Explicitly set the ChromeDriver path
-    chromedriver_path = ChromeDriverManager().install()
+def get_reviews_count(imdb_id, pool=None):
+    """
+    Get the number of reviews for a specific IMDb ID.
 
+    With a DriverPool the page is loaded in a pooled browser; otherwise a
+    browser is started for this call and quit afterwards. Returns None if the
+    count could not be read.
+    """
     try:
-        service = Service(chromedriver_path)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.get(url)
-
-        # Wait for reviews to load
-        driver.implicitly_wait(10)
-
-        # Get page source and parse with BeautifulSoup
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        driver.quit()
-
-        # Extract reviews count
-        total_reviews_element = soup.find("div", {"data-testid": "tturv-total-reviews"})
-        if total_reviews_element:
-            total_reviews_text = total_reviews_element.get_text(strip=True)
-            total_reviews = int(total_reviews_text.split()[0].replace(',', ''))  # Extract numeric part
-            return total_reviews
-        else:
-            logging.warning(f"Total reviews element not found for IMDb ID {imdb_id}.")
-            return 0
+        if pool is not None:
+            with pool.checkout() as driver:
+                return parse_reviews_count(driver, imdb_id)
+
+        driver = create_driver()
+        try:
+            return parse_reviews_count(driver, imdb_id)
+        finally:
+            driver.quit()
+    except FileNotFoundError as e:
+        logging.error(str(e))
+        return None
     except Exception as e:
         logging.error(f"Error fetching reviews for IMDb ID {imdb_id}: {e}")
-        return 0
+        return None
+
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """Create the S3 client once per process; boto3 clients are thread-safe."""
+    return boto3.client('s3')
 
 def save_to_s3(file_name, bucket_name, object_name=None):
     """Save a file to an S3 bucket."""
-    s3_client = boto3.client('s3')
+    s3_client = get_s3_client()
     try:
         if object_name is None:
             object_name = file_name
@@ -87,68 +129,128 @@ def save_to_s3(file_name, bucket_name, object_name=None):
 
 def download_from_s3(bucket_name, object_name, local_file):
     """Download a file from an S3 bucket."""
-    s3_client = boto3.client('s3')
+    s3_client = get_s3_client()
     try:
         s3_client.download_file(bucket_name, object_name, local_file)
         logging.info(f"File {object_name} downloaded from S3 bucket {bucket_name} to {local_file}.")
     except Exception as e:
         logging.error(f"An error occurred while downloading file from S3: {e}")
 
-def scrape_review(imdb_id, output_file):
-    """Scrape reviews for a single IMDb ID and save the result."""
-    reviews_count = get_reviews_count(imdb_id)
+def scrape_review(imdb_id, output_file, pool=None, rate_limiter=None, writer=None):
+    """
+    Scrape reviews for a single IMDb ID and save the result.
+
+    With a BufferedCsvWriter the row is queued for its writer thread; otherwise it is appended
+    to output_file directly. A failed count is saved as an empty value, never as 0, so only
+    confirmed zero-review titles are skipped later on.
+    """
+    if rate_limiter is not None:
+        rate_limiter.acquire()  # Wait for this worker's turn to hit IMDb
+    reviews_count = get_reviews_count(imdb_id, pool=pool)
+    if reviews_count is None:
+        reviews_count = ''
     logging.info(f"IMDb ID: {imdb_id}, Reviews Count: {reviews_count}")
+    if writer is not None:
+        writer.write([imdb_id, reviews_count])
+        return imdb_id
     with open(output_file, 'a', newline='') as f:
         writer = csv.writer(f)
         writer.writerow([imdb_id, reviews_count])
     return imdb_id
 
-def scrape_reviews(input_file, output_file, bucket_name=None, max_workers=5, save_interval=100, save_time_minutes=10):
-    """Scrape reviews for movies in the input file and save the results to the output file."""
+def read_imdb_ids(input_file, chunksize=10_000):
+    """Yield the IMDb IDs (tconst column) of a TSV file, reading it in chunks."""
+    for chunk in pd.read_csv(input_file, sep='\t', usecols=['tconst'], chunksize=chunksize):
+        yield from chunk['tconst']
+
+def scrape_reviews(input_file, output_file, bucket_name=None, max_workers=5, save_interval=100, save_time_minutes=10,
+                   requests_per_second=None, chunksize=10_000):
+    """
+    Scrape reviews for movies in the input file and save the results to the output file.
+
+    At most 2 * max_workers IDs are in flight at once, so memory stays flat however long the
+    input is, and a token bucket shared by the workers paces the requests to
+    requests_per_second in total. It defaults to REQUESTS_PER_SECOND_PER_WORKER * max_workers,
+    so adding workers adds throughput; pass a lower total to stay gentler on IMDb at the cost
+    of speed, since a total below that leaves the extra workers waiting on the bucket.
+    Results are handled as they complete. Rows are written by a
+    single buffered writer thread, and IDs already in output_file are skipped on restart.
+    Without a bucket_name the input file is read from the local disk.
+
+    While running, only the rows added since the last checkpoint are uploaded, as part files
+    under checkpoints/<output_file>/ tied together by a manifest.json; the complete file is
+    uploaded once, to output/<output_file>, at the end. If the local output file is missing or
+    shorter than the checkpoint, as on a fresh host, it is first restored from the checkpoint.
+    """
     logging.info("Starting the scraping process...")
     last_scraped_id = None
     start_time = datetime.now()
     processed_count = 0
+    # One long-lived browser per worker thread
+    pool = DriverPool(create_driver, size=max_workers, max_pages=DRIVER_MAX_PAGES)
+    if requests_per_second is None:
+        requests_per_second = REQUESTS_PER_SECOND_PER_WORKER * max_workers
+    logging.info(f"Pacing {max_workers} workers to {requests_per_second} requests/s in total.")
+    rate_limiter = TokenBucket(requests_per_second, capacity=1)
+    max_in_flight = 2 * max_workers
+    writer = None
+    checkpointer = None
 
     try:
-        # Ensure the output directory exists
-        output_dir = os.path.dirname(output_file)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        # Write header if the file does not exist
-        if not os.path.exists(output_file):
-            with open(output_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['IMDb ID', 'Number of Reviews'])  # Write header
-
         # Download the input file from S3
-        local_input_file = "local_input_file.tsv"
-        download_from_s3(bucket_name, input_file, local_input_file)
+        local_input_file = input_file
+        if bucket_name:
+            local_input_file = "local_input_file.tsv"
+            download_from_s3(bucket_name, input_file, local_input_file)
+            checkpointer = S3Checkpointer(bucket_name, f"checkpoints/{output_file}", s3_client=get_s3_client())
+            local_size = os.path.getsize(output_file) if os.path.exists(output_file) else 0
+            if local_size < checkpointer.uploaded_bytes:
+                # A fresh host (or a truncated file): resume from the checkpointed rows instead of
+                # starting a new part series that would overwrite them
+                logging.info(f"Restoring {output_file} from its S3 checkpoint.")
+                checkpointer.restore(output_file)
+
+        # Creates the output file with its header, or loads the IDs it already holds
+        writer = BufferedCsvWriter(output_file, header=['IMDb ID', 'Number of Reviews'])
 
-        # Read the input file
-        df = pd.read_csv(local_input_file, sep='\t')
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-            for index, row in df.iterrows():
-                imdb_id = row['tconst']
+            in_flight = set()
+
+            def handle_done(done):
+                nonlocal last_scraped_id, processed_count, start_time
+                for future in done:
+                    last_scraped_id = future.result()  # Get the last scraped IMDb ID
+                    processed_count += 1
+
+                    # Save to S3 after processing a certain number of IDs or after a certain amount of time
+                    if checkpointer and (processed_count % save_interval == 0 or (datetime.now() - start_time) > timedelta(minutes=save_time_minutes)):
+                        writer.checkpoint()  # Upload only rows that are safely on disk
+                        checkpointer.checkpoint(output_file)
+                        start_time = datetime.now()  # Reset the timer
+
+            skipped_count = 0
+            for imdb_id in read_imdb_ids(local_input_file, chunksize=chunksize):
+                if writer.is_completed(imdb_id):
+                    skipped_count += 1
+                    continue
+                # Keep the window bounded: wait for a result before submitting more
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    handle_done(done)
                 logging.info(f"Processing IMDb ID: {imdb_id}")
-                # Submit a task to the executor for each IMDb ID
-                futures.append(executor.submit(scrape_review, imdb_id, output_file))
-                time.sleep(random.uniform(1, 3))  # Introduce a random delay between requests
-                processed_count += 1
-
-                # Save to S3 after processing a certain number of IDs or after a certain amount of time
-                if processed_count % save_interval == 0 or (datetime.now() - start_time) > timedelta(minutes=save_time_minutes):
-                    save_to_s3(output_file, bucket_name, object_name=f"output/{output_file}")
-                    start_time = datetime.now()  # Reset the timer
-
-            # Wait for all futures to complete
-            for future in as_completed(futures):
-                last_scraped_id = future.result()  # Get the last scraped IMDb ID
+                in_flight.add(executor.submit(scrape_review, imdb_id, output_file, pool, rate_limiter, writer))
+
+            # Wait for the remaining futures to complete
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                handle_done(done)
+            logging.info(f"Skipped {skipped_count} IMDb IDs already in {output_file}.")
     except Exception as e:
         logging.error(f"An error occurred: {e}")
     finally:
+        pool.close()
+        if writer is not None:
+            writer.close()
         if last_scraped_id:
             logging.info(f"Saving last scraped IMDb ID: {last_scraped_id}")
             with open("last_scraped_id.txt", 'w') as f:
@@ -156,6 +258,11 @@ def scrape_reviews(input_file, output_file, bucket_name=None, max_workers=5, sav
             logging.info(f"Last scraped IMDb ID saved to last_scraped_id.txt")
 
         # Final save to S3 after all processing is complete
+        if checkpointer:
+            try:
+                checkpointer.checkpoint(output_file)
+            except Exception as e:
+                logging.error(f"An error occurred while checkpointing to S3: {e}")
         if bucket_name:
             save_to_s3(output_file, bucket_name, object_name=f"output/{output_file}")
 
@@ -166,6 +273,10 @@ if __name__ == "__main__":
     input_file = "input/filtered_ids_part_5.tsv"  # Replace with your input file path in S3
     output_file = "output/title_with_reviews5.csv"  # Replace with desired output file
     bucket_name = "reviewsimbd"  # Replace with your S3 bucket name
+    max_workers = 3
+    # Total rate shared by all workers; raise it with max_workers or the extra workers just wait
+    requests_per_second = REQUESTS_PER_SECOND_PER_WORKER * max_workers
 
-    scrape_reviews(input_file=input_file, output_file=output_file, bucket_name=bucket_name, max_workers=3)
+    scrape_reviews(input_file=input_file, output_file=output_file, bucket_name=bucket_name,
+                   max_workers=max_workers, requests_per_second=requests_per_second)
     print(f"Results saved to {output_file}")
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+This module defines the DriverPool class, a thread-safe pool of long-lived
+Selenium WebDrivers that worker threads check out and return instead of
+starting a new browser for every page.
+"""
+
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """A fixed-size pool of reusable WebDrivers."""
+
+    def __init__(self, driver_factory, size: int, max_pages: int = 200):
+        """
+        Initialize the pool. Drivers are started lazily, on first checkout.
+
+        Parameters:
+            driver_factory (callable): Returns a new WebDriver.
+            size (int): Maximum number of drivers alive at once, usually
+                        the number of worker threads.
+            max_pages (int): Pages a driver serves before it is quit and
+                             replaced with a fresh session.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        self.driver_factory = driver_factory
+        self.size = size
+        self.max_pages = max_pages
+        # Each slot holds [driver, pages served]; None drivers are started
+        # when checked out. LIFO hands out warm drivers first, so browsers
+        # are only started when all running ones are busy
+        self._idle = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put([None, 0])
+        self._lock = threading.Lock()
+        self._closed = False
+        self.drivers_started = 0
+        self.drivers_recycled = 0
+
+    @staticmethod
+    def _quit(driver) -> None:
+        """Quit a driver, ignoring errors from an already dead browser."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error while quitting WebDriver: {e}")
+
+    @contextmanager
+    def checkout(self):
+        """
+        Borrow a driver for one page, blocking until one is free.
+
+        A driver that raises a WebDriverException is assumed to have
+        crashed and is quit; its slot starts a new one on next checkout.
+        Drivers are also rotated after max_pages pages.
+
+        Yields:
+            WebDriver: The borrowed driver.
+        """
+        if self._closed:
+            raise RuntimeError("DriverPool is closed.")
+        slot = self._idle.get()
+        try:
+            if slot[0] is None:
+                slot[0] = self.driver_factory()
+                slot[1] = 0
+                with self._lock:
+                    self.drivers_started += 1
+            yield slot[0]
+            slot[1] += 1
+            if slot[1] >= self.max_pages:
+                logging.info(
+                    f"Rotating WebDriver after {slot[1]} pages."
+                )
+                self._quit(slot[0])
+                slot[0] = None
+        except WebDriverException:
+            if slot[0] is not None:
+                logging.warning("Recycling crashed WebDriver.")
+                self._quit(slot[0])
+                slot[0] = None
+                with self._lock:
+                    self.drivers_recycled += 1
+            raise
+        finally:
+            self._idle.put(slot)
+
+    def close(self) -> None:
+        """Quit every driver in the pool. Call once all workers finished."""
+        self._closed = True
+        while True:
+            try:
+                slot = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if slot[0] is not None:
+                self._quit(slot[0])
+        logging.info(
+            f"Closed DriverPool: {self.drivers_started} drivers started, "
+            f"{self.drivers_recycled} recycled after a crash."
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
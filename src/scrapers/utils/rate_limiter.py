@@ -0,0 +1,111 @@
+"""
+This module provides the request pacing helpers shared by the scrapers: a
+thread-safe token bucket (usable from threads and from asyncio), a
+per-host registry of buckets and a jittered exponential backoff.
+"""
+
+import time
+import random
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Token bucket that allows `rate` requests per second on average with
+    bursts of up to `capacity` requests.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Parameters:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum tokens stored. Defaults to rate (one
+                              second worth of burst), and at least 1.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = max(capacity if capacity else rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take one token and return how long the caller must wait for it.
+
+        Tokens may go negative: each caller reserves its slot in order, so
+        concurrent callers are spaced out instead of waking together.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is free."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class HostRateLimiter:
+    """Keep one TokenBucket per host so each site is paced separately."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Parameters:
+            rate (float): Requests per second allowed for every host.
+            capacity (float): Burst size of every host's bucket.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """Return the bucket of the host of url, creating it if needed."""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.capacity)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to the host of url is allowed."""
+        self.bucket_for(url).acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait until a request to the host of url is allowed."""
+        await self.bucket_for(url).acquire_async()
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Return a "full jitter" exponential backoff delay.
+
+    Parameters:
+        attempt (int): Number of the failed attempt, starting at 1.
+        base (float): Delay scale in seconds.
+        cap (float): Maximum delay in seconds.
+
+    Returns:
+        float: A random delay between 0 and min(cap, base * 2 **
+        (attempt - 1)), so retrying clients do not synchronize.
+    """
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
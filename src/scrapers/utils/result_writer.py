@@ -0,0 +1,183 @@
+"""
+This module defines the BufferedCsvWriter class: a single writer thread,
+fed by a queue, that appends result rows to a CSV file for many producer
+threads. Rows are written in batches and fsynced at checkpoints, and the
+IDs already in the file are remembered so restarts can skip them. Rows
+whose values are all empty record a failure and are retried instead.
+"""
+
+import os
+import csv
+import time
+import queue
+import logging
+import threading
+
+# Queue markers understood by the writer thread
+_CHECKPOINT = object()
+_STOP = object()
+
+
+class BufferedCsvWriter:
+    """Thread-safe, batched appender for CSV result rows keyed by ID."""
+
+    def __init__(
+        self,
+        output_file: str,
+        header: list[str],
+        flush_rows: int = 100,
+        flush_seconds: float = 5.0,
+    ):
+        """
+        Open the output file and start the writer thread.
+
+        Parameters:
+            output_file (str): CSV file to append to. The header is written
+                               if the file does not exist yet.
+            header (list[str]): Column names. The first column is the ID.
+            flush_rows (int): Buffered rows that trigger a write.
+            flush_seconds (float): Maximum time a row stays buffered.
+        """
+        self.output_file = output_file
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.completed_ids = set()
+        self.rows_written = 0
+
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        is_new = not os.path.exists(output_file) or \
+            os.path.getsize(output_file) == 0
+        if not is_new:
+            self._load_completed_ids()
+
+        self._file = open(output_file, 'a', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        if is_new:
+            self._writer.writerow(header)
+            self._file.flush()
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="csv-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _load_completed_ids(self) -> None:
+        """Read the IDs already in the file, dropping a torn last row."""
+        with open(self.output_file, 'rb+') as file:
+            # A crash mid-write can leave a last line without a newline
+            file.seek(0, os.SEEK_END)
+            size = file.tell()
+            file.seek(max(0, size - 1))
+            if file.read(1) != b'\n':
+                # Search backwards, block by block, for the last newline
+                content_end = 0
+                position = size
+                while position > 0:
+                    start = max(0, position - (1 << 16))
+                    file.seek(start)
+                    newline = file.read(position - start).rfind(b'\n')
+                    if newline >= 0:
+                        content_end = start + newline + 1
+                        break
+                    position = start
+                file.truncate(content_end)
+                logging.warning(
+                    f"Dropped an incomplete last row from "
+                    f"{self.output_file}."
+                )
+
+        with open(self.output_file, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip the header
+            for row in reader:
+                # A row without values records a failure: retry it
+                if row and any(row[1:]):
+                    self.completed_ids.add(row[0])
+        logging.info(
+            f"Found {len(self.completed_ids)} completed IDs in "
+            f"{self.output_file}."
+        )
+
+    def is_completed(self, row_id: str) -> bool:
+        """Return True if a row for row_id was already queued or saved."""
+        with self._lock:
+            return row_id in self.completed_ids
+
+    def write(self, row: list) -> None:
+        """Queue a row for writing. Safe to call from any thread."""
+        with self._lock:
+            self.completed_ids.add(str(row[0]))
+        self._queue.put(row)
+
+    def checkpoint(self) -> None:
+        """Block until every queued row is written and fsynced."""
+        done = threading.Event()
+        self._queue.put((_CHECKPOINT, done))
+        while not done.wait(timeout=1):
+            if not self._thread.is_alive():
+                raise RuntimeError(
+                    f"The writer thread of {self.output_file} stopped."
+                )
+
+    def close(self) -> None:
+        """Write the remaining rows, fsync and close the file."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if not self._file.closed:
+            self._file.close()
+        logging.info(
+            f"Closed {self.output_file} after writing "
+            f"{self.rows_written} rows."
+        )
+
+    def _flush(self, buffer: list, sync: bool = False) -> None:
+        """Write the buffered rows; fsync them if sync is True."""
+        if buffer:
+            self._writer.writerows(buffer)
+            self.rows_written += len(buffer)
+            buffer.clear()
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def _run(self) -> None:
+        """Writer thread: batch rows and flush them by count or time."""
+        buffer = []
+        deadline = None
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush(buffer)
+                deadline = None
+                continue
+
+            if item is _STOP:
+                self._flush(buffer, sync=True)
+                return
+            if isinstance(item, tuple) and item and item[0] is _CHECKPOINT:
+                self._flush(buffer, sync=True)
+                deadline = None
+                item[1].set()
+                continue
+
+            buffer.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_seconds
+            if len(buffer) >= self.flush_rows:
+                self._flush(buffer)
+                deadline = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,146 @@
+"""
+This module defines the S3Checkpointer class, which checkpoints a growing,
+append-only local file to S3 incrementally: each checkpoint uploads only
+the bytes added since the previous one as a new part object, and a
+manifest lists the parts in order so the file can be rebuilt. If the local
+file is replaced, a new series of parts is started under its own key
+prefix, so the parts of the previous series stay intact until the new
+manifest replaces the old one.
+"""
+
+import os
+import json
+import logging
+import boto3
+from botocore.exceptions import ClientError
+
+MANIFEST_NAME = "manifest.json"
+
+
+class S3Checkpointer:
+    """Incremental, append-only checkpoints of a local file in S3."""
+
+    def __init__(self, bucket_name: str, prefix: str, s3_client=None):
+        """
+        Initialize the checkpointer and load any manifest already in S3, so
+        a restarted run keeps appending parts after the last checkpoint.
+
+        Parameters:
+            bucket_name (str): Destination bucket.
+            prefix (str): Key prefix holding the parts and the manifest,
+                          e.g. "checkpoints/title_with_reviews5.csv".
+            s3_client: boto3 S3 client to reuse. One is created if omitted.
+        """
+        self.bucket_name = bucket_name
+        self.prefix = prefix.rstrip("/")
+        self.s3_client = s3_client or boto3.client('s3')
+        self.manifest = self._load_manifest()
+
+    @property
+    def manifest_key(self) -> str:
+        return f"{self.prefix}/{MANIFEST_NAME}"
+
+    def _part_key(self, index: int) -> str:
+        """Key of the index-th part of the current series."""
+        series = self.manifest.get("series", 0)
+        if series == 0:
+            return f"{self.prefix}/part-{index:06d}"
+        return f"{self.prefix}/series-{series:04d}/part-{index:06d}"
+
+    @property
+    def uploaded_bytes(self) -> int:
+        """Bytes of the local file already stored in S3."""
+        return self.manifest["size"]
+
+    def _load_manifest(self) -> dict:
+        """Fetch the manifest from S3, or start an empty one."""
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=self.manifest_key
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return {"series": 0, "size": 0, "parts": []}
+            raise
+        manifest = json.loads(response["Body"].read())
+        logging.info(
+            f"Resuming checkpoints of s3://{self.bucket_name}/{self.prefix} "
+            f"at {manifest['size']} bytes ({len(manifest['parts'])} parts)."
+        )
+        return manifest
+
+    def checkpoint(self, local_file: str) -> bool:
+        """
+        Upload the complete lines appended to local_file since the last
+        checkpoint as a new part, then update the manifest.
+
+        Parameters:
+            local_file (str): The append-only file to checkpoint.
+
+        Returns:
+            bool: True if a new part was uploaded.
+        """
+        size = os.path.getsize(local_file)
+        if size < self.uploaded_bytes:
+            # The file was replaced; earlier parts no longer match it. The
+            # new series gets new keys, so until its manifest is written
+            # the old manifest still points at complete, untouched parts
+            series = self.manifest.get("series", 0) + 1
+            logging.warning(
+                f"{local_file} is smaller than its checkpoint; starting "
+                f"checkpoint series {series}."
+            )
+            self.manifest = {"series": series, "size": 0, "parts": []}
+        if size == self.uploaded_bytes:
+            return False
+
+        with open(local_file, 'rb') as file:
+            file.seek(self.uploaded_bytes)
+            data = file.read(size - self.uploaded_bytes)
+        # Only ship whole lines; a partial last row waits for the next part
+        data = data[:data.rfind(b'\n') + 1]
+        if not data:
+            return False
+
+        part_key = self._part_key(len(self.manifest["parts"]))
+        self.s3_client.put_object(
+            Bucket=self.bucket_name, Key=part_key, Body=data
+        )
+        self.manifest["parts"].append({
+            "key": part_key,
+            "offset": self.uploaded_bytes,
+            "size": len(data)
+        })
+        self.manifest["size"] += len(data)
+        # The manifest is written last, so it only lists uploaded parts
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=self.manifest_key,
+            Body=json.dumps(self.manifest).encode("utf-8")
+        )
+        logging.info(
+            f"Checkpointed {len(data)} new bytes of {local_file} to "
+            f"s3://{self.bucket_name}/{part_key}."
+        )
+        return True
+
+    def restore(self, local_file: str) -> None:
+        """
+        Rebuild the checkpointed file by concatenating its parts.
+
+        Parameters:
+            local_file (str): Where to write the rebuilt file.
+        """
+        local_dir = os.path.dirname(local_file)
+        if local_dir:
+            os.makedirs(local_dir, exist_ok=True)
+        with open(local_file, 'wb') as file:
+            for part in self.manifest["parts"]:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name, Key=part["key"]
+                )
+                file.write(response["Body"].read())
+        logging.info(
+            f"Restored {self.uploaded_bytes} bytes from "
+            f"s3://{self.bucket_name}/{self.prefix} to {local_file}."
+        )
@@ -3,10 +3,12 @@ Módulo para el filtrado y comparación de IDs de películas.
 Proporciona funciones unificadas para manejar diferentes casos de filtrado de IDs.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Set, Tuple
+from typing import Tuple
 import logging
 import os
+from src.utils.id_sets import IdSet
 
 def compare_ids(
     file1: str,
@@ -15,9 +17,11 @@ def compare_ids(
     id_column2: str = 'tconst',
     sep1: str = '\t',
     sep2: str = '\t'
-) -> Tuple[Set[str], Set[str], Set[str]]:
+) -> Tuple[IdSet, IdSet, IdSet]:
     """
     Compara IDs entre dos archivos y retorna los conjuntos de IDs únicos y su diferencia.
+    Solo se lee la columna de ID, por bloques, y los IDs se guardan como enteros
+    en arrays ordenados (ver IdSet), que admiten len, in, iteración y -, &, |.
     
     Args:
         file1: Ruta al primer archivo de IDs
@@ -34,13 +38,9 @@ def compare_ids(
         - IDs que están en el primer archivo pero no en el segundo
     """
     try:
-        # Leer los archivos
-        df1 = pd.read_csv(file1, sep=sep1, dtype=str)
-        df2 = pd.read_csv(file2, sep=sep2, dtype=str)
-        
-        # Extraer IDs únicos
-        ids1 = set(df1[id_column1].str.strip().unique())
-        ids2 = set(df2[id_column2].str.strip().unique())
+        # Leer solo los IDs únicos de cada archivo
+        ids1 = IdSet.from_file(file1, id_column1, sep1)
+        ids2 = IdSet.from_file(file2, id_column2, sep2)
         
         # Calcular diferencia
         difference = ids1 - ids2
@@ -63,7 +63,9 @@ def filter_and_save_ids(
     filter_id_column: str = 'tconst',
     source_sep: str = '\t',
     filter_sep: str = '\t',
-    find_missing: bool = True
+    find_missing: bool = True,
+    join_source: bool = False,
+    chunksize: int = 1_000_000
 ) -> None:
     """
     Filtra IDs de un archivo fuente basado en un archivo de filtro y guarda el resultado.
@@ -78,15 +80,19 @@ def filter_and_save_ids(
         filter_sep: Separador del archivo de filtro
         find_missing: Si True, encuentra IDs en source pero no en filter.
                      Si False, encuentra IDs que están en ambos.
+        join_source: Si True, guarda las filas completas del archivo fuente
+                     (la primera aparición de cada ID, en el orden del archivo).
+                     Si False, guarda solo los IDs, ordenados por número.
+        chunksize: Filas leídas o escritas por bloque
+
+    La salida se escribe por bloques en un archivo temporal que se renombra al
+    terminar, y su orden no depende de la ejecución: dos ejecuciones con las
+    mismas entradas producen archivos idénticos byte a byte.
     """
     try:
-        # Leer los archivos
-        source_df = pd.read_csv(source_file, sep=source_sep, dtype=str)
-        filter_df = pd.read_csv(filter_file, sep=filter_sep, dtype=str)
-        
-        # Extraer IDs
-        source_ids = set(source_df[source_id_column].str.strip())
-        filter_ids = set(filter_df[filter_id_column].str.strip())
+        # Leer solo la columna de ID de cada archivo
+        source_ids = IdSet.from_file(source_file, source_id_column, source_sep)
+        filter_ids = IdSet.from_file(filter_file, filter_id_column, filter_sep)
         
         # Filtrar según el modo
         if find_missing:
@@ -108,15 +114,82 @@ def filter_and_save_ids(
         # Asegurar que el directorio existe
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        # Crear y guardar DataFrame con resultados
-        result_df = pd.DataFrame(list(filtered_ids), columns=[source_id_column])
-        result_df.to_csv(output_file, sep='\t', index=False)
-        logging.info(f"Resultados guardados en {output_file}")
+        # Escribir los resultados por bloques en un archivo temporal
+        tmp_file = f"{output_file}.tmp"
+        try:
+            with open(tmp_file, 'w', newline='', encoding='utf-8') as file:
+                if join_source:
+                    rows = _write_source_rows(
+                        file, filtered_ids, source_file, source_id_column,
+                        source_sep, chunksize
+                    )
+                else:
+                    rows = _write_ids(
+                        file, filtered_ids, source_id_column, chunksize
+                    )
+        except Exception:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        os.replace(tmp_file, output_file)
+        logging.info(f"{rows} resultados guardados en {output_file}")
         
     except Exception as e:
         logging.error(f"Error al filtrar y guardar IDs: {e}")
         raise
 
+def _write_ids(file, ids: IdSet, id_column: str, chunksize: int) -> int:
+    """Escribe los IDs ordenados en formato TSV, bloque a bloque."""
+    # La cabecera se escribe siempre, aunque no haya resultados
+    file.write(f"{id_column}\n")
+    rows = 0
+    for batch in ids.iter_batches(chunksize):
+        pd.DataFrame({id_column: batch}).to_csv(
+            file, sep='\t', index=False, header=False
+        )
+        rows += len(batch)
+    return rows
+
+def _write_source_rows(
+    file,
+    ids: IdSet,
+    source_file: str,
+    id_column: str,
+    sep: str,
+    chunksize: int
+) -> int:
+    """
+    Escribe en formato TSV las filas del archivo fuente cuyo ID está en ids,
+    recorriéndolo por bloques. Cada ID se escribe una sola vez.
+    """
+    # Marca los IDs ya escritos por su posición en ids.codes
+    written = np.zeros(len(ids.codes), dtype=bool)
+    written_others = set()
+    rows = 0
+    header = True
+    with pd.read_csv(
+        source_file, sep=sep, dtype=str, keep_default_na=False,
+        chunksize=chunksize
+    ) as reader:
+        for chunk in reader:
+            positions, in_others = ids.lookup(chunk[id_column])
+            keep = np.zeros(len(chunk), dtype=bool)
+            matched = np.flatnonzero(positions >= 0)
+            # Primera aparición de cada ID en el bloque que aún no se escribió
+            found, first = np.unique(positions[matched], return_index=True)
+            new = ~written[found]
+            written[found[new]] = True
+            keep[matched[first[new]]] = True
+            for row in np.flatnonzero(in_others):
+                imdb_id = chunk[id_column].iat[row].strip()
+                if imdb_id not in written_others:
+                    written_others.add(imdb_id)
+                    keep[row] = True
+            chunk[keep].to_csv(file, sep='\t', index=False, header=header)
+            header = False
+            rows += int(keep.sum())
+    return rows
+
 def main():
     """Ejemplo de uso de las funciones de filtrado."""
     # Configurar logging
@@ -0,0 +1,215 @@
+"""
+Conjuntos compactos de IDs de IMDb.
+
+Los IDs con forma ``ttNNNNNNN`` se codifican como enteros (ancho de la parte
+numérica * 10**12 + número) y se guardan en un array de NumPy ordenado y sin
+duplicados, de modo que las operaciones de conjuntos son operaciones
+vectorizadas sobre arrays en lugar de sets de cadenas de Python. El ancho
+forma parte del código, así que ``tt1`` y ``tt0000001`` siguen siendo IDs
+distintos y cada código se decodifica exactamente al ID original.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Iterable, Iterator
+
+ID_PREFIX = "tt"
+# La parte numérica de un ID debe caber en los 12 dígitos bajos del código
+_WIDTH_BASE = 10 ** 12
+_MAX_DIGITS = 12
+_ID_PATTERN = rf"{ID_PREFIX}[0-9]{{1,{_MAX_DIGITS}}}"
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def _sorted_unique(codes: np.ndarray) -> np.ndarray:
+    """Ordena y elimina duplicados (más rápido que np.unique con hash)."""
+    codes = np.sort(codes)
+    if len(codes) > 1:
+        codes = codes[np.concatenate(([True], codes[1:] != codes[:-1]))]
+    return codes
+
+
+def encode_ids(ids: pd.Series) -> tuple:
+    """
+    Codifica una serie de IDs como enteros.
+
+    Args:
+        ids: Serie de cadenas. Se eliminan espacios y valores nulos.
+
+    Returns:
+        Tuple con:
+        - Array int64 ordenado y sin duplicados con los IDs codificables
+        - Set con los IDs que no siguen el formato ``ttNNNNNNN``
+    """
+    ids = ids.dropna().astype(str).str.strip()
+    valid = ids.str.fullmatch(_ID_PATTERN).to_numpy(dtype=bool)
+    digits = ids[valid].str.slice(len(ID_PREFIX))
+    codes = (
+        digits.str.len().to_numpy(dtype=np.int64) * _WIDTH_BASE
+        + digits.astype(np.int64).to_numpy()
+    )
+    others = set(ids[~valid])
+    return _sorted_unique(codes), others
+
+
+def decode_ids(codes: np.ndarray) -> list:
+    """Convierte códigos enteros de nuevo en IDs ``ttNNNNNNN``."""
+    widths, values = np.divmod(codes, _WIDTH_BASE)
+    return [
+        f"{ID_PREFIX}{value:0{width}d}"
+        for width, value in zip(widths.tolist(), values.tolist())
+    ]
+
+
+class IdSet:
+    """
+    Conjunto inmutable de IDs respaldado por un array ordenado.
+
+    Se comporta como un set de cadenas para ``len``, ``in``, la iteración y
+    las operaciones ``-``, ``&`` y ``|``. Los IDs con otro formato se
+    guardan aparte en un set normal para que los resultados sean exactos.
+    """
+
+    def __init__(self, codes: np.ndarray = None, others: Iterable = ()):
+        """
+        Args:
+            codes: Array int64 ordenado y sin duplicados (ver encode_ids)
+            others: IDs que no siguen el formato ``ttNNNNNNN``
+        """
+        self.codes = _EMPTY if codes is None else codes
+        self.others = frozenset(others)
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[str]) -> "IdSet":
+        """Crea un conjunto a partir de cualquier iterable de IDs."""
+        codes, others = encode_ids(pd.Series(list(ids), dtype=object))
+        return cls(codes, others)
+
+    @classmethod
+    def from_file(
+        cls,
+        file_path: str,
+        id_column: str = 'tconst',
+        sep: str = '\t',
+        chunksize: int = 1_000_000
+    ) -> "IdSet":
+        """
+        Lee solo la columna de ID de un archivo, por bloques.
+
+        Args:
+            file_path: Ruta al archivo
+            id_column: Nombre de la columna de ID
+            sep: Separador del archivo
+            chunksize: Filas leídas por bloque
+
+        Returns:
+            IdSet con los IDs únicos del archivo
+        """
+        parts = []
+        others = set()
+        with pd.read_csv(
+            file_path, sep=sep, usecols=[id_column], dtype=str,
+            keep_default_na=False, chunksize=chunksize
+        ) as reader:
+            for chunk in reader:
+                codes, chunk_others = encode_ids(chunk[id_column])
+                parts.append(codes)
+                others |= chunk_others
+        others.discard('')
+        codes = _sorted_unique(np.concatenate(parts)) if parts else _EMPTY
+        return cls(codes, others)
+
+    def __len__(self) -> int:
+        return len(self.codes) + len(self.others)
+
+    def __contains__(self, imdb_id) -> bool:
+        if not isinstance(imdb_id, str):
+            return False
+        codes, others = encode_ids(pd.Series([imdb_id], dtype=object))
+        if len(codes) == 0:
+            return bool(others) and imdb_id.strip() in self.others
+        position = np.searchsorted(self.codes, codes[0])
+        return bool(
+            position < len(self.codes) and self.codes[position] == codes[0]
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        """Recorre los IDs en orden de código y después los demás."""
+        for batch in self.iter_batches():
+            yield from batch
+
+    def iter_batches(self, batch_size: int = 100_000) -> Iterator[list]:
+        """
+        Recorre los IDs en listas de hasta batch_size elementos, en un orden
+        determinista: primero por código (ancho y número) y después los IDs
+        con otro formato, ordenados como cadenas.
+        """
+        for start in range(0, len(self.codes), batch_size):
+            yield decode_ids(self.codes[start:start + batch_size])
+        others = sorted(self.others)
+        for start in range(0, len(others), batch_size):
+            yield others[start:start + batch_size]
+
+    def lookup(self, ids: pd.Series) -> tuple:
+        """
+        Busca de forma vectorizada una serie de IDs en el conjunto.
+
+        Args:
+            ids: Serie de IDs (se eliminan espacios)
+
+        Returns:
+            Tuple con:
+            - Array con la posición de cada ID en self.codes, o -1
+            - Array booleano que marca los IDs encontrados en self.others
+        """
+        ids = ids.astype(str).str.strip()
+        valid = ids.str.fullmatch(_ID_PATTERN).fillna(False).to_numpy(
+            dtype=bool
+        )
+        positions = np.full(len(ids), -1, dtype=np.int64)
+        if valid.any() and len(self.codes):
+            digits = ids[valid].str.slice(len(ID_PREFIX))
+            codes = (
+                digits.str.len().to_numpy(dtype=np.int64) * _WIDTH_BASE
+                + digits.astype(np.int64).to_numpy()
+            )
+            found = np.searchsorted(self.codes, codes)
+            found[found == len(self.codes)] = 0
+            found[self.codes[found] != codes] = -1
+            positions[valid] = found
+        in_others = ~valid & ids.isin(self.others).to_numpy(dtype=bool)
+        return positions, in_others
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IdSet):
+            return NotImplemented
+        return np.array_equal(self.codes, other.codes) \
+            and self.others == other.others
+
+    def __repr__(self) -> str:
+        return f"IdSet({len(self)} IDs)"
+
+    def difference(self, other: "IdSet") -> "IdSet":
+        """IDs de este conjunto que no están en other."""
+        return IdSet(
+            np.setdiff1d(self.codes, other.codes, assume_unique=True),
+            self.others - other.others
+        )
+
+    def intersection(self, other: "IdSet") -> "IdSet":
+        """IDs presentes en ambos conjuntos."""
+        return IdSet(
+            np.intersect1d(self.codes, other.codes, assume_unique=True),
+            self.others & other.others
+        )
+
+    def union(self, other: "IdSet") -> "IdSet":
+        """IDs presentes en alguno de los dos conjuntos."""
+        return IdSet(
+            np.union1d(self.codes, other.codes),
+            self.others | other.others
+        )
+
+    __sub__ = difference
+    __and__ = intersection
+    __or__ = union
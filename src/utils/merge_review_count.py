@@ -1,36 +1,162 @@
 import os
+import csv
+import json
+import heapq
+import logging
+import tempfile
 import pandas as pd
 
-def merge_review_counts(input_folder, output_file):
-    """Merge all review count files in the input folder and write a unique ID file with review counts."""
-    all_data = []
+ID_COLUMN = 'IMDb ID'
+COUNT_COLUMN = 'Number of Reviews'
 
-    # Iterate over all files in the input folder
-    for filename in os.listdir(input_folder):
-        if filename.endswith(".csv"):
-            file_path = os.path.join(input_folder, filename)
-            # Read the CSV file
-            df = pd.read_csv(file_path)
-            all_data.append(df)
 
-    # Concatenate all dataframes
-    merged_df = pd.concat(all_data, ignore_index=True)
+def _state_file(output_file):
+    """Path of the file recording which shards are merged into output_file."""
+    return f"{output_file}.state.json"
 
-    # Drop duplicate IDs, keeping the first occurrence
-    unique_df = merged_df.drop_duplicates(subset=['IMDb ID'])
 
-    # Ensure only the necessary columns are written to the output file
-    unique_df = unique_df[['IMDb ID', 'Number of Reviews']]
+def _file_signature(file_path):
+    """Size and modification time, used to detect a changed shard file."""
+    stat = os.stat(file_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
 
-    # Fill NaN values with 0 and convert the 'Number of Reviews' column to integers
-    unique_df['Number of Reviews'] = unique_df['Number of Reviews'].fillna(0).astype(int)
 
-    # Write the unique IDs and review counts to the output file
-    unique_df.to_csv(output_file, index=False)
-    print(f"Unique ID and review counts saved to {output_file}")
+def _write_sorted_runs(file_path, runs_dir, chunksize):
+    """
+    Split one shard file into sorted run files of at most chunksize rows.
+
+    Within a run the rows are sorted by ID and deduplicated keeping the first
+    occurrence with a known count, so the run order plus a stable merge keeps
+    the first known count overall.
+
+    Returns:
+        list[str]: The run file paths, in input order.
+    """
+    runs = []
+    with pd.read_csv(
+        file_path, usecols=[ID_COLUMN, COUNT_COLUMN], dtype={ID_COLUMN: str},
+        chunksize=chunksize
+    ) as reader:
+        for chunk in reader:
+            chunk[ID_COLUMN] = chunk[ID_COLUMN].str.strip()
+            chunk = chunk[chunk[ID_COLUMN].fillna('') != '']
+            # Missing or invalid counts (failed lookups) stay blank, not 0
+            chunk[COUNT_COLUMN] = pd.to_numeric(
+                chunk[COUNT_COLUMN], errors='coerce'
+            ).astype('Int64')
+            # Known counts first: a failed lookup must not hide a later count
+            chunk = chunk.iloc[
+                chunk[COUNT_COLUMN].isna().to_numpy().argsort(kind='stable')
+            ]
+            chunk = chunk.drop_duplicates(subset=[ID_COLUMN]).sort_values(
+                ID_COLUMN, kind='stable'
+            )
+            run_file = os.path.join(runs_dir, f"run_{len(os.listdir(runs_dir)):06d}.csv")
+            chunk.to_csv(run_file, index=False, header=False)
+            runs.append(run_file)
+    return runs
+
+
+def _read_run(run_file, has_header=False):
+    """Yield the (ID, count) rows of a sorted run file."""
+    with open(run_file, 'r', newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        if has_header:
+            next(reader, None)
+        for row in reader:
+            if row:
+                yield row[0], row[1]
+
+
+def merge_review_counts(input_folder, output_file, chunksize=1_000_000, incremental=True):
+    """
+    Merge all review count files in the input folder and write a unique ID file with review counts.
+
+    Each file is split into sorted runs of at most chunksize rows, and the runs are
+    combined with a k-way merge, so memory does not grow with the number of rows.
+    Files are taken in name order and the first occurrence of an ID with a known count
+    wins; IDs whose lookups all failed keep a blank count. The output is sorted by IMDb ID.
+
+    With incremental=True, the merged files are recorded in a state file next to the
+    output. A later call only merges the new files into the existing output; if a
+    merged file changed or disappeared, everything is merged again.
+
+    Parameters:
+        input_folder (str): Folder with the review count CSV files.
+        output_file (str): Path of the merged CSV file.
+        chunksize (int): Rows per sorted run.
+        incremental (bool): Reuse the existing output and state file.
+
+    Returns:
+        int: The number of unique IDs in the output file.
+    """
+    files = sorted(
+        filename for filename in os.listdir(input_folder)
+        if filename.endswith(".csv")
+    )
+    signatures = {
+        filename: _file_signature(os.path.join(input_folder, filename))
+        for filename in files
+    }
+
+    merged = {}
+    state_file = _state_file(output_file)
+    if incremental and os.path.exists(state_file) and os.path.exists(output_file):
+        with open(state_file, 'r', encoding='utf-8') as file:
+            merged = json.load(file).get("files", {})
+        if any(signatures.get(name) != signature for name, signature in merged.items()):
+            logging.warning("Merged review count files changed; merging everything again.")
+            merged = {}
+    new_files = [filename for filename in files if filename not in merged]
+    if merged and not new_files:
+        logging.info(f"No new review count files; {output_file} is up to date.")
+        with open(output_file, 'r', encoding='utf-8') as file:
+            return sum(1 for _ in file) - 1
+
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    os.makedirs(output_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=output_dir) as runs_dir:
+        # The existing output holds the earlier files, so it goes first
+        runs = [_read_run(output_file, has_header=True)] if merged else []
+        for filename in new_files:
+            for run_file in _write_sorted_runs(
+                os.path.join(input_folder, filename), runs_dir, chunksize
+            ):
+                runs.append(_read_run(run_file))
+
+        # heapq.merge is stable, so equal IDs come out in run order; a blank
+        # (failed) count is replaced by the first known one
+        tmp_file = f"{output_file}.tmp"
+        unique_ids = 0
+        with open(tmp_file, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow([ID_COLUMN, COUNT_COLUMN])
+            last_id, last_count = None, None
+            for imdb_id, count in heapq.merge(*runs, key=lambda row: row[0]):
+                if imdb_id != last_id:
+                    if last_id is not None:
+                        writer.writerow([last_id, last_count])
+                    last_id, last_count = imdb_id, count
+                    unique_ids += 1
+                elif not last_count:
+                    last_count = count
+            if last_id is not None:
+                writer.writerow([last_id, last_count])
+        os.replace(tmp_file, output_file)
+
+    merged.update({filename: signatures[filename] for filename in new_files})
+    with open(state_file, 'w', encoding='utf-8') as file:
+        json.dump({"files": merged}, file, indent=2)
+
+    logging.info(
+        f"Merged {len(new_files)} review count files; {unique_ids} unique IDs "
+        f"and review counts saved to {output_file}"
+    )
+    return unique_ids
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     input_folder = "data/reviews_count"  # Path to the folder containing review count files
     output_file = "data/unique_review_counts4.csv"  # Path to the output CSV file
 
-    merge_review_counts(input_folder, output_file)
\ No newline at end of file
+    merge_review_counts(input_folder, output_file)
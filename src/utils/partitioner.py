@@ -0,0 +1,166 @@
+"""
+This module defines partition_tsv, a streaming partitioner that splits a
+TSV file into many output files in a single pass. Rows are copied line by
+line through buffered file handles, so memory stays constant whatever the
+size of the input.
+"""
+
+import os
+import zlib
+import logging
+
+PARTITION_MODES = ("column", "hash", "round_robin", "assigned")
+
+
+class _PartitionWriter:
+    """Buffered output handles, one per partition, written atomically."""
+
+    def __init__(self, output_folder: str, header: str, buffer_size: int):
+        self.output_folder = output_folder
+        self.header = header
+        self.buffer_size = buffer_size
+        self.handles = {}
+        self.rows = {}
+
+    def path(self, file_name: str) -> str:
+        return os.path.join(self.output_folder, file_name)
+
+    def open(self, file_name: str):
+        """Return the handle of file_name, creating it on first use."""
+        handle = self.handles.get(file_name)
+        if handle is None:
+            handle = open(
+                self.path(file_name) + ".tmp", 'w', encoding='utf-8',
+                newline='', buffering=self.buffer_size
+            )
+            handle.write(self.header)
+            self.handles[file_name] = handle
+            self.rows[file_name] = 0
+        return handle
+
+    def write(self, file_name: str, line: str) -> None:
+        self.open(file_name).write(line)
+        self.rows[file_name] += 1
+
+    def close(self, commit: bool) -> None:
+        """Close every handle; publish the files only if commit is True."""
+        for file_name, handle in self.handles.items():
+            handle.close()
+            tmp_path = self.path(file_name) + ".tmp"
+            if commit:
+                os.replace(tmp_path, self.path(file_name))
+            else:
+                os.remove(tmp_path)
+
+
+def partition_tsv(
+    input_file: str,
+    output_folder: str,
+    mode: str = "round_robin",
+    num_parts: int = 8,
+    column: str = "tconst",
+    file_name: str = "part_{}.tsv",
+    buffer_size: int = 1 << 20,
+    assignments=None,
+) -> dict:
+    """
+    Split a TSV file into several TSV files in one streaming pass. Each
+    output file gets the input header.
+
+    Parameters:
+        input_file (str): TSV file with a header row.
+        output_folder (str): Folder for the output files. Created if needed.
+        mode (str): How rows are assigned to outputs:
+                    "column": one file per distinct value of column, e.g.
+                    one file per title type;
+                    "hash": num_parts files by a stable hash of column, so
+                    an ID always lands in the same part;
+                    "round_robin": num_parts files of balanced size, row i
+                    going to part i % num_parts;
+                    "assigned": row i goes to part assignments[i] + 1.
+        num_parts (int): Number of parts for "hash", "round_robin" and
+                         "assigned".
+        column (str): Key column for "column" and "hash".
+        file_name (str): Output file name pattern. It is formatted with the
+                         column value, or with the 1-based part number.
+        buffer_size (int): Write buffer size of each output handle.
+        assignments (array-like): 0-based part of each non-empty data row,
+                                  for "assigned".
+
+    Returns:
+        dict: Rows written to each output file path.
+    """
+    if mode not in PARTITION_MODES:
+        raise ValueError(
+            f"Unknown partition mode '{mode}'; expected one of "
+            f"{', '.join(PARTITION_MODES)}."
+        )
+    if mode != "column" and num_parts < 1:
+        raise ValueError("num_parts must be at least 1.")
+    if mode == "assigned" and assignments is None:
+        raise ValueError("The assigned mode needs assignments.")
+
+    os.makedirs(output_folder, exist_ok=True)
+    with open(input_file, 'r', encoding='utf-8', newline='') as source:
+        header = source.readline()
+        if not header:
+            raise ValueError(f"{input_file} is empty.")
+        if not header.endswith('\n'):
+            header += '\n'
+        writer = _PartitionWriter(output_folder, header, buffer_size)
+
+        key_index = None
+        if mode in ("column", "hash"):
+            columns = header.rstrip('\r\n').split('\t')
+            if column not in columns:
+                raise ValueError(f"Column '{column}' not in {input_file}.")
+            key_index = columns.index(column)
+        if mode != "column":
+            # Every part exists, even if it ends up with no rows
+            part_names = [
+                file_name.format(part) for part in range(1, num_parts + 1)
+            ]
+            for part_name in part_names:
+                writer.open(part_name)
+
+        committed = False
+        try:
+            row = 0
+            for line in source:
+                if not line.strip():
+                    continue
+                if not line.endswith('\n'):
+                    line += '\n'
+                if mode == "round_robin":
+                    target = part_names[row % num_parts]
+                elif mode == "assigned":
+                    target = part_names[assignments[row]]
+                else:
+                    key = line.rstrip('\r\n').split(
+                        '\t', key_index + 1
+                    )[key_index]
+                    if mode == "hash":
+                        target = part_names[
+                            zlib.crc32(key.encode('utf-8')) % num_parts
+                        ]
+                    else:
+                        target = file_name.format(
+                            key.replace(os.sep, '_')
+                        )
+                writer.write(target, line)
+                row += 1
+            if mode == "assigned" and row != len(assignments):
+                raise ValueError(
+                    f"{input_file} has {row} rows but {len(assignments)} "
+                    f"assignments were given."
+                )
+            committed = True
+        finally:
+            writer.close(commit=committed)
+
+    rows = {writer.path(name): count for name, count in writer.rows.items()}
+    logging.info(
+        f"Partitioned {sum(rows.values())} rows of {input_file} into "
+        f"{len(rows)} files in {output_folder}."
+    )
+    return rows
@@ -1,5 +1,8 @@
 import os
+import time
+import sqlite3
 import logging
+import threading
 
 
 class ProgressManager:
@@ -113,3 +116,123 @@ class ProgressManager:
             with open(filepath, 'r', encoding='utf-8') as file:
                 return file.read().strip()
         return None
+
+
+class ProgressLedger:
+    """
+    Durable per-ID completion ledger for scraping runs.
+
+    Completed IMDb IDs are stored in a SQLite database in WAL mode, keyed
+    by (dataset, imdb_id), so several datasets, threads and processes can
+    share one ledger. Marks are buffered and committed in batches, and
+    "already done?" lookups are answered from an in-memory set.
+    """
+
+    def __init__(
+        self, ledger_path: str = "scrape_progress.db", batch_size: int = 100
+    ):
+        """
+        Open (or create) the ledger.
+
+        Args:
+            ledger_path (str): SQLite database file.
+                               Defaults to "scrape_progress.db".
+            batch_size (int): Marks buffered before a commit.
+                              Defaults to 100.
+        """
+        self.ledger_path = ledger_path
+        self.batch_size = batch_size
+        self._pending = []
+        self._completed = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(ledger_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(
+            ledger_path, timeout=60, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS completed ("
+            " dataset TEXT NOT NULL,"
+            " imdb_id TEXT NOT NULL,"
+            " completed_at INTEGER NOT NULL,"
+            " PRIMARY KEY (dataset, imdb_id)) WITHOUT ROWID"
+        )
+        self.connection.commit()
+
+    def _ids_of(self, dataset_name: str) -> set:
+        """Return the in-memory set of a dataset, loading it on first use."""
+        if dataset_name not in self._completed:
+            rows = self.connection.execute(
+                "SELECT imdb_id FROM completed WHERE dataset = ?",
+                (dataset_name,)
+            )
+            self._completed[dataset_name] = {row[0] for row in rows}
+        return self._completed[dataset_name]
+
+    def completed_ids(self, dataset_name: str) -> set[str]:
+        """
+        Return the IMDb IDs completed for a dataset.
+
+        Args:
+            dataset_name (str): The dataset name.
+
+        Returns:
+            set[str]: A copy of the completed IDs.
+        """
+        with self._lock:
+            return set(self._ids_of(dataset_name))
+
+    def is_done(self, dataset_name: str, imdb_id: str) -> bool:
+        """Return True if imdb_id is completed for the dataset."""
+        with self._lock:
+            return imdb_id in self._ids_of(dataset_name)
+
+    def mark_done(self, dataset_name: str, imdb_id: str) -> None:
+        """
+        Record imdb_id as completed, committing once batch_size marks are
+        pending.
+
+        Args:
+            dataset_name (str): The dataset name.
+            imdb_id (str): The completed IMDb ID.
+        """
+        with self._lock:
+            ids = self._ids_of(dataset_name)
+            if imdb_id in ids:
+                return
+            ids.add(imdb_id)
+            self._pending.append((dataset_name, imdb_id, time.time_ns()))
+            if len(self._pending) >= self.batch_size:
+                self._commit()
+
+    def commit(self) -> None:
+        """Write the pending marks to the database."""
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
+        if not self._pending:
+            return
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO completed (dataset, imdb_id, completed_at) "
+            "VALUES (?, ?, ?)",
+            self._pending
+        )
+        self.connection.commit()
+        logging.info(f"Committed {len(self._pending)} IDs to the ledger.")
+        self._pending = []
+
+    def close(self) -> None:
+        """Commit the pending marks and close the database."""
+        self.commit()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
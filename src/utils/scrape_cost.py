@@ -0,0 +1,196 @@
+"""
+This module estimates the cost of scraping a movie's reviews from the review
+counts produced by numberReviews and merge_review_counts, and uses it to
+plan the scrape queue: titles without reviews are dropped and the rest are
+ordered by expected page cost.
+"""
+
+import heapq
+import logging
+import numpy as np
+import pandas as pd
+
+REVIEWS_PER_PAGE = 25
+ORDERS = ("input", "cheapest", "costliest")
+
+
+def load_review_counts(
+    counts_file: str,
+    id_column: str = 'IMDb ID',
+    count_column: str = 'Number of Reviews',
+) -> pd.Series:
+    """
+    Load a review count table, such as unique_review_counts.csv.
+
+    Parameters:
+        counts_file (str): CSV file with one row per IMDb ID.
+        id_column (str): Column holding the IMDb IDs.
+        count_column (str): Column holding the number of reviews.
+
+    Returns:
+        pd.Series: Review counts (float64) indexed by IMDb ID. Blank or
+                   invalid counts, left by failed lookups, are NaN so they
+                   stay unknown rather than zero. For repeated IDs the
+                   first row wins.
+    """
+    counts = pd.read_csv(
+        counts_file, usecols=[id_column, count_column],
+        dtype={id_column: str}
+    )
+    counts[id_column] = counts[id_column].str.strip()
+    counts = counts.drop_duplicates(subset=[id_column])
+    review_counts = pd.Series(
+        pd.to_numeric(counts[count_column], errors='coerce')
+        .to_numpy(dtype=float),
+        index=pd.Index(counts[id_column].to_numpy(), name='imdb_id'),
+        name='review_count'
+    )
+    logging.info(
+        "Loaded review counts of %d titles from %s.",
+        len(review_counts), counts_file
+    )
+    return review_counts
+
+
+def estimate_page_cost(review_counts) -> np.ndarray:
+    """
+    Expected number of page loads to scrape titles with the given review
+    counts: the first review page plus one page per further batch of
+    REVIEWS_PER_PAGE reviews ("All" button loads or pagination requests).
+    Titles without reviews cost nothing, as they are not scraped.
+
+    Parameters:
+        review_counts (array-like): Review counts; NaN means unknown.
+
+    Returns:
+        np.ndarray: The cost of each title (float, NaN if unknown).
+    """
+    counts = np.asarray(review_counts, dtype=float)
+    cost = 1 + np.ceil(np.maximum(counts - REVIEWS_PER_PAGE, 0)
+                       / REVIEWS_PER_PAGE)
+    cost[counts <= 0] = 0
+    return cost
+
+
+def plan_scrape(
+    movie_list: pd.DataFrame,
+    review_counts: pd.Series,
+    order: str = "cheapest",
+    min_reviews: int = 1,
+) -> pd.DataFrame:
+    """
+    Drop titles with fewer than min_reviews reviews and order the rest by
+    expected page cost.
+
+    Titles missing from review_counts are kept and placed last, since
+    nothing is known about them. The sort is stable, so the same inputs
+    always give the same queue and resuming from a saved ID still works.
+
+    Parameters:
+        movie_list (pd.DataFrame): Movies with an 'imdb_id' column.
+        review_counts (pd.Series): Review counts indexed by IMDb ID, as
+                                   returned by load_review_counts.
+        order (str): "cheapest" first, to finish the most titles early;
+                     "costliest" first; or "input" to keep the list order.
+        min_reviews (int): Titles with fewer known reviews are skipped.
+
+    Returns:
+        pd.DataFrame: The planned movie list.
+    """
+    if order not in ORDERS:
+        raise ValueError(
+            f"Unknown order '{order}'; expected one of {', '.join(ORDERS)}."
+        )
+    counts = review_counts.reindex(movie_list['imdb_id'].to_numpy())
+    known = counts.notna().to_numpy()
+    keep = ~known | (counts.to_numpy() >= min_reviews)
+    planned = movie_list[keep]
+    cost = estimate_page_cost(counts.to_numpy()[keep])
+    logging.info(
+        "Review count precheck: skipping %d titles with fewer than %d "
+        "reviews; %d titles left (%d without a known count), about %d "
+        "pages.",
+        len(movie_list) - len(planned), min_reviews, len(planned),
+        int((~known[keep]).sum()), int(np.nansum(cost))
+    )
+
+    if order == "input" or len(planned) == 0:
+        return planned
+    sort_key = cost if order == "cheapest" else -cost
+    # NaN (unknown) sorts last with a stable mergesort
+    return planned.iloc[np.argsort(sort_key, kind='stable')]
+
+
+def balance_shards(costs, num_shards: int) -> np.ndarray:
+    """
+    Assign items to shards so that every shard gets about the same total
+    cost, with greedy longest-processing-time bin packing: items are taken
+    from the most to the least expensive and each goes to the shard with
+    the lowest total so far. Ties are broken by position, so the result is
+    deterministic.
+
+    Parameters:
+        costs (array-like): The cost of each item.
+        num_shards (int): Number of shards.
+
+    Returns:
+        np.ndarray: The 0-based shard of each item.
+    """
+    if num_shards < 1:
+        raise ValueError("num_shards must be at least 1.")
+    costs = np.asarray(costs, dtype=float)
+    assignments = np.empty(len(costs), dtype=np.int32)
+    cost_list = costs.tolist()
+    loads = [(0.0, shard) for shard in range(num_shards)]
+    for item in np.argsort(-costs, kind='stable').tolist():
+        load, shard = loads[0]
+        assignments[item] = shard
+        heapq.heapreplace(loads, (load + cost_list[item], shard))
+    return assignments
+
+
+def unknown_id_cost(review_counts: pd.Series) -> float:
+    """
+    Expected page cost assumed for a title without a known review count:
+    the mean cost, of at least one page, of the titles in review_counts
+    with a known count, or 1 if there are none.
+
+    Parameters:
+        review_counts (pd.Series): Review counts indexed by IMDb ID.
+
+    Returns:
+        float: The fallback cost.
+    """
+    cost = estimate_page_cost(review_counts.to_numpy(dtype=float))
+    known = ~np.isnan(cost)
+    return float(np.maximum(cost[known], 1).mean()) if known.any() else 1.0
+
+
+def estimate_id_costs(
+    imdb_ids,
+    review_counts: pd.Series,
+    unknown_cost: float = None,
+) -> np.ndarray:
+    """
+    Expected page cost of each IMDb ID for shard balancing. Every title
+    costs at least its first page load, and titles without a known count
+    get unknown_cost.
+
+    Parameters:
+        imdb_ids (array-like): IMDb IDs.
+        review_counts (pd.Series): Review counts indexed by IMDb ID.
+        unknown_cost (float): Cost of unknown titles. Defaults to
+                              unknown_id_cost(review_counts); pass it in
+                              when costing the IDs chunk by chunk, so every
+                              chunk uses the same value.
+
+    Returns:
+        np.ndarray: The cost of each ID.
+    """
+    if unknown_cost is None:
+        unknown_cost = unknown_id_cost(review_counts)
+    cost = np.maximum(estimate_page_cost(
+        review_counts.reindex(np.asarray(imdb_ids)).to_numpy(dtype=float)
+    ), 1)
+    cost[np.isnan(cost)] = unknown_cost
+    return cost
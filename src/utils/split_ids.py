@@ -1,37 +1,125 @@
-import pandas as pd
-import os
+import logging
+import numpy as np
+from src.utils.partitioner import partition_tsv
+from src.utils.scrape_cost import (
+    load_review_counts,
+    estimate_id_costs,
+    unknown_id_cost,
+    balance_shards
+)
 
-def split_ids(input_file, output_folder, num_splits=8):
-    """Split the IDs in the input file into multiple files."""
+def _read_id_chunks(input_file, chunksize, column="tconst"):
+    """
+    Yield the values of column in chunks of at most chunksize rows.
+
+    Lines are read exactly as partition_tsv reads them: no quote handling,
+    and blank lines skipped, so the i-th value belongs to the i-th row that
+    partition_tsv writes.
+    """
+    with open(input_file, 'r', encoding='utf-8', newline='') as source:
+        header = source.readline().rstrip('\r\n').split('\t')
+        if column not in header:
+            raise ValueError(f"Column '{column}' not in {input_file}.")
+        key_index = header.index(column)
+        chunk = []
+        for line in source:
+            if not line.strip():
+                continue
+            fields = line.rstrip('\r\n').split('\t', key_index + 1)
+            chunk.append(
+                fields[key_index].strip() if len(fields) > key_index else ''
+            )
+            if len(chunk) >= chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+def split_ids(
+    input_file,
+    output_folder,
+    num_splits=8,
+    mode="contiguous",
+    review_counts_file=None,
+    chunksize=1_000_000
+):
+    """
+    Split the IDs in the input file into multiple files, streaming the
+    rows instead of loading the file.
+
+    With review_counts_file (e.g., the merge_review_counts output), the
+    splits are balanced by expected scrape cost instead of row count: a
+    first pass reads the tconst column and packs the titles into splits of
+    equal expected work (see scrape_cost.balance_shards), and a second pass
+    writes the rows, keeping their input order within each split.
+
+    Parameters:
+        input_file (str): TSV file with the IDs.
+        output_folder (str): Folder to save the split files.
+        num_splits (int): Number of split files.
+        mode (str): "contiguous" for consecutive blocks of
+                    len // num_splits rows, the last split taking the
+                    remainder (a first pass counts the rows);
+                    "round_robin" for balanced splits; or "hash" to always
+                    send the same tconst to the same split. Ignored when
+                    review_counts_file is given.
+        review_counts_file (str): Review count CSV used to balance cost.
+        chunksize (int): Rows read per chunk in the first pass.
+
+    Returns:
+        dict: Rows written to each split file, or None on error.
+    """
     try:
-        # Read the input file
-        df = pd.read_csv(input_file, sep='\t')
-        
-        # Calculate the number of rows per split
-        num_rows = len(df)
-        rows_per_split = num_rows // num_splits
-        
-        # Ensure the output folder exists
-        if not os.path.exists(output_folder):
-            os.makedirs(output_folder)
-        
-        # Split the DataFrame and save each part to a new file
-        for i in range(num_splits):
-            start_idx = i * rows_per_split
-            if i == num_splits - 1:  # Last split takes the remainder
-                end_idx = num_rows
+        assignments = None
+        if review_counts_file:
+            review_counts = load_review_counts(review_counts_file)
+            # One fallback for all chunks, so chunksize does not matter
+            unknown_cost = unknown_id_cost(review_counts)
+            costs = np.concatenate([
+                estimate_id_costs(chunk, review_counts, unknown_cost)
+                for chunk in _read_id_chunks(input_file, chunksize)
+            ] or [np.empty(0)])
+            assignments = balance_shards(costs, num_splits)
+            loads = np.bincount(
+                assignments, weights=costs, minlength=num_splits
+            )
+            logging.info(
+                f"Expected pages per split: "
+                f"{', '.join(f'{load:.0f}' for load in loads)}"
+            )
+            mode = "assigned"
+        elif mode == "contiguous":
+            num_rows = sum(
+                len(chunk) for chunk in _read_id_chunks(input_file, chunksize)
+            )
+            rows_per_split = num_rows // num_splits
+            if rows_per_split:
+                assignments = np.minimum(
+                    np.arange(num_rows) // rows_per_split, num_splits - 1
+                )
             else:
-                end_idx = (i + 1) * rows_per_split
-            
-            split_df = df.iloc[start_idx:end_idx]
-            output_file = os.path.join(output_folder, f"filtered_ids_part_{i+1}.tsv")
-            split_df.to_csv(output_file, index=False, sep='\t')
-            print(f"Saved {output_file}")
+                assignments = np.full(num_rows, num_splits - 1)
+            mode = "assigned"
+
+        rows = partition_tsv(
+            input_file,
+            output_folder,
+            mode=mode,
+            num_parts=num_splits,
+            column="tconst",
+            file_name="filtered_ids_part_{}.tsv",
+            assignments=assignments
+        )
+        for output_file in rows:
+            logging.info(f"Saved {output_file}")
+        return rows
     except Exception as e:
-        print(f"An error occurred: {e}")
+        logging.error(f"An error occurred: {e}")
+        return None
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     input_file = "data/filtered_movie_ids.tsv"  # Path to the input TSV file
     output_folder = "data/split_ids_movies"  # Path to the folder to save the split files
 
-    split_ids(input_file, output_folder)
\ No newline at end of file
+    split_ids(input_file, output_folder)
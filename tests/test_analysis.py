@@ -6,6 +6,7 @@ from src.analysis.metrics.merge_analisis import analyze_scariest_movies
 from src.analysis.utils.count_reviews import count_reviews_in_folder
 from src.analysis.utils.check_review_data import get_imdb_ids_from_folder
 from src.analysis.sentiment.check_emotions_data import get_imdb_ids_from_emotions_folder
+from src.data.columnar_store import ColumnarStore
 
 
 # Configuración de rutas de prueba
@@ -158,4 +159,24 @@ def test_analyze_scariest_movies_with_review_balance(tmp_path):
     
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 2
-    assert 'Weighted_Score' in result.columns 
\ No newline at end of file
+    assert 'Weighted_Score' in result.columns
+
+
+def test_readers_with_columnar_store(tmp_path):
+    """Test de las utilidades de análisis leyendo un ColumnarStore."""
+    pytest.importorskip("pyarrow")
+    store = ColumnarStore(tmp_path / "reviews")
+    store.append("tt0000001", pd.DataFrame({'Review': ['Scary', 'Boo']}))
+    store.append("tt0000002", pd.DataFrame({'Review': ['Fun']}))
+    store.flush()
+
+    counts = count_reviews_in_folder(store)
+    assert dict(zip(counts['IMDb_ID'], counts['Review_Count'])) == {
+        'tt0000001': 2, 'tt0000002': 1
+    }
+    assert list(get_imdb_ids_from_folder(store)['IMDb_ID']) == [
+        'tt0000001', 'tt0000002'
+    ]
+    assert list(get_imdb_ids_from_emotions_folder(store)['IMDb_ID']) == [
+        'tt0000001', 'tt0000002'
+    ]
@@ -0,0 +1,59 @@
+import time
+import random
+import threading
+import pandas as pd
+from unittest.mock import MagicMock
+from src.scrapers.async_pipeline import AsyncScraperPipeline
+from src.utils.progress_manager import ProgressManager
+
+
+class FakeFetcher:
+    """Fetcher de prueba con latencias aleatorias."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def scrape_reviews(self, imdb_id):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(random.uniform(0, 0.02))
+        with self.lock:
+            self.in_flight -= 1
+        # Los IDs impares no tienen reseñas
+        if int(imdb_id[2:]) % 2:
+            return []
+        return [f"Review of {imdb_id}"]
+
+
+def test_async_pipeline(tmp_path):
+    """Test del pipeline asíncrono con concurrencia acotada."""
+    movie_list = pd.DataFrame({
+        'imdb_id': [f"tt{i:07d}" for i in range(30)],
+        'primaryTitle': [f"Movie {i}" for i in range(30)]
+    })
+    fetcher = FakeFetcher()
+    progress_manager = MagicMock(spec=ProgressManager)
+
+    pipeline = AsyncScraperPipeline(fetcher, concurrency=4)
+    pipeline.run_pipeline(
+        movie_list,
+        output_folder=str(tmp_path),
+        dataset_name="test",
+        progress_manager=progress_manager
+    )
+
+    # Se guardan las reseñas de todas las películas con reseñas
+    saved = sorted(p.name for p in (tmp_path / "test").iterdir())
+    assert saved == [f"reviews_tt{i:07d}.csv" for i in range(0, 30, 2)]
+    assert 1 < fetcher.max_in_flight <= 4
+
+    # El progreso avanza en el orden original y termina en el último ID
+    committed = [
+        call.args[0] for call in progress_manager.save_progress.call_args_list
+    ]
+    positions = [int(imdb_id[2:]) for imdb_id in committed]
+    assert positions == sorted(positions)
+    assert committed[-1] == "tt0000029"
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from src.data.columnar_store import ColumnarStore
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fixture que proporciona un ColumnarStore con reseñas de prueba."""
+    store = ColumnarStore(tmp_path / "reviews", num_buckets=4, flush_rows=3)
+    store.append("tt0000001", pd.DataFrame({'Review': ["Scary!", "Boo"]}))
+    store.append("tt0000002", pd.DataFrame({'Review': ["Fun"]}))
+    store.append("tt0000006", pd.DataFrame({'Review': ["Dull", "Long"]}))
+    store.append("tt0000003", pd.DataFrame({'Review': []}))
+    return store
+
+
+def test_append_and_read(store):
+    """Test de escritura y lectura de todas las filas."""
+    data = store.read()
+    assert list(data.columns) == ['imdb_id', 'Review']
+    assert len(data) == 5
+    assert sorted(data['Review']) == ["Boo", "Dull", "Fun", "Long",
+                                      "Scary!"]
+
+
+def test_read_with_filter(store):
+    """Test de lectura filtrando por IMDb ID y columnas."""
+    data = store.read(columns=['Review'], imdb_ids=["tt0000002",
+                                                    "tt0000006"])
+    assert list(data.columns) == ['Review']
+    assert sorted(data['Review']) == ["Dull", "Fun", "Long"]
+
+
+def test_count_by_id(store):
+    """Test del conteo de filas por película."""
+    counts = store.count_by_id().set_index('imdb_id')['count']
+    assert counts.to_dict() == {
+        "tt0000001": 2, "tt0000002": 1, "tt0000006": 2
+    }
+    assert store.imdb_ids() == ["tt0000001", "tt0000002", "tt0000006"]
+
+
+def test_reopen_store(store):
+    """Test que una tienda existente conserva su configuración."""
+    store.flush()
+    assert ColumnarStore.is_store(store.root)
+    reopened = ColumnarStore(store.root, num_buckets=16)
+    assert reopened.num_buckets == 4
+    assert len(reopened.read(imdb_ids=["tt0000001"])) == 2
+
+
+def test_empty_store(tmp_path):
+    """Test de lectura de una tienda vacía."""
+    store = ColumnarStore(tmp_path / "empty")
+    assert store.read(columns=['imdb_id']).empty
+    assert store.count_by_id().empty
+    assert list(store.iter_batches()) == []
@@ -0,0 +1,109 @@
+import threading
+import pytest
+from unittest.mock import MagicMock
+from selenium.common.exceptions import WebDriverException
+from src.scrapers.utils.driver_pool import DriverPool
+from src.scrapers.numberReviews import get_reviews_count
+
+
+@pytest.fixture
+def driver_factory():
+    """Fixture que crea drivers simulados."""
+    return MagicMock(side_effect=lambda: MagicMock())
+
+
+def test_checkout_reuses_drivers(driver_factory):
+    """Test que los drivers se reutilizan entre páginas."""
+    pool = DriverPool(driver_factory, size=2)
+    seen = []
+    for _ in range(5):
+        with pool.checkout() as driver:
+            seen.append(driver)
+
+    assert driver_factory.call_count == 1
+    assert all(driver is seen[0] for driver in seen)
+    pool.close()
+    seen[0].quit.assert_called_once()
+    with pytest.raises(RuntimeError):
+        with pool.checkout():
+            pass
+
+
+def test_crashed_driver_is_recycled(driver_factory):
+    """Test que un driver caído se descarta y se reemplaza."""
+    pool = DriverPool(driver_factory, size=1)
+    with pytest.raises(WebDriverException):
+        with pool.checkout() as crashed:
+            raise WebDriverException("chrome not reachable")
+    crashed.quit.assert_called_once()
+
+    with pool.checkout() as driver:
+        assert driver is not crashed
+    assert pool.drivers_started == 2
+    assert pool.drivers_recycled == 1
+
+    # Otros errores no descartan el driver
+    with pytest.raises(ValueError):
+        with pool.checkout() as same:
+            raise ValueError("bad page")
+    assert same is driver
+
+
+def test_driver_rotation(driver_factory):
+    """Test que la sesión se rota tras max_pages páginas."""
+    pool = DriverPool(driver_factory, size=1, max_pages=3)
+    drivers = []
+    for _ in range(7):
+        with pool.checkout() as driver:
+            drivers.append(driver)
+
+    assert driver_factory.call_count == 3
+    assert drivers[0] is drivers[2] and drivers[3] is not drivers[2]
+    drivers[0].quit.assert_called_once()
+
+
+def test_pool_is_bounded_across_threads(driver_factory):
+    """Test que nunca hay más drivers en uso que el tamaño del pool."""
+    pool = DriverPool(driver_factory, size=3)
+    lock = threading.Lock()
+    in_use = set()
+    max_in_use = [0]
+
+    def work():
+        for _ in range(20):
+            with pool.checkout() as driver:
+                with lock:
+                    assert driver not in in_use
+                    in_use.add(driver)
+                    max_in_use[0] = max(max_in_use[0], len(in_use))
+                with lock:
+                    in_use.remove(driver)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_in_use[0] <= 3
+    assert driver_factory.call_count <= 3
+    pool.close()
+
+
+def test_get_reviews_count_with_pool():
+    """Test de get_reviews_count usando un driver del pool."""
+    driver = MagicMock()
+    driver.page_source = (
+        '<div data-testid="tturv-total-reviews">1,234 reviews</div>'
+    )
+    pool = DriverPool(lambda: driver, size=1)
+
+    assert get_reviews_count("tt0111161", pool=pool) == 1234
+    driver.get.assert_called_once_with(
+        "https://www.imdb.com/title/tt0111161/reviews"
+    )
+
+    # Un fallo del navegador devuelve None y recicla el driver
+    driver.get.side_effect = WebDriverException("crashed")
+    assert get_reviews_count("tt0111161", pool=pool) is None
+    assert pool.drivers_recycled == 1
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from src.analysis.sentiment.emotion_cache import EmotionCache
+
+
+MODEL = "j-hartmann/emotion-english-distilroberta-base"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fixture que proporciona una caché de emociones temporal."""
+    cache = EmotionCache(str(tmp_path / "cache" / "emotions.db"),
+                         max_entries=10)
+    yield cache
+    cache.close()
+
+
+def test_get_many_hits_and_misses(cache):
+    """Test de aciertos y fallos de la caché."""
+    reviews = ["Scary movie!", "Not scary"]
+    assert cache.get_many(MODEL, 512, reviews) == [None, None]
+
+    cache.put_many(MODEL, 512, reviews, [
+        {"label": "fear", "score": 0.9},
+        {"label": "neutral", "score": 0.5}
+    ])
+    results = cache.get_many(MODEL, 512, ["Not scary", "New review"])
+
+    assert results == [{"label": "neutral", "score": 0.5}, None]
+    assert cache.stats() == {"hits": 1, "misses": 3, "hit_rate": 0.25}
+
+
+def test_key_includes_model_and_max_length(cache):
+    """Test que la clave incluye el modelo y max_length."""
+    cache.put_many(MODEL, 512, ["Scary movie!"],
+                   [{"label": "fear", "score": 0.9}])
+    assert cache.get_many(MODEL, 256, ["Scary movie!"]) == [None]
+    assert cache.get_many("other-model", 512, ["Scary movie!"]) == [None]
+
+
+def test_persists_between_instances(cache):
+    """Test que las predicciones persisten en disco."""
+    cache.put_many(MODEL, 512, ["Scary movie!"],
+                   [{"label": "fear", "score": 0.9}])
+    reopened = EmotionCache(cache.cache_path)
+    assert reopened.get_many(MODEL, 512, ["Scary movie!"]) == [
+        {"label": "fear", "score": 0.9}
+    ]
+    reopened.close()
+
+
+def test_lru_eviction(cache):
+    """Test de expulsión de las entradas menos usadas."""
+    cache.put_many(MODEL, 512, ["review 0"],
+                   [{"label": "joy", "score": 0.1}])
+    cache.put_many(MODEL, 512, [f"review {i}" for i in range(1, 10)],
+                   [{"label": "joy", "score": 0.1}] * 9)
+    # Usar la primera entrada para que sea la más reciente
+    cache.get_many(MODEL, 512, ["review 0"])
+    cache.put_many(MODEL, 512, ["review 10", "review 11"],
+                   [{"label": "joy", "score": 0.1}] * 2)
+
+    (count,) = cache.connection.execute(
+        "SELECT COUNT(*) FROM emotions").fetchone()
+    assert count == 9
+    assert cache.get_many(MODEL, 512, ["review 0"]) != [None]
+    assert cache.get_many(MODEL, 512, ["review 1"]) == [None]
+
+
+def test_probs_round_trip(cache):
+    """Test de almacenamiento de la distribución completa."""
+    probs = np.array([0.7, 0.2, 0.1], dtype=np.float32)
+    cache.put_many(MODEL, 512, ["Label only"],
+                   [{"label": "fear", "score": 0.7}])
+    cache.put_many(MODEL, 512, ["With probs"],
+                   [{"label": "fear", "score": 0.7, "probs": probs}])
+
+    label_only, with_probs = cache.get_many(
+        MODEL, 512, ["Label only", "With probs"], with_probs=True
+    )
+    assert label_only is None
+    np.testing.assert_array_equal(with_probs["probs"], probs)
@@ -0,0 +1,148 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import MagicMock
+from urllib.parse import urlparse
+
+import pytest
+from src.scrapers.http_review_fetcher import HttpReviewFetcher
+from src.scrapers.movie_scraper_pipeline import MovieScraperPipeline
+
+
+FIXTURES_DIR = Path(__file__).parent / "data" / "http"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Sirve las páginas de reseñas grabadas como si fueran IMDb."""
+
+    # Respuestas 503 pendientes por ruta, para probar los reintentos
+    failures = {}
+    requests_seen = []
+
+    def _failing(self, path):
+        if self.failures.get(path, 0) > 0:
+            self.failures[path] -= 1
+            self.send_error(503)
+            return True
+        return False
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.requests_seen.append(self.path)
+        if self._failing(url.path):
+            return
+        parts = url.path.strip("/").split("/")
+        fixture = None
+        if len(parts) == 3 and parts[0] == "title" and parts[2] == "reviews":
+            fixture = FIXTURES_DIR / f"reviews_{parts[1]}.html"
+        self._send_fixture(fixture, "text/html")
+
+    def do_POST(self):
+        """Responde a la consulta de paginación según const y after."""
+        url = urlparse(self.path)
+        payload = json.loads(
+            self.rfile.read(int(self.headers["Content-Length"]))
+        )
+        self.requests_seen.append(payload)
+        if self._failing(url.path):
+            return
+        variables = payload["variables"]
+        self._send_fixture(
+            FIXTURES_DIR
+            / f"graphql_{variables['const']}_{variables['after']}.json",
+            "application/json"
+        )
+
+    def _send_fixture(self, fixture, content_type):
+        if fixture is None or not fixture.exists():
+            self.send_error(404)
+            return
+        body = fixture.read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def imdb_server():
+    """Fixture que levanta un servidor local con las páginas grabadas."""
+    FixtureHandler.failures = {}
+    FixtureHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fetcher(imdb_server):
+    """Fixture para HttpReviewFetcher apuntando al servidor local."""
+    fetcher = HttpReviewFetcher(
+        base_url=imdb_server, graphql_url=f"{imdb_server}/graphql",
+        retry_delay=0
+    )
+    yield fetcher
+    fetcher.close()
+
+
+def test_scrape_reviews_follows_pagination(fetcher):
+    """Test que se recorren todas las páginas de reseñas."""
+    reviews = fetcher.scrape_reviews("tt0000001")
+
+    assert reviews == [
+        "A truly scary movie, I could not sleep.",
+        "Great acting & a fun plot.",
+        "Boring in the middle."
+    ]
+    # La página de reseñas y una consulta de paginación desde su cursor
+    assert len(FixtureHandler.requests_seen) == 2
+    variables = FixtureHandler.requests_seen[1]["variables"]
+    assert variables["const"] == "tt0000001"
+    assert variables["after"] == "cursor1"
+
+
+def test_scrape_reviews_without_reviews(fetcher):
+    """Test para películas sin reseñas y páginas inexistentes."""
+    assert fetcher.scrape_reviews("tt0000002") == []
+    # Una página que no se pudo descargar no cuenta como sin reseñas
+    assert fetcher.scrape_reviews("tt9999999") is None
+    # Un 404 no se reintenta
+    assert len(FixtureHandler.requests_seen) == 2
+
+
+def test_scrape_reviews_retries(fetcher):
+    """Test que los errores del servidor se reintentan."""
+    FixtureHandler.failures = {"/title/tt0000001/reviews": 2}
+    assert len(fetcher.scrape_reviews("tt0000001")) == 3
+
+    FixtureHandler.failures = {"/title/tt0000001/reviews": 3}
+    assert fetcher.scrape_reviews("tt0000001") is None
+
+
+def test_scrape_reviews_incomplete_pagination(fetcher):
+    """Test que una paginación fallida no se da por completa."""
+    FixtureHandler.failures = {"/graphql": 3}
+    assert fetcher.scrape_reviews("tt0000001") is None
+
+    # Sin datos de paginación no se aceptan menos reseñas que el total
+    html = (FIXTURES_DIR / "reviews_tt0000001.html").read_text()
+    page = html[:html.index('<script id="__NEXT_DATA__"')]
+    fetcher._get = lambda url, **kwargs: page
+    assert fetcher.scrape_reviews("tt0000001") is None
+
+
+def test_pipeline_uses_fetcher(fetcher):
+    """Test que el pipeline delega en el fetcher sin usar el navegador."""
+    driver = MagicMock()
+    pipeline = MovieScraperPipeline(driver, fetcher=fetcher)
+
+    assert len(pipeline.scrape_reviews("tt0000001")) == 3
+    driver.get.assert_not_called()
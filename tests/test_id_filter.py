@@ -13,12 +13,13 @@ sys.path.append(root_dir)
 
 from src.utils.id_filter import compare_ids, filter_and_save_ids
 
+
 @pytest.fixture
 def sample_data():
     """Crear datos de prueba."""
     # Crear directorio temporal
     temp_dir = tempfile.mkdtemp()
-    
+
     # Crear archivo 1 con IDs
     file1_path = os.path.join(temp_dir, "file1.tsv")
     df1 = pd.DataFrame({
@@ -26,7 +27,7 @@ def sample_data():
         'title': ['Movie1', 'Movie2', 'Movie3', 'Movie4']
     })
     df1.to_csv(file1_path, sep='\t', index=False)
-    
+
     # Crear archivo 2 con IDs
     file2_path = os.path.join(temp_dir, "file2.tsv")
     df2 = pd.DataFrame({
@@ -34,7 +35,7 @@ def sample_data():
         'title': ['Movie2', 'Movie3', 'Movie5']
     })
     df2.to_csv(file2_path, sep='\t', index=False)
-    
+
     # Crear archivo con IDs de reseñas
     reviews_path = os.path.join(temp_dir, "reviews.csv")
     df_reviews = pd.DataFrame({
@@ -42,7 +43,7 @@ def sample_data():
         'count': [10, 15]
     })
     df_reviews.to_csv(reviews_path, sep=',', index=False)
-    
+
     return {
         'file1': file1_path,
         'file2': file2_path,
@@ -50,13 +51,14 @@ def sample_data():
         'temp_dir': temp_dir
     }
 
+
 def test_compare_ids(sample_data):
     """Prueba la función compare_ids."""
     ids1, ids2, difference = compare_ids(
         sample_data['file1'],
         sample_data['file2']
     )
-    
+
     # Verificar resultados
     assert len(ids1) == 4  # Total IDs en file1
     assert len(ids2) == 3  # Total IDs en file2
@@ -64,44 +66,47 @@ def test_compare_ids(sample_data):
     assert 'tt1' in difference
     assert 'tt4' in difference
 
+
 def test_filter_and_save_ids_missing(sample_data):
     """Prueba filter_and_save_ids en modo find_missing=True."""
     output_file = os.path.join(sample_data['temp_dir'], "missing.tsv")
-    
+
     filter_and_save_ids(
         source_file=sample_data['file1'],
         filter_file=sample_data['file2'],
         output_file=output_file,
         find_missing=True
     )
-    
+
     # Verificar archivo de salida
     result_df = pd.read_csv(output_file, sep='\t')
     assert len(result_df) == 2
     assert 'tt1' in result_df['tconst'].values
     assert 'tt4' in result_df['tconst'].values
 
+
 def test_filter_and_save_ids_common(sample_data):
     """Prueba filter_and_save_ids en modo find_missing=False."""
     output_file = os.path.join(sample_data['temp_dir'], "common.tsv")
-    
+
     filter_and_save_ids(
         source_file=sample_data['file1'],
         filter_file=sample_data['file2'],
         output_file=output_file,
         find_missing=False
     )
-    
+
     # Verificar archivo de salida
     result_df = pd.read_csv(output_file, sep='\t')
     assert len(result_df) == 2
     assert 'tt2' in result_df['tconst'].values
     assert 'tt3' in result_df['tconst'].values
 
+
 def test_filter_and_save_ids_with_reviews(sample_data):
     """Prueba filter_and_save_ids con archivo de reseñas."""
     output_file = os.path.join(sample_data['temp_dir'], "with_reviews.tsv")
-    
+
     filter_and_save_ids(
         source_file=sample_data['file1'],
         filter_file=sample_data['reviews'],
@@ -110,21 +115,68 @@ def test_filter_and_save_ids_with_reviews(sample_data):
         filter_sep=',',
         find_missing=False
     )
-    
+
     # Verificar archivo de salida
     result_df = pd.read_csv(output_file, sep='\t')
     assert len(result_df) == 2
     assert 'tt2' in result_df['tconst'].values
     assert 'tt3' in result_df['tconst'].values
 
+
 def test_error_handling():
     """Prueba el manejo de errores."""
     with pytest.raises(Exception):
         compare_ids("nonexistent_file1.tsv", "nonexistent_file2.tsv")
-    
+
     with pytest.raises(Exception):
         filter_and_save_ids(
             "nonexistent_file1.tsv",
             "nonexistent_file2.tsv",
             "output.tsv"
-        ) 
\ No newline at end of file
+        )
+
+
+def test_filter_and_save_ids_sorted_and_stable(sample_data):
+    """Prueba que la salida está ordenada y es idéntica entre ejecuciones."""
+    source_file = os.path.join(sample_data['temp_dir'], "source.tsv")
+    pd.DataFrame({
+        'tconst': ['tt0000010', 'tt0000002', 'tt0000007', 'tt0000002',
+                   'tt0000001'],
+        'title': ['M10', 'M2', 'M7', 'M2 bis', 'M1']
+    }).to_csv(source_file, sep='\t', index=False)
+    outputs = []
+    for run in range(2):
+        output_file = os.path.join(sample_data['temp_dir'], f"out{run}.tsv")
+        filter_and_save_ids(
+            source_file=source_file,
+            filter_file=sample_data['file2'],
+            output_file=output_file,
+            chunksize=2
+        )
+        with open(output_file, 'rb') as f:
+            outputs.append(f.read())
+    assert outputs[0] == outputs[1]
+    assert outputs[0] == (
+        b"tconst\ntt0000001\ntt0000002\ntt0000007\ntt0000010\n"
+    )
+
+
+def test_filter_and_save_ids_join_source(sample_data):
+    """Prueba la unión con las columnas del archivo fuente."""
+    source_file = os.path.join(sample_data['temp_dir'], "source.tsv")
+    pd.DataFrame({
+        'tconst': ['tt4', 'tt2', 'tt1', 'tt4', 'tt3'],
+        'title': ['M4', 'M2', 'M1', 'M4 bis', 'M3']
+    }).to_csv(source_file, sep='\t', index=False)
+    output_file = os.path.join(sample_data['temp_dir'], "joined.tsv")
+    filter_and_save_ids(
+        source_file=source_file,
+        filter_file=sample_data['file2'],
+        output_file=output_file,
+        join_source=True,
+        chunksize=2
+    )
+    result_df = pd.read_csv(output_file, sep='\t')
+    assert list(result_df['tconst']) == ['tt4', 'tt1']
+    assert list(result_df['title']) == ['M4', 'M1']
+    assert not os.path.exists(output_file + ".tmp")
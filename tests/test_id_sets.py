@@ -0,0 +1,55 @@
+"""Pruebas para los conjuntos compactos de IDs."""
+
+import numpy as np
+import pandas as pd
+from src.utils.id_sets import IdSet, encode_ids, decode_ids
+
+
+def test_encode_decode_roundtrip():
+    """Test que la codificación conserva el ancho de cada ID."""
+    ids = ['tt0000001', 'tt1', ' tt12345678 ', 'tt0000001', 'nm0000001',
+           'tt', 'tt12a']
+    codes, others = encode_ids(pd.Series(ids))
+    assert len(codes) == 3
+    assert np.all(np.diff(codes) > 0)
+    assert sorted(decode_ids(codes)) == ['tt0000001', 'tt1', 'tt12345678']
+    assert others == {'nm0000001', 'tt', 'tt12a'}
+
+
+def test_set_operations_match_python_sets():
+    """Test que las operaciones coinciden con las de set."""
+    rng = np.random.default_rng(0)
+    first = {f"tt{i:07d}" for i in rng.integers(0, 5000, 2000)}
+    second = {f"tt{i:07d}" for i in rng.integers(0, 5000, 2000)}
+    first |= {'tt1', 'custom'}
+    second |= {'tt01', 'custom'}
+    a, b = IdSet.from_ids(first), IdSet.from_ids(second)
+
+    assert len(a) == len(first)
+    assert set(a - b) == first - second
+    assert set(a & b) == first & second
+    assert set(a | b) == first | second
+    assert 'tt1' in a and 'tt01' not in a and 'custom' in a
+    assert 'tt9999999' not in a and None not in a
+    assert a - b == IdSet.from_ids(first - second)
+
+
+def test_from_file_reads_id_column_in_chunks(tmp_path):
+    """Test de lectura por bloques de un archivo con duplicados."""
+    file_path = tmp_path / "ids.csv"
+    pd.DataFrame({
+        'title': ['A', 'B', 'C', 'D', 'E'],
+        'IMDb ID': ['tt0000003', 'tt0000001', 'tt0000003', '', 'x1'],
+    }).to_csv(file_path, index=False)
+    ids = IdSet.from_file(str(file_path), 'IMDb ID', ',', chunksize=2)
+    assert list(ids) == ['tt0000001', 'tt0000003', 'x1']
+
+
+def test_lookup():
+    """Test de búsqueda vectorizada de posiciones."""
+    ids = IdSet.from_ids(['tt0000005', 'tt0000002', 'custom'])
+    positions, in_others = ids.lookup(
+        pd.Series(['tt0000002', 'tt0000003', ' tt0000005', 'custom', 'tt9'])
+    )
+    assert list(positions) == [0, -1, 1, -1, -1]
+    assert list(in_others) == [False, False, False, True, False]
@@ -1,4 +1,5 @@
 import pytest
+from pathlib import Path
 import pandas as pd
 from src.data.imdb_dataset import IMDbDataset
 
@@ -53,7 +54,7 @@ def test_filter_data_success(imdb_dataset, sample_data):
     """Test de filtrado exitoso de datos."""
     imdb_dataset.load_data()
     filtered = imdb_dataset.filter_data('titleType', 'movie')
-    
+
     expected = sample_data[sample_data['titleType'] == 'movie']
     pd.testing.assert_frame_equal(filtered, expected)
 
@@ -68,4 +69,190 @@ def test_filter_data_no_matches(imdb_dataset):
 def test_filter_data_no_data(imdb_dataset):
     """Test de filtrado sin datos cargados."""
     filtered = imdb_dataset.filter_data('titleType', 'movie')
-    assert filtered is None 
\ No newline at end of file
+    assert filtered is None
+
+
+@pytest.fixture
+def title_basics_file(tmp_path):
+    """Fixture con un extracto de title.basics.tsv con \\N y comillas."""
+    file_path = tmp_path / "title.basics.tsv"
+    file_path.write_text(
+        "tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult\t"
+        "startYear\tendYear\truntimeMinutes\tgenres\n"
+        "tt0000001\tmovie\t\"Quoted\" Title\tNA\t0\t1999\t\\N\t90\t"
+        "Horror,Drama\n"
+        "tt0000002\tshort\tnull\tShort 1\t1\t\\N\t\\N\t\\N\t\\N\n"
+        "tt0000003\tmovie\tMovie 3\tMovie 3\t0\t2005\t\\N\t120\tHorror\n",
+        encoding="utf-8"
+    )
+    return file_path
+
+
+def test_load_data_typed(title_basics_file):
+    """Test de carga con tipos compactos."""
+    dataset = IMDbDataset(title_basics_file)
+    data = dataset.load_data(typed=True)
+
+    assert isinstance(data['titleType'].dtype, pd.CategoricalDtype)
+    assert isinstance(data['genres'].dtype, pd.CategoricalDtype)
+    assert data['startYear'].dtype == "Int16"
+    assert data['isAdult'].dtype == "boolean"
+    assert data['startYear'].isna().tolist() == [False, True, False]
+    assert data['genres'].isna().tolist() == [False, True, False]
+    # Las comillas y textos como "NA" se conservan tal cual
+    assert data.loc[0, 'primaryTitle'] == '"Quoted" Title'
+    assert data.loc[0, 'originalTitle'] == 'NA'
+    assert data.loc[1, 'primaryTitle'] == 'null'
+    assert set(dataset.load_stats) == {
+        "source", "rows", "seconds", "memory_mb", "peak_rss_mb"
+    }
+    assert dataset.load_stats["rows"] == 3
+
+
+def test_load_data_columns(title_basics_file):
+    """Test de carga de un subconjunto de columnas."""
+    data = IMDbDataset(title_basics_file).load_data(
+        typed=True, columns=['tconst', 'startYear']
+    )
+    assert list(data.columns) == ['tconst', 'startYear']
+
+
+def test_load_data_pyarrow_engine(title_basics_file):
+    """Test que el motor pyarrow produce el mismo resultado tipado."""
+    pytest.importorskip("pyarrow")
+    expected = IMDbDataset(title_basics_file).load_data(typed=True)
+    result = IMDbDataset(title_basics_file).load_data(
+        typed=True, engine="pyarrow"
+    )
+    # pyarrow ordena las categorías por aparición, no alfabéticamente
+    pd.testing.assert_frame_equal(result, expected, check_categorical=False)
+
+    projected = IMDbDataset(title_basics_file).load_data(
+        typed=True, columns=['tconst', 'genres'], engine="pyarrow"
+    )
+    assert list(projected.columns) == ['tconst', 'genres']
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_load_data_typed_malformed_cells(tmp_path, engine):
+    """Test que las celdas inválidas quedan como NA sin abortar la carga."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    file_path = tmp_path / "title.basics.tsv"
+    file_path.write_text(
+        "tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult\t"
+        "startYear\tendYear\truntimeMinutes\tgenres\n"
+        "tt0000001\tmovie\tMovie 1\tMovie 1\t2\t19x9\t\\N\t90.5\t"
+        "Horror\n"
+        "tt0000002\tmovie\tMovie 2\tMovie 2\t1\t2001\t99999\t85\t"
+        "Drama\n",
+        encoding="utf-8"
+    )
+    data = IMDbDataset(file_path).load_data(typed=True, engine=engine)
+
+    assert data is not None
+    assert data['startYear'].dtype == "Int16"
+    assert data['runtimeMinutes'].dtype == "Int32"
+    assert data['isAdult'].dtype == "boolean"
+    assert data['startYear'].isna().tolist() == [True, False]
+    assert data.loc[1, 'startYear'] == 2001
+    # 99999 no cabe en Int16
+    assert data['endYear'].isna().all()
+    assert data['runtimeMinutes'].isna().tolist() == [True, False]
+    assert data['isAdult'].isna().tolist() == [True, False]
+    assert data.loc[1, 'isAdult']
+
+
+@pytest.fixture
+def filter_dataset(tmp_path):
+    """Fixture con títulos variados para probar filter_movies."""
+    file_path = tmp_path / "title.basics.tsv"
+    pd.DataFrame({
+        'tconst': [f"tt000000{i}" for i in range(1, 8)],
+        'titleType': ['movie', 'movie', 'short', 'movie', 'movie',
+                      'movie', 'tvSeries'],
+        'primaryTitle': [f"Title {i}" for i in range(1, 8)],
+        'isAdult': [0, 0, 0, 1, 0, 0, 0],
+        'startYear': ['1999', '2005', '2005', '2010', '\\N', '2020',
+                      '2005'],
+        'genres': ['Horror,Drama', 'Comedy', 'Horror', 'Horror',
+                   'Horror', '\\N', 'Horror,Thriller']
+    }).to_csv(file_path, sep='\t', index=False)
+    return file_path
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_filter_movies(filter_dataset, typed):
+    """Test de filter_movies con índices precalculados."""
+    dataset = IMDbDataset(filter_dataset)
+    assert dataset.filter_movies(genre="Horror") is None
+    dataset.load_data(typed=typed)
+
+    def ids(result):
+        return list(result['tconst'])
+
+    # Por defecto: películas no adultas
+    assert ids(dataset.filter_movies(genre="horror")) == [
+        'tt0000001', 'tt0000005'
+    ]
+    assert ids(dataset.filter_movies(
+        genre="Horror", start_year=2000, end_year=2010, is_adult=None
+    )) == ['tt0000004']
+    assert ids(dataset.filter_movies(
+        genre="Horror", title_type=None, start_year=2005, end_year=2005
+    )) == ['tt0000003', 'tt0000007']
+    assert ids(dataset.filter_movies(end_year=2005)) == [
+        'tt0000001', 'tt0000002'
+    ]
+    assert ids(dataset.filter_movies(start_year=2006)) == ['tt0000006']
+    assert len(dataset.filter_movies(genre="Western")) == 0
+    assert len(dataset.filter_movies(title_type="videoGame")) == 0
+    # Sin filtros de género ni año se devuelven todas las películas
+    assert len(dataset.filter_movies(genre="")) == 4
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_load_data_snapshot(title_basics_file, typed):
+    """Test que el snapshot se reutiliza y se invalida si cambia el TSV."""
+    pytest.importorskip("pyarrow")
+    dataset = IMDbDataset(title_basics_file)
+    parsed = dataset.load_data(typed=typed, snapshot=True)
+    assert dataset.load_stats["source"] == "tsv"
+    snapshot = Path(dataset.snapshot_path(typed))
+    assert snapshot.exists()
+
+    cached = IMDbDataset(title_basics_file)
+    result = cached.load_data(typed=typed, snapshot=True)
+    assert cached.load_stats["source"] == "snapshot"
+    pd.testing.assert_frame_equal(result, parsed)
+
+    projected = cached.load_data(
+        typed=typed, columns=['tconst', 'genres'], snapshot=True
+    )
+    assert list(projected.columns) == ['tconst', 'genres']
+
+    # Un TSV modificado invalida el snapshot
+    with open(title_basics_file, 'a', encoding='utf-8') as f:
+        f.write("tt0000004\tmovie\tNew\tNew\t0\t2021\t\\N\t80\tHorror\n")
+    reloaded = IMDbDataset(title_basics_file)
+    assert len(reloaded.load_data(typed=typed, snapshot=True)) == 4
+    assert reloaded.load_stats["source"] == "tsv"
+
+
+def test_stream_filter(filter_dataset):
+    """Test que stream_filter por bloques coincide con filter_movies."""
+    dataset = IMDbDataset(filter_dataset)
+    dataset.load_data(typed=True)
+    for filters in [
+        {'genre': "Horror"},
+        {'genre': "Horror", 'title_type': None, 'start_year': 2005,
+         'end_year': 2005},
+        {'end_year': 2005, 'is_adult': None},
+        {'genre': "Western"},
+    ]:
+        expected = dataset.filter_movies(**filters)
+        chunks = IMDbDataset(filter_dataset).stream_filter(
+            chunksize=2, **filters
+        )
+        assert [imdb_id for chunk in chunks
+                for imdb_id in chunk['tconst']] == list(expected['tconst'])
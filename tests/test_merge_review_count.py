@@ -0,0 +1,85 @@
+"""Pruebas para la combinación de archivos de número de reseñas."""
+
+import os
+import pandas as pd
+import pytest
+from src.utils import merge_review_count
+from src.utils.merge_review_count import merge_review_counts
+
+
+def write_counts(folder, name, rows):
+    """Crea un archivo de conteos como los de numberReviews."""
+    pd.DataFrame(rows, columns=['IMDb ID', 'Number of Reviews']).to_csv(
+        folder / name, index=False
+    )
+
+
+@pytest.fixture
+def counts_folder(tmp_path):
+    """Carpeta con dos archivos de conteos con IDs repetidos."""
+    folder = tmp_path / "reviews_count"
+    folder.mkdir()
+    write_counts(folder, "part_1.csv", [
+        ('tt0000003', 5), ('tt0000001', None), ('tt0000003', 9),
+        ('tt0000002', 7)
+    ])
+    write_counts(folder, "part_2.csv", [
+        ('tt0000002', 100), ('tt0000004', 4), ('tt0000005', None)
+    ])
+    return folder
+
+
+def test_merge_keeps_first_occurrence(counts_folder, tmp_path):
+    """Prueba la deduplicación por bloques (gana la primera aparición)."""
+    output_file = tmp_path / "unique.csv"
+    assert merge_review_counts(
+        str(counts_folder), str(output_file), chunksize=2
+    ) == 5
+    result = pd.read_csv(output_file, dtype={'Number of Reviews': 'Int64'})
+    assert list(result['IMDb ID']) == [
+        'tt0000001', 'tt0000002', 'tt0000003', 'tt0000004', 'tt0000005'
+    ]
+    # Los conteos fallidos quedan vacíos, no como 0
+    assert list(result['Number of Reviews'].fillna(-1)) == [-1, 7, 5, 4, -1]
+
+
+def test_merge_incremental(counts_folder, tmp_path, monkeypatch):
+    """Prueba que solo se combinan los archivos nuevos."""
+    output_file = tmp_path / "unique.csv"
+    merge_review_counts(str(counts_folder), str(output_file), chunksize=2)
+
+    # Un conteo conocido sustituye a uno fallido anterior
+    write_counts(counts_folder, "part_3.csv", [
+        ('tt0000004', 40), ('tt0000000', 1), ('tt0000005', 2)
+    ])
+    # Los archivos ya combinados no se vuelven a leer
+    read_files = []
+    write_runs = merge_review_count._write_sorted_runs
+
+    def tracking_write_runs(file_path, *args):
+        read_files.append(os.path.basename(file_path))
+        return write_runs(file_path, *args)
+
+    monkeypatch.setattr(
+        merge_review_count, "_write_sorted_runs", tracking_write_runs
+    )
+    assert merge_review_counts(str(counts_folder), str(output_file)) == 6
+    result = pd.read_csv(output_file, dtype={'Number of Reviews': 'Int64'})
+    assert list(result['IMDb ID']) == [
+        'tt0000000', 'tt0000001', 'tt0000002', 'tt0000003', 'tt0000004',
+        'tt0000005'
+    ]
+    assert list(result['Number of Reviews'].fillna(-1)) == [
+        1, -1, 7, 5, 4, 2
+    ]
+
+    # Sin archivos nuevos no se reescribe la salida
+    before = os.stat(output_file).st_mtime_ns
+    assert merge_review_counts(str(counts_folder), str(output_file)) == 6
+    assert os.stat(output_file).st_mtime_ns == before
+    assert read_files == ["part_3.csv"]
+
+    # Si cambia un archivo ya combinado se combina todo de nuevo
+    write_counts(counts_folder, "part_2.csv", [('tt0000002', 100)])
+    assert merge_review_counts(str(counts_folder), str(output_file)) == 6
+    assert read_files[1:] == ["part_1.csv", "part_2.csv", "part_3.csv"]
@@ -34,7 +34,7 @@ def test_save_to_csv_basic(exporter, sample_data):
     exporter.save_to_csv(sample_data)
     output_file = os.path.join(exporter.output_folder, "movies.csv")
     assert os.path.exists(output_file)
-    
+
     # Verificar contenido
     saved_data = pd.read_csv(output_file)
     pd.testing.assert_frame_equal(saved_data, sample_data)
@@ -57,7 +57,7 @@ def test_save_empty_dataframe(exporter):
     """Test que verifica el comportamiento con un DataFrame vacío."""
     empty_df = pd.DataFrame()
     exporter.save_to_csv(empty_df)
-    
+
     # Verificar que no se creó ningún archivo
     assert len(os.listdir(exporter.output_folder)) == 0
 
@@ -67,4 +67,20 @@ def test_save_with_special_characters(exporter, sample_data):
     exporter.save_to_csv(sample_data, genre="Sci-Fi/Horror")
     expected_filename = "movies_genre_Sci-Fi_Horror.csv"
     output_file = os.path.join(exporter.output_folder, expected_filename)
-    assert os.path.exists(output_file) 
\ No newline at end of file
+    assert os.path.exists(output_file)
+
+
+def test_save_chunks(exporter, sample_data):
+    """Test que save_chunks escribe los bloques en un solo CSV."""
+    chunks = [sample_data.iloc[:2], sample_data.iloc[:0],
+              sample_data.iloc[2:]]
+    file_path = exporter.save_chunks(iter(chunks), genre="Action")
+    assert file_path == os.path.join(
+        exporter.output_folder, "movies_genre_Action.csv"
+    )
+    pd.testing.assert_frame_equal(pd.read_csv(file_path), sample_data)
+
+    # Sin filas no se crea ningún archivo
+    assert exporter.save_chunks(iter([sample_data.iloc[:0]]),
+                                genre="Drama") is None
+    assert os.listdir(exporter.output_folder) == ["movies_genre_Action.csv"]
@@ -0,0 +1,158 @@
+"""Pruebas para el particionado en streaming de archivos TSV."""
+
+import os
+import pandas as pd
+import pytest
+from src.utils.partitioner import partition_tsv
+from src.utils.split_ids import split_ids
+from src.utils.filter_movie_ids import create_files_by_title_type
+
+
+@pytest.fixture
+def title_basics(tmp_path):
+    """Archivo title.basics.tsv de prueba."""
+    file_path = tmp_path / "title.basics.tsv"
+    pd.DataFrame({
+        'tconst': [f"tt{i:07d}" for i in range(1, 11)],
+        'titleType': ['movie', 'short', 'movie', 'tvSeries', 'movie',
+                      'short', 'movie', 'movie', 'tvSeries', 'movie'],
+        'primaryTitle': [f"Title {i}" for i in range(1, 11)],
+    }).to_csv(file_path, sep='\t', index=False)
+    return file_path
+
+
+def read_parts(rows):
+    return {
+        os.path.basename(path): pd.read_csv(path, sep='\t', dtype=str)
+        for path in rows
+    }
+
+
+def test_create_files_by_title_type(title_basics):
+    """Test de un archivo por tipo de título con las filas originales."""
+    rows = create_files_by_title_type(str(title_basics))
+    parts = read_parts(rows)
+    assert sorted(parts) == ['movie.tsv', 'short.tsv', 'tvSeries.tsv']
+    assert list(parts['movie.tsv']['tconst']) == [
+        'tt0000001', 'tt0000003', 'tt0000005', 'tt0000007', 'tt0000008',
+        'tt0000010'
+    ]
+    assert (parts['short.tsv']['titleType'] == 'short').all()
+    assert not list(
+        (title_basics.parent / 'title_types').glob('*.tmp')
+    )
+
+
+def test_split_ids_contiguous(title_basics, tmp_path):
+    """Test de bloques consecutivos; la última parte lleva el resto."""
+    rows = split_ids(str(title_basics), str(tmp_path / "split"),
+                     num_splits=4, chunksize=3)
+    parts = read_parts(rows)
+    assert [len(parts[f"filtered_ids_part_{i}.tsv"]) for i in range(1, 5)] \
+        == [2, 2, 2, 4]
+    ids = pd.concat(
+        parts[f"filtered_ids_part_{i}.tsv"] for i in range(1, 5)
+    )['tconst']
+    assert list(ids) == [f"tt{i:07d}" for i in range(1, 11)]
+
+
+def test_split_ids_round_robin(title_basics, tmp_path):
+    """Test de partes equilibradas que cubren todos los IDs."""
+    rows = split_ids(str(title_basics), str(tmp_path / "split"),
+                     num_splits=4, mode="round_robin")
+    assert sorted(rows.values()) == [2, 2, 3, 3]
+    parts = read_parts(rows)
+    assert sorted(parts) == [
+        f"filtered_ids_part_{i}.tsv" for i in range(1, 5)
+    ]
+    ids = pd.concat(parts.values())['tconst']
+    assert sorted(ids) == [f"tt{i:07d}" for i in range(1, 11)]
+
+
+def test_partition_hash_is_stable(title_basics, tmp_path):
+    """Test que el modo hash asigna cada ID siempre a la misma parte."""
+    first = read_parts(partition_tsv(
+        str(title_basics), str(tmp_path / "a"), mode="hash", num_parts=3
+    ))
+    subset = tmp_path / "subset.tsv"
+    pd.read_csv(title_basics, sep='\t').iloc[::2].to_csv(
+        subset, sep='\t', index=False
+    )
+    second = read_parts(partition_tsv(
+        str(subset), str(tmp_path / "b"), mode="hash", num_parts=3
+    ))
+    for name, part in second.items():
+        assert set(part['tconst']) <= set(first[name]['tconst'])
+
+
+def test_partition_errors(title_basics, tmp_path):
+    """Test de parámetros inválidos."""
+    with pytest.raises(ValueError):
+        partition_tsv(str(title_basics), str(tmp_path), mode="random")
+    with pytest.raises(ValueError):
+        partition_tsv(str(title_basics), str(tmp_path), mode="column",
+                      column="missing")
+    assert split_ids(str(tmp_path / "missing.tsv"), str(tmp_path)) is None
+
+
+def test_split_ids_balanced_by_cost(title_basics, tmp_path):
+    """Test de partes con el mismo trabajo esperado según las reseñas."""
+    counts_file = tmp_path / "unique_review_counts.csv"
+    pd.DataFrame({
+        'IMDb ID': ['tt0000001', 'tt0000002', 'tt0000003', 'tt0000004'],
+        'Number of Reviews': [250, 125, 100, 0]
+    }).to_csv(counts_file, index=False)
+    rows = split_ids(str(title_basics), str(tmp_path / "split"),
+                     num_splits=2, review_counts_file=str(counts_file))
+    parts = read_parts(rows)
+    # Costes: tt1=10, tt2=5, tt3=4, tt4=1 (mínimo una página) y los
+    # desconocidos la media de los conocidos (5): 25 páginas por parte
+    assert list(parts['filtered_ids_part_1.tsv']['tconst']) == [
+        'tt0000001', 'tt0000006', 'tt0000008', 'tt0000010'
+    ]
+    assert list(parts['filtered_ids_part_2.tsv']['tconst']) == [
+        'tt0000002', 'tt0000003', 'tt0000004', 'tt0000005', 'tt0000007',
+        'tt0000009'
+    ]
+    # El reparto no depende del tamaño de bloque de la primera pasada
+    chunked = split_ids(str(title_basics), str(tmp_path / "chunked"),
+                        num_splits=2, review_counts_file=str(counts_file),
+                        chunksize=3)
+    assert sorted(rows.values()) == sorted(chunked.values())
+    for name, part in read_parts(chunked).items():
+        assert list(part['tconst']) == list(parts[name]['tconst'])
+
+
+def test_split_ids_by_cost_with_quotes(tmp_path):
+    """Test del reparto por coste con comillas y líneas vacías."""
+    input_file = tmp_path / "title.basics.tsv"
+    input_file.write_text(
+        "tconst\ttitleType\tprimaryTitle\n"
+        "tt0000001\tmovie\t\"Quoted\" Title\n"
+        "tt0000002\tmovie\t\"Unbalanced Title\n"
+        "\n"
+        "tt0000003\tmovie\tPlain Title\n"
+        "tt0000004\tmovie\tAnother Title\n",
+        encoding='utf-8'
+    )
+    counts_file = tmp_path / "unique_review_counts.csv"
+    pd.DataFrame({
+        'IMDb ID': ['tt0000001', 'tt0000002', 'tt0000003', 'tt0000004'],
+        'Number of Reviews': [250, 25, 25, 200]
+    }).to_csv(counts_file, index=False)
+    rows = split_ids(str(input_file), str(tmp_path / "split"),
+                     num_splits=2, review_counts_file=str(counts_file))
+    assert rows is not None
+    parts = {
+        os.path.basename(path): open(path, encoding='utf-8').read()
+        for path in rows
+    }
+    # Costes: tt1=10, tt4=8, tt2=1, tt3=1; las filas se copian tal cual
+    assert parts['filtered_ids_part_1.tsv'].splitlines()[1:] == [
+        'tt0000001\tmovie\t"Quoted" Title'
+    ]
+    assert parts['filtered_ids_part_2.tsv'].splitlines()[1:] == [
+        'tt0000002\tmovie\t"Unbalanced Title',
+        'tt0000003\tmovie\tPlain Title',
+        'tt0000004\tmovie\tAnother Title'
+    ]
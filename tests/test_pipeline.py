@@ -2,7 +2,10 @@ import pytest
 import pandas as pd
 from pathlib import Path
 import os
+from unittest.mock import MagicMock
 from src.data.imdb_dataset import IMDbDataset
+from src.scrapers.movie_scraper_pipeline import MovieScraperPipeline
+from src.utils.progress_manager import ProgressManager, ProgressLedger
 
 # Definir rutas de prueba
 TEST_MOVIE_DATA_DIR = Path("test_data/movies")
@@ -53,6 +56,91 @@ def test_directory_structure():
     for dir_name in test_dirs:
         os.rmdir(dir_name)
 
+def test_run_pipeline_with_ledger(tmp_path):
+    """Test que el ledger omite las películas ya completadas."""
+    movie_list = pd.DataFrame({
+        'imdb_id': ['tt0000001', 'tt0000002', 'tt0000003', 'tt0000004'],
+        'primaryTitle': ['Movie1', 'Movie2', 'Movie3', 'Movie4']
+    })
+    fetcher = MagicMock()
+    # tt0000002 no tiene reseñas y tt0000004 falla (None)
+    fetcher.scrape_reviews.side_effect = lambda imdb_id: {
+        'tt0000002': [], 'tt0000004': None
+    }.get(imdb_id, [f"Review of {imdb_id}"])
+    progress_manager = MagicMock(spec=ProgressManager)
+    ledger_path = str(tmp_path / "ledger.db")
+
+    with ProgressLedger(ledger_path) as ledger:
+        ledger.mark_done("test", "tt0000001")
+        MovieScraperPipeline(None, fetcher=fetcher).run_pipeline(
+            movie_list,
+            output_folder=str(tmp_path),
+            dataset_name="test",
+            progress_manager=progress_manager,
+            ledger=ledger
+        )
+
+    scraped = [call.args[0] for call in fetcher.scrape_reviews.call_args_list]
+    assert scraped == ['tt0000002', 'tt0000003', 'tt0000004']
+    # El archivo del último ID se escribe una sola vez al final
+    progress_manager.save_progress.assert_called_once_with(
+        'tt0000004', 'test'
+    )
+    assert (tmp_path / "test" / "reviews_tt0000003.csv").exists()
+    assert not (tmp_path / "test" / "reviews_tt0000004.csv").exists()
+
+    # La película fallida no se marca como completada
+    with ProgressLedger(ledger_path) as ledger:
+        assert ledger.completed_ids("test") == {
+            'tt0000001', 'tt0000002', 'tt0000003'
+        }
+
+
+def test_resume_from_id_non_contiguous_index():
+    """Test que se reanuda por posición con índices no contiguos."""
+    movie_list = pd.DataFrame({
+        'imdb_id': ['tt0000001', 'tt0000002', 'tt0000003', 'tt0000004'],
+        'primaryTitle': ['Movie1', 'Movie2', 'Movie3', 'Movie4']
+    }, index=[10, 3, 7, 0])
+    pipeline = MovieScraperPipeline(None)
+
+    resumed = pipeline._resume_from_id(movie_list, 'tt0000003')
+    assert list(resumed['imdb_id']) == ['tt0000003', 'tt0000004']
+
+    # Un ID inexistente o vacío devuelve la lista completa
+    assert len(pipeline._resume_from_id(movie_list, 'tt9999999')) == 4
+    assert len(pipeline._resume_from_id(movie_list, None)) == 4
+
+
+def test_run_pipeline_review_count_precheck(tmp_path):
+    """Test que se omiten títulos sin reseñas y se ordena por coste."""
+    movie_list = pd.DataFrame({
+        'imdb_id': ['tt0000001', 'tt0000002', 'tt0000003', 'tt0000004',
+                    'tt0000005'],
+        'primaryTitle': ['Movie1', 'Movie2', 'Movie3', 'Movie4', 'Movie5']
+    })
+    review_counts = pd.Series(
+        [300, 0, 10, 60], index=['tt0000001', 'tt0000002', 'tt0000003',
+                                 'tt0000004']
+    )
+    fetcher = MagicMock()
+    fetcher.scrape_reviews.return_value = []
+
+    MovieScraperPipeline(None, fetcher=fetcher).run_pipeline(
+        movie_list,
+        output_folder=str(tmp_path),
+        dataset_name="test",
+        start_from_id='tt0000004',
+        progress_manager=MagicMock(spec=ProgressManager),
+        review_counts=review_counts
+    )
+
+    # tt0000002 no tiene reseñas; tt0000005 no tiene conteo y va al final.
+    # La reanudación se aplica sobre el orden planificado.
+    scraped = [call.args[0] for call in fetcher.scrape_reviews.call_args_list]
+    assert scraped == ['tt0000004', 'tt0000001', 'tt0000005']
+
+
 if __name__ == "__main__":
     test_data_loading()
     test_directory_structure() 
\ No newline at end of file
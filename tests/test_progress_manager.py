@@ -1,6 +1,6 @@
 import os
 import pytest
-from src.utils.progress_manager import ProgressManager
+from src.utils.progress_manager import ProgressManager, ProgressLedger
 
 
 @pytest.fixture
@@ -79,4 +79,57 @@ def test_load_progress_with_data(progress_manager):
 def test_read_file_nonexistent(progress_manager):
     """Test de lectura de archivo inexistente."""
     result = progress_manager._read_file("nonexistent_file.txt")
-    assert result is None 
\ No newline at end of file
+    assert result is None
+
+
+def test_ledger_batches_and_persists(tmp_path):
+    """Test que el ledger confirma por lotes y persiste entre instancias."""
+    ledger_path = str(tmp_path / "ledger.db")
+    ledger = ProgressLedger(ledger_path, batch_size=3)
+    ledger.mark_done("horror", "tt0000001")
+    ledger.mark_done("horror", "tt0000002")
+    assert ledger.is_done("horror", "tt0000001")
+
+    # Aún no se ha confirmado ningún lote
+    other = ProgressLedger(ledger_path)
+    assert other.completed_ids("horror") == set()
+    other.close()
+
+    ledger.mark_done("horror", "tt0000003")
+    ledger.mark_done("comedy", "tt0000001")
+    ledger.close()
+
+    reopened = ProgressLedger(ledger_path)
+    assert reopened.completed_ids("horror") == {
+        "tt0000001", "tt0000002", "tt0000003"
+    }
+    assert reopened.completed_ids("comedy") == {"tt0000001"}
+    assert not reopened.is_done("comedy", "tt0000002")
+    reopened.close()
+
+
+def test_ledger_concurrent_workers(tmp_path):
+    """Test de varios hilos e instancias escribiendo en el mismo ledger."""
+    import threading
+
+    ledger_path = str(tmp_path / "ledger.db")
+    ledgers = [ProgressLedger(ledger_path, batch_size=7) for _ in range(2)]
+
+    def work(ledger, worker):
+        for i in range(50):
+            ledger.mark_done("horror", f"tt{worker}{i:06d}")
+
+    threads = [
+        threading.Thread(target=work, args=(ledgers[w % 2], w))
+        for w in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for ledger in ledgers:
+        ledger.close()
+
+    with ProgressLedger(ledger_path) as ledger:
+        assert len(ledger.completed_ids("horror")) == 200
+
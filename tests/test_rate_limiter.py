@@ -0,0 +1,59 @@
+import time
+import asyncio
+import threading
+import pytest
+from src.scrapers.utils.rate_limiter import (
+    TokenBucket,
+    HostRateLimiter,
+    backoff_delay
+)
+
+
+def test_token_bucket_paces_requests():
+    """Test que el bucket limita las peticiones a la tasa indicada."""
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    # La primera es inmediata; las otras cinco esperan 1/50 s cada una
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+def test_token_bucket_threads_and_async():
+    """Test que el bucket es seguro entre hilos y desde asyncio."""
+    bucket = TokenBucket(rate=100, capacity=2)
+    start = time.monotonic()
+    threads = [
+        threading.Thread(target=bucket.acquire) for _ in range(12)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 10 / 100 * 0.9
+
+    async def acquire_all():
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+    start = time.monotonic()
+    asyncio.run(acquire_all())
+    assert time.monotonic() - start >= 4 / 100 * 0.9
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_host_rate_limiter():
+    """Test que cada host tiene su propio bucket."""
+    limiter = HostRateLimiter(rate=1)
+    first = limiter.bucket_for("https://www.imdb.com/title/tt1/reviews")
+    assert first is limiter.bucket_for("https://www.imdb.com/title/tt2")
+    assert first is not limiter.bucket_for("http://127.0.0.1:8000/")
+
+
+def test_backoff_delay():
+    """Test que el backoff crece exponencialmente con jitter acotado."""
+    for attempt in range(1, 8):
+        delay = backoff_delay(attempt, base=1, cap=10)
+        assert 0 <= delay <= min(10, 2 ** (attempt - 1))
+    assert backoff_delay(3, base=0) == 0
@@ -0,0 +1,74 @@
+import time
+import threading
+import pandas as pd
+from src.scrapers.utils.result_writer import BufferedCsvWriter
+
+
+HEADER = ['IMDb ID', 'Number of Reviews']
+
+
+def test_concurrent_writes(tmp_path):
+    """Test que varios hilos escriben filas completas sin mezclarse."""
+    output_file = tmp_path / "out" / "counts.csv"
+    writer = BufferedCsvWriter(str(output_file), HEADER, flush_rows=7)
+
+    def produce(worker):
+        for i in range(50):
+            writer.write([f"tt{worker:02d}{i:05d}", i])
+
+    threads = [
+        threading.Thread(target=produce, args=(w,)) for w in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+    result = pd.read_csv(output_file)
+    assert list(result.columns) == HEADER
+    assert len(result) == 400
+    assert result['IMDb ID'].is_unique
+    assert writer.rows_written == 400
+
+
+def test_flush_by_time_and_checkpoint(tmp_path):
+    """Test que las filas se vuelcan por tiempo y en los checkpoints."""
+    output_file = tmp_path / "counts.csv"
+    writer = BufferedCsvWriter(
+        str(output_file), HEADER, flush_rows=1000, flush_seconds=0.05
+    )
+    writer.write(["tt0000001", 3])
+    time.sleep(0.3)
+    assert len(pd.read_csv(output_file)) == 1
+
+    writer.write(["tt0000002", 5])
+    writer.checkpoint()
+    assert len(pd.read_csv(output_file)) == 2
+    writer.close()
+
+
+def test_restart_skips_completed_ids(tmp_path):
+    """Test que al reiniciar se cargan los IDs ya guardados."""
+    output_file = tmp_path / "counts.csv"
+    with BufferedCsvWriter(str(output_file), HEADER) as writer:
+        writer.write(["tt0000001", 3])
+        writer.write(["tt0000002", 5])
+        writer.write(["tt0000004", ""])  # Búsqueda fallida
+
+    # Simular una fila cortada por una caída
+    with open(output_file, 'a') as f:
+        f.write("tt00000")
+
+    with BufferedCsvWriter(str(output_file), HEADER) as writer:
+        assert writer.completed_ids == {"tt0000001", "tt0000002"}
+        assert writer.is_completed("tt0000001")
+        assert not writer.is_completed("tt0000003")
+        # Las filas sin valor se vuelven a intentar
+        assert not writer.is_completed("tt0000004")
+        writer.write(["tt0000003", 0])
+
+    result = pd.read_csv(output_file)
+    assert list(result['IMDb ID']) == [
+        "tt0000001", "tt0000002", "tt0000004", "tt0000003"
+    ]
@@ -0,0 +1,116 @@
+import json
+import pytest
+
+moto = pytest.importorskip("moto")
+boto3 = pytest.importorskip("boto3")
+
+from src.scrapers.utils.s3_checkpointer import S3Checkpointer
+
+
+BUCKET = "test-bucket"
+PREFIX = "checkpoints/counts.csv"
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    """Fixture que proporciona un S3 local simulado con moto."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def test_checkpoint_uploads_only_new_rows(tmp_path, s3_client):
+    """Test que cada checkpoint sube solo las filas nuevas."""
+    local_file = tmp_path / "counts.csv"
+    local_file.write_text("IMDb ID,Number of Reviews\ntt0000001,3\n")
+
+    checkpointer = S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client)
+    assert checkpointer.checkpoint(str(local_file))
+    # Sin cambios no se sube nada
+    assert not checkpointer.checkpoint(str(local_file))
+
+    # Una fila incompleta espera al siguiente checkpoint
+    with open(local_file, "a") as f:
+        f.write("tt0000002,5\ntt00000")
+    assert checkpointer.checkpoint(str(local_file))
+
+    parts = s3_client.list_objects_v2(
+        Bucket=BUCKET, Prefix=f"{PREFIX}/part-"
+    )["Contents"]
+    assert len(parts) == 2
+    second = s3_client.get_object(Bucket=BUCKET, Key=f"{PREFIX}/part-000001")
+    assert second["Body"].read() == b"tt0000002,5\n"
+
+    manifest = json.loads(s3_client.get_object(
+        Bucket=BUCKET, Key=f"{PREFIX}/manifest.json"
+    )["Body"].read())
+    assert [part["offset"] for part in manifest["parts"]] == [0, 38]
+    assert manifest["size"] == 50
+
+
+def test_resume_and_restore(tmp_path, s3_client):
+    """Test que un nuevo proceso continúa el checkpoint y lo restaura."""
+    local_file = tmp_path / "counts.csv"
+    local_file.write_text("IMDb ID,Number of Reviews\ntt0000001,3\n")
+    S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client).checkpoint(
+        str(local_file)
+    )
+
+    with open(local_file, "a") as f:
+        f.write("tt0000002,5\n")
+    resumed = S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client)
+    assert resumed.uploaded_bytes == 38
+    assert resumed.checkpoint(str(local_file))
+
+    restored = tmp_path / "restored.csv"
+    S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client).restore(
+        str(restored)
+    )
+    assert restored.read_bytes() == local_file.read_bytes()
+
+
+def test_new_series_keeps_old_parts(tmp_path, s3_client):
+    """Test que una serie nueva no sobrescribe las partes anteriores."""
+    local_file = tmp_path / "counts.csv"
+    original = b"IMDb ID,Number of Reviews\ntt0000001,3\ntt0000002,5\n"
+    local_file.write_bytes(original)
+    S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client).checkpoint(
+        str(local_file)
+    )
+
+    # Un archivo local más corto (sin restaurar) empieza otra serie
+    local_file.write_text("IMDb ID,Number of Reviews\ntt0000009,1\n")
+    checkpointer = S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client)
+    put_object = s3_client.put_object
+    uploaded = []
+
+    def crash_before_manifest(**kwargs):
+        if kwargs["Key"].endswith("manifest.json"):
+            raise RuntimeError("crash")
+        uploaded.append(kwargs["Key"])
+        return put_object(**kwargs)
+
+    s3_client.put_object = crash_before_manifest
+    with pytest.raises(RuntimeError):
+        checkpointer.checkpoint(str(local_file))
+    s3_client.put_object = put_object
+    assert uploaded == [f"{PREFIX}/series-0001/part-000000"]
+
+    # El manifiesto anterior sigue apuntando a partes intactas
+    restored = tmp_path / "restored.csv"
+    S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client).restore(
+        str(restored)
+    )
+    assert restored.read_bytes() == original
+
+    assert S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client).checkpoint(
+        str(local_file)
+    )
+    S3Checkpointer(BUCKET, PREFIX, s3_client=s3_client).restore(
+        str(restored)
+    )
+    assert restored.read_bytes() == local_file.read_bytes()
@@ -0,0 +1,78 @@
+"""Pruebas para el modelo de coste del scraping de reseñas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils.scrape_cost import (
+    load_review_counts,
+    estimate_page_cost,
+    plan_scrape,
+    balance_shards,
+    estimate_id_costs
+)
+
+
+def test_load_review_counts(tmp_path):
+    """Test de carga de la tabla de conteos de reseñas."""
+    counts_file = tmp_path / "unique_review_counts.csv"
+    pd.DataFrame({
+        'IMDb ID': ['tt0000001', 'tt0000002', 'tt0000001'],
+        'Number of Reviews': [12, None, 99]
+    }).to_csv(counts_file, index=False)
+    counts = load_review_counts(str(counts_file))
+    assert counts['tt0000001'] == 12
+    # Un conteo vacío (búsqueda fallida) es desconocido, no cero
+    assert np.isnan(counts['tt0000002'])
+    assert len(counts) == 2
+
+
+def test_estimate_page_cost():
+    """Test del número de páginas esperado por título."""
+    cost = estimate_page_cost([0, 1, 25, 26, 60, np.nan])
+    assert list(cost[:5]) == [0, 1, 1, 2, 3]
+    assert np.isnan(cost[5])
+
+
+def test_plan_scrape_orders():
+    """Test de los distintos órdenes de la cola."""
+    movie_list = pd.DataFrame({
+        'imdb_id': ['tt1', 'tt2', 'tt3', 'tt4', 'tt5']
+    })
+    counts = pd.Series([100, 0, 5, 100], index=['tt1', 'tt2', 'tt3', 'tt4'])
+
+    def ids(order):
+        return list(plan_scrape(movie_list, counts, order)['imdb_id'])
+
+    assert ids("input") == ['tt1', 'tt3', 'tt4', 'tt5']
+    assert ids("cheapest") == ['tt3', 'tt1', 'tt4', 'tt5']
+    assert ids("costliest") == ['tt1', 'tt4', 'tt3', 'tt5']
+    assert list(plan_scrape(movie_list, counts, min_reviews=50)['imdb_id']) \
+        == ['tt1', 'tt4', 'tt5']
+    with pytest.raises(ValueError):
+        plan_scrape(movie_list, counts, "random")
+
+
+def test_balance_shards():
+    """Test del reparto LPT con cargas equilibradas y deterministas."""
+    costs = [7, 5, 4, 3, 3, 2]
+    assignments = balance_shards(costs, 2)
+    loads = np.bincount(assignments, weights=costs, minlength=2)
+    assert list(loads) == [12, 12]
+    assert list(balance_shards(costs, 2)) == list(assignments)
+    assert list(balance_shards([1, 1], 4)) == [0, 1]
+    with pytest.raises(ValueError):
+        balance_shards(costs, 0)
+
+
+def test_estimate_id_costs_unknown():
+    """Test que los IDs desconocidos cuestan la media de toda la tabla."""
+    counts = pd.Series([250.0, 125.0, np.nan, 0.0],
+                       index=['tt1', 'tt2', 'tt3', 'tt4'])
+    # Conocidos: 10, 5 y 1 páginas (mínimo una); media 16 / 3
+    costs = estimate_id_costs(['tt1', 'tt3', 'tt5'], counts)
+    assert list(costs[:1]) == [10]
+    assert costs[1] == costs[2] == pytest.approx(16 / 3)
+    # Por bloques, el mismo valor aunque el bloque no tenga conocidos
+    assert list(estimate_id_costs(['tt5'], counts)) == [costs[2]]
+    assert list(estimate_id_costs(['tt5'], counts, 2.5)) == [2.5]
+    assert list(estimate_id_costs(['tt5'], counts[['tt3']])) == [1]
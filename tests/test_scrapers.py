@@ -1,7 +1,10 @@
+import time
+import threading
 import pytest
 import pandas as pd
 from pathlib import Path
 from src.data.imdb_dataset import IMDbDataset
+from src.scrapers import numberReviews
 from src.scrapers.numberReviews import get_reviews_count, scrape_review
 
 
@@ -47,6 +50,8 @@ def test_get_reviews_count():
     # En un entorno real, deberíamos mockear las llamadas a la API
     imdb_id = "tt0111161"  # The Shawshank Redemption
     count = get_reviews_count(imdb_id)
+    if count is None:
+        pytest.skip("Sin acceso a IMDb")
     
     # Verificar que el resultado es un número
     assert isinstance(count, int)
@@ -76,4 +81,155 @@ def test_error_handling(tmp_path):
     
     # Test para get_reviews_count con ID inválido
     invalid_count = get_reviews_count("invalid_id")
-    assert invalid_count == 0  # Debería retornar 0 para IDs inválidos 
\ No newline at end of file
+    assert invalid_count is None  # Un fallo no se confunde con 0 reseñas
+
+
+def test_scrape_reviews_bounded_window(tmp_path, monkeypatch):
+    """Test que scrape_reviews mantiene una ventana acotada de tareas."""
+    input_file = tmp_path / "ids.tsv"
+    pd.DataFrame({
+        'tconst': [f"tt{i:07d}" for i in range(60)],
+        'primaryTitle': [f"Movie {i}" for i in range(60)]
+    }).to_csv(input_file, sep='\t', index=False)
+    output_file = tmp_path / "counts.csv"
+
+    lock = threading.Lock()
+    state = {'read': 0, 'done': 0, 'running': 0, 'max_running': 0,
+             'max_window': 0}
+
+    def fake_count(imdb_id, pool=None):
+        with lock:
+            state['running'] += 1
+            state['max_running'] = max(
+                state['max_running'], state['running']
+            )
+        time.sleep(0.02)
+        with lock:
+            state['running'] -= 1
+            state['done'] += 1
+        return int(imdb_id[2:])
+
+    original_reader = numberReviews.read_imdb_ids
+
+    def counting_reader(*args, **kwargs):
+        for imdb_id in original_reader(*args, **kwargs):
+            with lock:
+                state['read'] += 1
+                state['max_window'] = max(
+                    state['max_window'], state['read'] - state['done']
+                )
+            yield imdb_id
+
+    monkeypatch.setattr(numberReviews, "get_reviews_count", fake_count)
+    monkeypatch.setattr(numberReviews, "read_imdb_ids", counting_reader)
+    monkeypatch.chdir(tmp_path)
+
+    start = time.monotonic()
+    numberReviews.scrape_reviews(
+        str(input_file), str(output_file), max_workers=4,
+        requests_per_second=1000, chunksize=7
+    )
+    elapsed = time.monotonic() - start
+
+    result = pd.read_csv(output_file)
+    assert len(result) == 60
+    assert sorted(result['Number of Reviews']) == list(range(60))
+    # Los workers trabajan en paralelo y la ventana no supera 2 * workers
+    assert 1 < state['max_running'] <= 4
+    assert state['max_window'] <= 2 * 4 + 1
+    assert elapsed < 60 * 0.02
+
+    # Al reiniciar se omiten los IDs que ya están en el archivo de salida
+    state['done'] = 0
+    numberReviews.scrape_reviews(
+        str(input_file), str(output_file), max_workers=4,
+        requests_per_second=1000
+    )
+    assert state['done'] == 0
+    assert len(pd.read_csv(output_file)) == 60
+
+
+def test_scrape_reviews_rate_scales_with_workers(tmp_path, monkeypatch):
+    """Test que el ritmo por defecto crece con el número de workers."""
+    input_file = tmp_path / "ids.tsv"
+    pd.DataFrame({'tconst': ['tt0000001']}).to_csv(
+        input_file, sep='\t', index=False
+    )
+    rates = []
+    token_bucket = numberReviews.TokenBucket
+
+    def recording_bucket(rate, capacity=1):
+        rates.append(rate)
+        return token_bucket(1000, capacity=capacity)
+
+    monkeypatch.setattr(numberReviews, "TokenBucket", recording_bucket)
+    monkeypatch.setattr(
+        numberReviews, "get_reviews_count", lambda imdb_id, pool=None: 1
+    )
+    monkeypatch.chdir(tmp_path)
+    for max_workers in (1, 4):
+        numberReviews.scrape_reviews(
+            str(input_file), f"counts_{max_workers}.csv",
+            max_workers=max_workers
+        )
+    assert rates == [
+        numberReviews.REQUESTS_PER_SECOND_PER_WORKER,
+        4 * numberReviews.REQUESTS_PER_SECOND_PER_WORKER
+    ]
+
+
+def test_scrape_reviews_restores_s3_checkpoint(tmp_path, monkeypatch):
+    """Test que un host nuevo restaura el checkpoint de S3 y continúa."""
+    moto = pytest.importorskip("moto")
+    boto3 = pytest.importorskip("boto3")
+    from src.scrapers.utils.s3_checkpointer import S3Checkpointer
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.chdir(tmp_path)
+    with moto.mock_aws():
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="bucket")
+        pd.DataFrame({'tconst': ['tt0000001', 'tt0000002', 'tt0000003']}) \
+            .to_csv("ids.tsv", sep='\t', index=False)
+        s3_client.upload_file("ids.tsv", "bucket", "input/ids.tsv")
+
+        # Progreso de un host anterior, solo en S3
+        previous = tmp_path / "previous.csv"
+        previous.write_text(
+            "IMDb ID,Number of Reviews\ntt0000001,4\ntt0000002,0\n"
+        )
+        S3Checkpointer(
+            "bucket", "checkpoints/output/counts.csv", s3_client=s3_client
+        ).checkpoint(str(previous))
+
+        scraped = []
+
+        def fake_count(imdb_id, pool=None):
+            scraped.append(imdb_id)
+            return 7
+
+        monkeypatch.setattr(numberReviews, "get_s3_client", lambda: s3_client)
+        monkeypatch.setattr(numberReviews, "get_reviews_count", fake_count)
+        numberReviews.scrape_reviews(
+            "input/ids.tsv", "output/counts.csv", bucket_name="bucket",
+            max_workers=1, requests_per_second=1000
+        )
+
+        assert scraped == ['tt0000003']
+        result = pd.read_csv("output/counts.csv")
+        assert list(result['IMDb ID']) == [
+            'tt0000001', 'tt0000002', 'tt0000003'
+        ]
+        # La primera parte no se sobrescribe
+        first_part = s3_client.get_object(
+            Bucket="bucket", Key="checkpoints/output/counts.csv/part-000000"
+        )["Body"].read()
+        assert first_part == previous.read_bytes()
+        restored = tmp_path / "restored.csv"
+        S3Checkpointer(
+            "bucket", "checkpoints/output/counts.csv", s3_client=s3_client
+        ).restore(str(restored))
+        assert restored.read_bytes() == (tmp_path / "output/counts.csv") \
+            .read_bytes()
@@ -1,8 +1,12 @@
 import os
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 from src.analysis.sentiment.sentiment_analyzer import SentimentAnalyzer
+from src.analysis.sentiment.sentiment_pool import analyze_folder
+from src.data.columnar_store import ColumnarStore
 
 # Configuración de rutas de prueba
 TEST_ROOT = Path(__file__).parent
@@ -15,6 +19,57 @@ def analyzer():
     """Fixture que proporciona una instancia de SentimentAnalyzer."""
     return SentimentAnalyzer(device=-1)  # Usar CPU para pruebas
 
+EMOTION_LABELS = {0: "fear", 1: "joy", 2: "neutral"}
+
+
+def fake_classify(texts, top_k=1, **kwargs):
+    """Clasificador falso: 'fear' si la reseña contiene 'scary'."""
+    def predict(text):
+        score = 0.5 + min(len(text) / 200, 0.4)
+        label = "fear" if "scary" in text.lower() else "joy"
+        if top_k is not None:
+            return {"label": label, "score": score}
+        other = "joy" if label == "fear" else "fear"
+        return [
+            {"label": label, "score": score},
+            {"label": other, "score": (1 - score) * 0.75},
+            {"label": "neutral", "score": (1 - score) * 0.25}
+        ]
+    if isinstance(texts, str):
+        return predict(texts) if top_k is None else [predict(texts)]
+    return [predict(text) for text in texts]
+
+
+def fake_tokenize(texts, **kwargs):
+    """Tokenizador falso: un token por palabra."""
+    return {"input_ids": [text.split() for text in texts]}
+
+
+@pytest.fixture
+def mock_model():
+    """Fixture que simula el tokenizador y el modelo de emociones."""
+    module = "src.analysis.sentiment.sentiment_analyzer"
+    with patch(f"{module}.AutoTokenizer") as mock_tokenizer, \
+            patch(f"{module}.AutoModelForSequenceClassification") \
+            as mock_model_class, \
+            patch(f"{module}.pipeline") as mock_pipeline:
+        mock_tokenizer.from_pretrained.return_value = MagicMock(
+            side_effect=fake_tokenize
+        )
+        mock_model_class.from_pretrained.return_value.config.id2label = (
+            EMOTION_LABELS
+        )
+        mock_pipeline.side_effect = lambda *args, **kwargs: MagicMock(
+            side_effect=fake_classify
+        )
+        yield
+
+
+@pytest.fixture
+def mock_analyzer(mock_model):
+    """Fixture con un SentimentAnalyzer cuyo modelo está simulado."""
+    return SentimentAnalyzer(device=-1)
+
 @pytest.fixture
 def sample_reviews():
     """Fixture que proporciona datos de prueba para reseñas."""
@@ -111,4 +166,337 @@ def test_error_handling(analyzer, tmp_path):
     empty_dir.mkdir()
     result = analyzer.aggregate_results(empty_dir)
     assert isinstance(result, pd.DataFrame)
-    assert len(result) == 0 
\ No newline at end of file
+    assert len(result) == 0
+
+
+def test_analyze_file_batched(mock_analyzer, sample_reviews, tmp_path):
+    """Test del modo por lotes: mismo orden y esquema que el modo normal."""
+    test_file = tmp_path / "reviews_tt0000001.csv"
+    sample_reviews.to_csv(test_file, index=False)
+
+    single_path = mock_analyzer.analyze_file(test_file, tmp_path / "single")
+    batched_path = mock_analyzer.analyze_file(
+        test_file, tmp_path / "batched", batch_size=2
+    )
+
+    single = pd.read_csv(single_path)
+    batched = pd.read_csv(batched_path)
+    assert list(batched.columns) == ['Review', 'Emotion', 'Score']
+    pd.testing.assert_frame_equal(batched, single)
+    assert list(batched['Review']) == list(sample_reviews['Review'])
+
+    # Los lotes se agrupan por longitud en tokens
+    batch_calls = [
+        call.args[0] for call in mock_analyzer.emotion_classifier.call_args_list
+        if isinstance(call.args[0], list)
+    ]
+    assert [len(batch) for batch in batch_calls] == [2, 2, 1]
+    lengths = [len(text.split()) for batch in batch_calls for text in batch]
+    assert lengths == sorted(lengths)
+
+
+def test_analyze_folder(mock_model, sample_reviews, tmp_path):
+    """Test de analyze_folder procesando todos los archivos de la carpeta."""
+    review_dir = tmp_path / "reviews"
+    review_dir.mkdir()
+    for imdb_id in ["tt0000001", "tt0000002"]:
+        sample_reviews.to_csv(review_dir / f"reviews_{imdb_id}.csv",
+                              index=False)
+    # Un archivo defectuoso no debe detener el resto
+    pd.DataFrame({'Text': ["no review column"]}).to_csv(
+        review_dir / "reviews_tt0000003.csv", index=False
+    )
+
+    output_dir = tmp_path / "emotions"
+    outputs = analyze_folder(
+        review_dir, output_dir, num_workers=1, batch_size=2, device=-1
+    )
+
+    assert sorted(os.path.basename(path) for path in outputs) == [
+        "emotions_tt0000001.csv", "emotions_tt0000002.csv"
+    ]
+    # No quedan archivos temporales de la escritura atómica
+    assert not [f for f in os.listdir(output_dir) if f.endswith(".tmp")]
+
+
+def test_analyze_folder_incremental(mock_model, sample_reviews, tmp_path):
+    """Test que solo se vuelven a analizar los archivos nuevos o cambiados."""
+    review_dir = tmp_path / "reviews"
+    review_dir.mkdir()
+    for imdb_id in ["tt0000001", "tt0000002"]:
+        sample_reviews.to_csv(review_dir / f"reviews_{imdb_id}.csv",
+                              index=False)
+    output_dir = tmp_path / "emotions"
+
+    first = analyze_folder(review_dir, output_dir, num_workers=1)
+    assert len(first) == 2
+    assert analyze_folder(review_dir, output_dir, num_workers=1) == []
+
+    # Cambiar el contenido de un archivo y añadir uno nuevo
+    sample_reviews.head(2).to_csv(review_dir / "reviews_tt0000002.csv",
+                                  index=False)
+    sample_reviews.to_csv(review_dir / "reviews_tt0000003.csv", index=False)
+    # Tocar un archivo sin cambiar su contenido
+    os.utime(review_dir / "reviews_tt0000001.csv", ns=(0, 0))
+
+    rerun = analyze_folder(review_dir, output_dir, num_workers=1)
+    assert sorted(os.path.basename(path) for path in rerun) == [
+        "emotions_tt0000002.csv", "emotions_tt0000003.csv"
+    ]
+    assert len(analyze_folder(
+        review_dir, output_dir, num_workers=1, incremental=False
+    )) == 3
+
+
+def test_analyze_folder_incremental_config(mock_model, sample_reviews,
+                                           tmp_path):
+    """Test que un cambio de configuración vuelve a analizar los archivos."""
+    review_dir = tmp_path / "reviews"
+    review_dir.mkdir()
+    sample_reviews.to_csv(review_dir / "reviews_tt0000001.csv", index=False)
+    output_dir = tmp_path / "emotions"
+
+    assert len(analyze_folder(review_dir, output_dir, num_workers=1)) == 1
+    # full_distribution necesita el archivo de probabilidades
+    assert len(analyze_folder(
+        review_dir, output_dir, num_workers=1, full_distribution=True
+    )) == 1
+    assert (output_dir / "emotion_probs_tt0000001.npz").exists()
+    assert analyze_folder(
+        review_dir, output_dir, num_workers=1, full_distribution=True
+    ) == []
+    os.remove(output_dir / "emotion_probs_tt0000001.npz")
+    assert len(analyze_folder(
+        review_dir, output_dir, num_workers=1, full_distribution=True
+    )) == 1
+    # Otro max_length o modelo invalida las salidas anteriores
+    assert len(analyze_folder(
+        review_dir, output_dir, num_workers=1, full_distribution=True,
+        max_length=128
+    )) == 1
+    assert analyze_folder(
+        review_dir, output_dir, num_workers=1, full_distribution=True,
+        max_length=128
+    ) == []
+
+
+def test_aggregate_results_cache(tmp_path):
+    """Test de la agregación incremental con archivo de caché."""
+    test_dir = tmp_path / "emotions"
+    test_dir.mkdir()
+    cache_file = tmp_path / "aggregate_cache.pkl"
+    pd.DataFrame({
+        'Review': ["Scary movie!", "Very scary"],
+        'Emotion': ["fear", "fear"],
+        'Score': [0.9, 0.7]
+    }).to_csv(test_dir / "emotions_tt0000001.csv", index=False)
+    pd.DataFrame({
+        'Review': ["Not scary"], 'Emotion': ["neutral"], 'Score': [0.5]
+    }).to_csv(test_dir / "emotions_tt0000002.csv", index=False)
+
+    first = SentimentAnalyzer.aggregate_results(test_dir, cache_file)
+    assert len(first) == 3
+
+    # Reemplazar un archivo y eliminar otro
+    pd.DataFrame({
+        'Review': ["Scary"], 'Emotion': ["fear"], 'Score': [0.6]
+    }).to_csv(test_dir / "emotions_tt0000001.csv", index=False)
+    os.utime(test_dir / "emotions_tt0000001.csv", ns=(1, 1))
+    os.remove(test_dir / "emotions_tt0000002.csv")
+    pd.DataFrame({
+        'Review': ["Boo"], 'Emotion': ["fear"], 'Score': [0.8]
+    }).to_csv(test_dir / "emotions_tt0000003.csv", index=False)
+
+    cached = SentimentAnalyzer.aggregate_results(test_dir, cache_file)
+    fresh = SentimentAnalyzer.aggregate_results(test_dir)
+    pd.testing.assert_frame_equal(
+        cached.sort_values("imbd_id").reset_index(drop=True),
+        fresh.sort_values("imbd_id").reset_index(drop=True)
+    )
+    assert len(cached) == 2
+
+
+def test_aggregate_results_cache_columns(tmp_path):
+    """Test que la caché de agregación depende de las columnas pedidas."""
+    test_dir = tmp_path / "emotions"
+    test_dir.mkdir()
+    cache_file = tmp_path / "aggregate_cache.pkl"
+    pd.DataFrame({
+        'Review': ["Scary movie!"], 'Emotion': ["fear"], 'Score': [0.9]
+    }).to_csv(test_dir / "emotions_tt0000001.csv", index=False)
+
+    scores = SentimentAnalyzer.aggregate_results(
+        test_dir, cache_file, columns=["Score"]
+    )
+    assert sorted(scores.columns) == ["Score", "imbd_id"]
+
+    emotions = SentimentAnalyzer.aggregate_results(
+        test_dir, cache_file, columns=["Emotion", "Score"]
+    )
+    assert sorted(emotions.columns) == ["Emotion", "Score", "imbd_id"]
+    assert emotions.loc[0, "Emotion"] == "fear"
+
+    # Sin cambios, la misma petición reutiliza la caché
+    again = SentimentAnalyzer.aggregate_results(
+        test_dir, cache_file, columns=["Emotion", "Score"]
+    )
+    pd.testing.assert_frame_equal(again, emotions)
+
+
+def test_analyze_file_with_cache(mock_model, sample_reviews, tmp_path):
+    """Test que las reseñas en caché no vuelven a pasar por el modelo."""
+    test_file = tmp_path / "reviews_tt0000001.csv"
+    sample_reviews.to_csv(test_file, index=False)
+    analyzer = SentimentAnalyzer(
+        device=-1, cache_path=str(tmp_path / "emotions.db")
+    )
+
+    first = pd.read_csv(analyzer.analyze_file(test_file, tmp_path / "a"))
+    calls = analyzer.emotion_classifier.call_count
+    second = pd.read_csv(analyzer.analyze_file(test_file, tmp_path / "b"))
+
+    assert calls == len(sample_reviews)
+    assert analyzer.emotion_classifier.call_count == calls
+    pd.testing.assert_frame_equal(first, second)
+    assert analyzer.cache.stats()["hits"] == len(sample_reviews)
+
+
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_analyze_file_full_distribution(mock_model, sample_reviews, tmp_path,
+                                        batch_size):
+    """Test que se guardan las probabilidades de todas las emociones."""
+    test_file = tmp_path / "reviews_tt0000001.csv"
+    sample_reviews.to_csv(test_file, index=False)
+    analyzer = SentimentAnalyzer(device=-1, full_distribution=True)
+
+    output_path = analyzer.analyze_file(
+        test_file, tmp_path, batch_size=batch_size
+    )
+    emotions = pd.read_csv(output_path)
+    probs, labels = SentimentAnalyzer.load_distribution(
+        tmp_path / "emotion_probs_tt0000001.npz"
+    )
+
+    assert list(emotions.columns) == ['Review', 'Emotion', 'Score']
+    assert labels == ["fear", "joy", "neutral"]
+    assert probs.dtype == np.float32
+    assert probs.shape == (len(sample_reviews), 3)
+    np.testing.assert_allclose(probs.sum(axis=1), 1.0, rtol=1e-6)
+    assert [labels[i] for i in probs.argmax(axis=1)] == list(
+        emotions['Emotion']
+    )
+
+
+def test_rank_movies_by_distribution(mock_model, sample_reviews, tmp_path):
+    """Test del ranking por la distribución completa de emociones."""
+    analyzer = SentimentAnalyzer(device=-1, full_distribution=True)
+    review_dir = tmp_path / "reviews"
+    review_dir.mkdir()
+    sample_reviews.to_csv(review_dir / "reviews_tt0000001.csv", index=False)
+    pd.DataFrame({'Review': ["So scary!", "Scary scary"]}).to_csv(
+        review_dir / "reviews_tt0000002.csv", index=False
+    )
+    for file_name in os.listdir(review_dir):
+        analyzer.analyze_file(review_dir / file_name, tmp_path / "emotions")
+
+    distribution = SentimentAnalyzer.aggregate_distributions(
+        tmp_path / "emotions"
+    )
+    fear = SentimentAnalyzer.rank_movies_by_distribution(distribution, "fear")
+    joy = SentimentAnalyzer.rank_movies_by_distribution(distribution, "joy")
+
+    assert list(distribution['Review_Count']) == [5, 2]
+    assert list(fear['imbd_id']) == ["tt0000002", "tt0000001"]
+    assert list(joy['imbd_id']) == ["tt0000001", "tt0000002"]
+
+
+def test_analyze_store(mock_analyzer, sample_reviews, tmp_path):
+    """Test del análisis de reseñas guardadas en un ColumnarStore."""
+    pytest.importorskip("pyarrow")
+    review_store = ColumnarStore(tmp_path / "reviews")
+    review_store.append("tt0000001", sample_reviews)
+    review_store.append("tt0000002", sample_reviews.head(2))
+    emotion_store = ColumnarStore(tmp_path / "emotions")
+
+    assert mock_analyzer.analyze_store(review_store, emotion_store) == 2
+    assert mock_analyzer.analyze_store(review_store, emotion_store) == 0
+
+    combined = SentimentAnalyzer.aggregate_results(
+        emotion_store, columns=["Emotion", "Score"]
+    )
+    assert list(combined.columns) == ["imbd_id", "Emotion", "Score"]
+    assert len(combined) == 7
+    ranking = SentimentAnalyzer.rank_movies(combined, emotion_label="joy")
+    assert set(ranking['imbd_id']) == {"tt0000001", "tt0000002"}
+
+    stats = SentimentAnalyzer.aggregate_statistics(emotion_store)
+    pd.testing.assert_frame_equal(
+        SentimentAnalyzer.rank_movies(stats, emotion_label="joy"),
+        ranking
+    )
+
+    only_one = SentimentAnalyzer.aggregate_results(
+        emotion_store, imdb_ids=["tt0000002"]
+    )
+    assert list(only_one['Review']) == list(sample_reviews.head(2)['Review'])
+
+
+def test_analyze_store_whole_movies(mock_analyzer, sample_reviews,
+                                    tmp_path):
+    """Test que una película repartida en varios archivos se analiza entera."""
+    pytest.importorskip("pyarrow")
+    review_store = ColumnarStore(tmp_path / "reviews", flush_rows=2)
+    review_store.append("tt0000001", sample_reviews.head(3))
+    review_store.append("tt0000002", sample_reviews.head(1))
+    review_store.append("tt0000001", sample_reviews.tail(2))
+    emotion_store = ColumnarStore(tmp_path / "emotions")
+
+    assert mock_analyzer.analyze_store(
+        review_store, emotion_store, movies_per_read=1
+    ) == 2
+    counts = emotion_store.count_by_id().set_index("imdb_id")["count"]
+    assert counts.to_dict() == {"tt0000001": 5, "tt0000002": 1}
+
+
+def test_aggregate_statistics_matches_ranking(tmp_path):
+    """Test que la agregación en streaming produce el mismo ranking."""
+    test_dir = tmp_path / "emotions"
+    test_dir.mkdir()
+    rng = np.random.default_rng(0)
+    for i in range(20):
+        size = int(rng.integers(1, 30))
+        pd.DataFrame({
+            'Review': [f"review {j}" for j in range(size)],
+            'Emotion': rng.choice(["fear", "joy", "neutral"], size),
+            'Score': rng.random(size)
+        }).to_csv(test_dir / f"emotions_tt{i:07d}.csv", index=False)
+
+    combined = SentimentAnalyzer.aggregate_results(test_dir)
+    stats = SentimentAnalyzer.aggregate_statistics(
+        test_dir, cache_file=tmp_path / "stats.pkl"
+    )
+
+    assert list(stats.columns) == [
+        "imbd_id", "Emotion", "Count", "Sum", "SumSq"
+    ]
+    assert stats["Count"].sum() == len(combined)
+    for emotion in ["fear", "joy", "neutral"]:
+        pd.testing.assert_frame_equal(
+            SentimentAnalyzer.rank_movies(stats, emotion),
+            SentimentAnalyzer.rank_movies(combined, emotion)
+        )
+
+    # Con caché solo se relee el archivo modificado
+    pd.DataFrame({
+        'Review': ["Boo"], 'Emotion': ["fear"], 'Score': [1.0]
+    }).to_csv(test_dir / "emotions_tt0000000.csv", index=False)
+    os.utime(test_dir / "emotions_tt0000000.csv", ns=(1, 1))
+    cached = SentimentAnalyzer.aggregate_statistics(
+        test_dir, cache_file=tmp_path / "stats.pkl"
+    )
+    pd.testing.assert_frame_equal(
+        SentimentAnalyzer.rank_movies(cached, "fear"),
+        SentimentAnalyzer.rank_movies(
+            SentimentAnalyzer.aggregate_results(test_dir), "fear"
+        )
+    )